@@ -6,6 +6,7 @@ import { ICompletionProviderManager } from '@jupyterlab/completer';
 import { INotebookTracker } from '@jupyterlab/notebook';
 
 import { CustomCompleterProvider } from './customconnector';
+import { ServerCompleterProvider } from './serverconnector';
 
 /**
  * Initialization data for the extension.
@@ -21,6 +22,8 @@ const extension: JupyterFrontEndPlugin<void> = {
     notebooks: INotebookTracker
   ) => {
     completionManager.registerProvider(new CustomCompleterProvider());
+    // Requires the server extension example
+    completionManager.registerProvider(new ServerCompleterProvider());
 
     console.log('JupyterLab custom completer extension is activated!');
   }
@@ -0,0 +1,106 @@
+// Copyright (c) Jupyter Development Team.
+// Distributed under the terms of the Modified BSD License.
+
+import { URLExt } from '@jupyterlab/coreutils';
+import {
+  CompletionHandler,
+  ICompletionContext,
+  ICompletionProvider
+} from '@jupyterlab/completer';
+import { ServerConnection } from '@jupyterlab/services';
+
+/**
+ * A completion provider querying the symbol index of the server extension.
+ *
+ * Only the latest request is useful: a request still running when the user
+ * types another character is aborted.
+ */
+export class ServerCompleterProvider implements ICompletionProvider {
+  /**
+   * The server completion provider is applicable on all cases.
+   * @param context - additional information about context of completion request
+   */
+  async isApplicable(context: ICompletionContext): Promise<boolean> {
+    return true;
+  }
+
+  /**
+   * Fetch completion requests.
+   *
+   * @param request - The completion request text and details.
+   * @returns Completion reply
+   */
+  async fetch(
+    request: CompletionHandler.IRequest,
+    context: ICompletionContext
+  ): Promise<CompletionHandler.ICompletionItemsReply> {
+    const editor = context.editor;
+    if (!editor) {
+      return Promise.reject('No editor');
+    }
+
+    const token = editor.getTokenAtCursor();
+    const reply: CompletionHandler.ICompletionItemsReply = {
+      start: token.offset,
+      end: token.offset + token.value.length,
+      items: []
+    };
+
+    // Supersede the request in flight, if any
+    this._controller?.abort();
+    const controller = new AbortController();
+    this._controller = controller;
+
+    if (!/^\w+$/.test(token.value)) {
+      return reply;
+    }
+
+    const settings = ServerConnection.makeSettings();
+    const url =
+      URLExt.join(settings.baseUrl, 'jupyterlab-examples-server', 'complete') +
+      URLExt.objectToQueryString({ prefix: token.value, limit: this.limit });
+    try {
+      const response = await ServerConnection.makeRequest(
+        url,
+        { signal: controller.signal },
+        settings
+      );
+      if (response.ok) {
+        const data: Private.ICompletionReply = await response.json();
+        reply.items = data.matches.map(match => ({ label: match.label }));
+      }
+    } catch (error) {
+      // Aborted requests are superseded by a newer one
+      if (!controller.signal.aborted) {
+        throw error;
+      }
+    } finally {
+      if (this._controller === controller) {
+        this._controller = null;
+      }
+    }
+    return reply;
+  }
+
+  /**
+   * Maximal number of completions; at most 50.
+   */
+  limit = 20;
+
+  readonly identifier = 'CompletionProvider:server';
+  readonly renderer = null;
+
+  private _controller: AbortController | null = null;
+}
+
+/**
+ * A namespace for Private functionality.
+ */
+namespace Private {
+  /**
+   * The reply of the completion end point.
+   */
+  export interface ICompletionReply {
+    matches: { label: string; count: number }[];
+  }
+}
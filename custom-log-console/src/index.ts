@@ -21,6 +21,7 @@ import { IRenderMimeRegistry } from '@jupyterlab/rendermime';
 import { addIcon, clearIcon, listIcon } from '@jupyterlab/ui-components';
 
 import { LogLevelSwitcher } from './logLevelSwitcher';
+import { ServerLogFeed } from './serverlog';
 
 const extension: JupyterFrontEndPlugin<void> = {
   id: '@jupyterlab-examples/custom-log-console:plugin',
@@ -37,6 +38,7 @@ const extension: JupyterFrontEndPlugin<void> = {
 
     let logConsolePanel: LogConsolePanel | null = null;
     let logConsoleWidget: MainAreaWidget<LogConsolePanel> | null = null;
+    let serverLogFeed: ServerLogFeed | null = null;
 
     const tracker = new WidgetTracker<MainAreaWidget<LogConsolePanel>>({
       namespace: 'example-custom-log-console'
@@ -105,7 +107,15 @@ const extension: JupyterFrontEndPlugin<void> = {
         new LogLevelSwitcher(logConsoleWidget.content)
       );
 
+      // Display the entries kept by the server extension example
+      serverLogFeed = new ServerLogFeed(
+        'custom-log-console',
+        logConsolePanel.logger!
+      );
+
       logConsoleWidget.disposed.connect(() => {
+        serverLogFeed?.dispose();
+        serverLogFeed = null;
         logConsoleWidget = null;
         logConsolePanel = null;
         commands.notifyCommandChanged();
@@ -184,6 +194,20 @@ const extension: JupyterFrontEndPlugin<void> = {
         logConsolePanel?.logger?.log(msg);
       }
     });
+
+    commands.addCommand('jlab-examples/custom-log-console:logServerMessage', {
+      label: 'Server Log Message',
+      caption: 'Custom log message kept by the server extension example.',
+      execute: async () => {
+        const msg: ITextLog = {
+          type: 'text',
+          level: 'info',
+          data: `Hello world server!! ${new Date().toISOString()}`
+        };
+
+        await serverLogFeed?.log(msg);
+      }
+    });
   }
 };
 
@@ -0,0 +1,147 @@
+import { URLExt } from '@jupyterlab/coreutils';
+import { ILogger, ILogPayload, IStateChange } from '@jupyterlab/logconsole';
+import { ServerConnection } from '@jupyterlab/services';
+import { IDisposable } from '@lumino/disposable';
+
+/**
+ * Feeds a logger with the entries of a log namespace of the server extension.
+ *
+ * The latest entries are loaded first, then the new ones are requested with
+ * long polling. The server only sends the entries at or above the level of
+ * the logger, and keeps a bounded number of entries per namespace.
+ */
+export class ServerLogFeed implements IDisposable {
+  /**
+   * Construct a new server log feed.
+   *
+   * @param namespace Log namespace on the server
+   * @param logger Logger displaying the entries
+   */
+  constructor(namespace: string, logger: ILogger) {
+    this._namespace = namespace;
+    this._logger = logger;
+    logger.stateChanged.connect(this._onStateChanged, this);
+    void this._follow();
+  }
+
+  get isDisposed(): boolean {
+    return this._isDisposed;
+  }
+
+  dispose(): void {
+    if (this._isDisposed) {
+      return;
+    }
+    this._isDisposed = true;
+    this._controller?.abort();
+    this._logger.stateChanged.disconnect(this._onStateChanged, this);
+  }
+
+  /**
+   * Add an entry to the server log; it is displayed once received back.
+   */
+  async log(payload: ILogPayload): Promise<void> {
+    await Private.request(this._namespace, '', {
+      method: 'POST',
+      body: JSON.stringify(payload)
+    });
+  }
+
+  private _onStateChanged(sender: ILogger, change: IStateChange): void {
+    if (change.name === 'level') {
+      // Keep the entries received so far, and poll again from the same cursor
+      // for the entries of the new level
+      void this._follow();
+    }
+  }
+
+  private async _follow(): Promise<void> {
+    this._controller?.abort();
+    const controller = new AbortController();
+    this._controller = controller;
+    const level =
+      this._logger.level === 'metadata' ? 'debug' : this._logger.level;
+
+    while (!controller.signal.aborted) {
+      const parameters: Record<string, string> = { level, limit: '1000' };
+      if (this._cursor !== null) {
+        parameters.after = this._cursor.toString();
+        parameters.timeout = '30';
+      }
+      try {
+        const page: Private.IPage = await Private.request(
+          this._namespace,
+          URLExt.objectToQueryString(parameters),
+          { signal: controller.signal }
+        );
+        if (controller.signal.aborted) {
+          return;
+        }
+        page.entries.forEach(entry => {
+          this._logger.log(entry as ILogPayload);
+        });
+        this._cursor = page.cursor;
+      } catch (error) {
+        if (controller.signal.aborted) {
+          return;
+        }
+        console.error(
+          `Failed to read the server log ${this._namespace}`,
+          error
+        );
+        await new Promise(resolve => setTimeout(resolve, 5000));
+      }
+    }
+  }
+
+  private _namespace: string;
+  private _logger: ILogger;
+  // Server cursor of the latest entry received, null before the first page
+  private _cursor: number | null = null;
+  private _controller: AbortController | null = null;
+  private _isDisposed = false;
+}
+
+/**
+ * A namespace for private data.
+ */
+namespace Private {
+  /**
+   * A page of log entries.
+   */
+  export interface IPage {
+    entries: (ILogPayload & { cursor: number; time: number })[];
+    cursor: number;
+  }
+
+  /**
+   * Call the log end point of the server extension.
+   */
+  export async function request(
+    namespace: string,
+    query: string,
+    init: RequestInit
+  ): Promise<any> {
+    const settings = ServerConnection.makeSettings();
+    const requestUrl =
+      URLExt.join(
+        settings.baseUrl,
+        'jupyterlab-examples-server',
+        'logs',
+        encodeURIComponent(namespace)
+      ) + query;
+
+    let response: Response;
+    try {
+      response = await ServerConnection.makeRequest(requestUrl, init, settings);
+    } catch (error) {
+      throw new ServerConnection.NetworkError(error as any);
+    }
+
+    const data = await response.json();
+    if (!response.ok) {
+      throw new ServerConnection.ResponseError(response, data.message);
+    }
+    return data;
+  }
+}
@@ -3,7 +3,7 @@ import {
   JupyterFrontEndPlugin
 } from '@jupyterlab/application';
 
-import { ICommandPalette } from '@jupyterlab/apputils';
+import { ICommandPalette, InputDialog } from '@jupyterlab/apputils';
 
 import {
   ITranslator,
@@ -15,6 +15,8 @@ import { DataGrid, DataModel } from '@lumino/datagrid';
 
 import { StackedPanel } from '@lumino/widgets';
 
+import { TileDataModel } from './model';
+
 /**
  * Initialization data for the extension1 extension.
  */
@@ -42,13 +44,39 @@ const extension: JupyterFrontEndPlugin<void> = {
       }
     });
     palette.addItem({ command, category: 'Extension Examples' });
+
+    const datasetCommand = 'examples:datagrid-dataset';
+    commands.addCommand(datasetCommand, {
+      label: trans.__('Open a Dataset in a Datagrid'),
+      caption: trans.__('Open a CSV or Parquet file from the server'),
+      execute: async args => {
+        let path = args.path as string | undefined;
+        if (!path) {
+          const result = await InputDialog.getText({
+            title: trans.__('Dataset path, relative to the server root')
+          });
+          if (!result.button.accept || !result.value) {
+            return;
+          }
+          path = result.value;
+        }
+        const widget = new DataGridPanel(translator, new TileDataModel(path));
+        widget.id = `datagrid-example-${path}`;
+        widget.title.label = path;
+        shell.add(widget, 'main');
+      }
+    });
+    palette.addItem({
+      command: datasetCommand,
+      category: 'Extension Examples'
+    });
   }
 };
 
 export default extension;
 
 class DataGridPanel extends StackedPanel {
-  constructor(translator?: ITranslator) {
+  constructor(translator?: ITranslator, model?: DataModel) {
     super();
     this._translator = translator || nullTranslator;
     this._trans = this._translator.load('jupyterlab');
@@ -58,9 +86,8 @@ class DataGridPanel extends StackedPanel {
     this.title.label = this._trans.__('Datagrid Example View');
     this.title.closable = true;
 
-    const model = new LargeDataModel();
     const grid = new DataGrid();
-    grid.dataModel = model;
+    grid.dataModel = model ?? new LargeDataModel();
 
     this.addWidget(grid);
   }
@@ -0,0 +1,428 @@
+import { URLExt } from '@jupyterlab/coreutils';
+
+import { ServerConnection } from '@jupyterlab/services';
+
+import { DataModel } from '@lumino/datagrid';
+
+/**
+ * A data model reading a CSV or Parquet file on the server by tiles.
+ *
+ * Only the tiles being displayed, and their neighbours, are requested. They
+ * are kept in a least recently used cache of bounded size, so scrolling
+ * through a large file uses a constant amount of memory.
+ *
+ * The tiles are transferred in a binary format where numeric columns are
+ * typed arrays, read by the grid without being parsed.
+ */
+export class TileDataModel extends DataModel {
+  /**
+   * Construct a new tile data model.
+   *
+   * @param path Path of the dataset, relative to the server root directory
+   * @param options Size of the tiles and of the cache
+   */
+  constructor(path: string, options: TileDataModel.IOptions = {}) {
+    super();
+    this._path = path;
+    this._tileRows = options.tileRows ?? 100;
+    this._tileColumns = options.tileColumns ?? 20;
+    this._maxTiles = options.maxTiles ?? 64;
+    this._ready = this._fetchInfo();
+  }
+
+  /**
+   * A promise resolved once the columns and the number of rows are known.
+   */
+  get ready(): Promise<void> {
+    return this._ready;
+  }
+
+  /**
+   * Display a sorted and filtered view of the dataset.
+   *
+   * The view is computed by the server, which only sends the tiles of it that
+   * are displayed.
+   */
+  setView(view: TileDataModel.IView): void {
+    this._view = view;
+    this._tiles.clear();
+    this._lastKey = '';
+    // Ignore the tiles of the previous view still being fetched
+    this._pending = new Set<string>();
+    this._ready = this._fetchInfo();
+  }
+
+  rowCount(region: DataModel.RowRegion): number {
+    return region === 'body' ? this._rowCount : 1;
+  }
+
+  columnCount(region: DataModel.ColumnRegion): number {
+    return region === 'body' ? this._columns.length : 1;
+  }
+
+  data(region: DataModel.CellRegion, row: number, column: number): any {
+    if (region === 'row-header') {
+      return row;
+    }
+    if (region === 'column-header') {
+      return this._columns[column];
+    }
+    if (region === 'corner-header') {
+      return '';
+    }
+
+    const tileRow = Math.floor(row / this._tileRows);
+    const tileColumn = Math.floor(column / this._tileColumns);
+    const key = Private.tileKey(tileRow, tileColumn);
+    const tile = this._tiles.get(key);
+    if (tile === undefined) {
+      // Request the missing tile and the ones the user is likely to scroll to
+      this._fetchTile(tileRow, tileColumn);
+      this._fetchTile(tileRow + 1, tileColumn);
+      this._fetchTile(tileRow - 1, tileColumn);
+      this._fetchTile(tileRow, tileColumn + 1);
+      this._fetchTile(tileRow, tileColumn - 1);
+      return '';
+    }
+    if (this._lastKey !== key) {
+      // Mark the tile as the most recently used one
+      this._tiles.delete(key);
+      this._tiles.set(key, tile);
+      this._lastKey = key;
+    }
+    const value =
+      tile[column - tileColumn * this._tileColumns][
+        row - tileRow * this._tileRows
+      ];
+    // Missing numbers are NaN
+    return Number.isNaN(value) ? '' : value;
+  }
+
+  private async _fetchInfo(): Promise<void> {
+    const pending = this._pending;
+    const info = await Private.request<Private.IDatasetInfo>(
+      'dataset',
+      this._parameters()
+    );
+    if (pending !== this._pending) {
+      // The view changed in the meantime
+      return;
+    }
+    this._columns = info.columns;
+    this._rowCount = info.rows;
+    this.emitChanged({ type: 'model-reset' });
+  }
+
+  private _fetchTile(tileRow: number, tileColumn: number): void {
+    const row = tileRow * this._tileRows;
+    const column = tileColumn * this._tileColumns;
+    const key = Private.tileKey(tileRow, tileColumn);
+    if (
+      row < 0 ||
+      column < 0 ||
+      row >= this._rowCount ||
+      column >= this._columns.length ||
+      this._tiles.has(key) ||
+      this._pending.has(key)
+    ) {
+      return;
+    }
+
+    const pending = this._pending;
+    pending.add(key);
+    Private.requestTile(
+      this._parameters({
+        row: row.toString(),
+        rows: this._tileRows.toString(),
+        column: column.toString(),
+        columns: this._tileColumns.toString()
+      })
+    )
+      .then(tile => {
+        if (pending !== this._pending) {
+          // The tile belongs to a previous view
+          return;
+        }
+        this._tiles.set(key, tile);
+        while (this._tiles.size > this._maxTiles) {
+          // Evict the least recently used tile
+          this._tiles.delete(this._tiles.keys().next().value as string);
+        }
+        this.emitChanged({
+          type: 'cells-changed',
+          region: 'body',
+          row,
+          column,
+          rowSpan: Math.min(this._tileRows, this._rowCount - row),
+          columnSpan: Math.min(
+            this._tileColumns,
+            this._columns.length - column
+          )
+        });
+      })
+      .catch(reason => {
+        console.error(
+          `Failed to fetch the tile ${key} of ${this._path}`,
+          reason
+        );
+      })
+      .finally(() => {
+        pending.delete(key);
+      });
+  }
+
+  private _parameters(
+    parameters: Record<string, string> = {}
+  ): URLSearchParams {
+    const result = new URLSearchParams({ path: this._path, ...parameters });
+    if (this._view.sort !== undefined) {
+      result.append('sort', this._view.sort.toString());
+      result.append('order', this._view.descending ? 'desc' : 'asc');
+    }
+    for (const filter of this._view.filters ?? []) {
+      result.append(
+        'filter',
+        `${filter.column}:${filter.operator}:${filter.value}`
+      );
+    }
+    return result;
+  }
+
+  private _path: string;
+  private _tileRows: number;
+  private _tileColumns: number;
+  private _maxTiles: number;
+  private _columns: string[] = [];
+  private _rowCount = 0;
+  // Tiles as lists of columns, from the least to the most recently used
+  private _tiles = new Map<string, Private.Column[]>();
+  private _pending = new Set<string>();
+  private _lastKey = '';
+  private _view: TileDataModel.IView = {};
+  private _ready: Promise<void>;
+}
+
+/**
+ * A namespace for TileDataModel statics.
+ */
+export namespace TileDataModel {
+  /**
+   * The options used to create a tile data model.
+   */
+  export interface IOptions {
+    /**
+     * Number of rows of a tile; at most 1000.
+     */
+    tileRows?: number;
+
+    /**
+     * Number of columns of a tile; at most 100.
+     */
+    tileColumns?: number;
+
+    /**
+     * Maximal number of tiles kept in memory.
+     */
+    maxTiles?: number;
+  }
+
+  /**
+   * A sorted and filtered view of a dataset.
+   */
+  export interface IView {
+    /**
+     * Index of the column to sort the rows on.
+     */
+    sort?: number;
+
+    /**
+     * Whether to sort the rows in descending order.
+     */
+    descending?: boolean;
+
+    /**
+     * Conditions that the displayed rows must all match.
+     */
+    filters?: IFilter[];
+  }
+
+  /**
+   * A condition on the value of a column.
+   */
+  export interface IFilter {
+    /**
+     * Index of the column.
+     */
+    column: number;
+
+    /**
+     * Comparison operator.
+     */
+    operator: '==' | '!=' | '<' | '<=' | '>' | '>=' | 'contains';
+
+    /**
+     * Value compared to the values of the column.
+     */
+    value: string | number;
+  }
+}
+
+/**
+ * A namespace for private data.
+ */
+namespace Private {
+  /**
+   * The description of a dataset.
+   */
+  export interface IDatasetInfo {
+    columns: string[];
+    rows: number;
+  }
+
+  /**
+   * The types of the numeric columns of the tiles.
+   */
+  export type NumericType = 'int8' | 'int16' | 'int32' | 'float32' | 'float64';
+
+  /**
+   * The values of a numeric column.
+   */
+  export type NumericArray =
+    | Int8Array
+    | Int16Array
+    | Int32Array
+    | Float32Array
+    | Float64Array;
+
+  /**
+   * A typed array constructor, creating views on a buffer.
+   */
+  export interface INumericArrayType {
+    new (buffer: ArrayBuffer, byteOffset: number, length: number): NumericArray;
+    readonly BYTES_PER_ELEMENT: number;
+  }
+
+  /**
+   * The typed arrays of the numeric columns, by type.
+   */
+  export const ARRAY_TYPES: Record<NumericType, INumericArrayType> = {
+    int8: Int8Array,
+    int16: Int16Array,
+    int32: Int32Array,
+    float32: Float32Array,
+    float64: Float64Array
+  };
+
+  /**
+   * A column of a tile; the numeric ones are typed arrays.
+   */
+  export type Column = NumericArray | any[];
+
+  /**
+   * The description of the columns of a binary tile.
+   *
+   * The values of integer columns are divided by their scale, if any.
+   */
+  export interface ITileHeader {
+    columns: {
+      type: NumericType | 'json';
+      offset: number;
+      length: number;
+      scale?: number;
+    }[];
+  }
+
+  /**
+   * The media type of the binary tiles.
+   */
+  export const TILE_MEDIA_TYPE = 'application/vnd.jupyterlab-examples.tile';
+
+  /**
+   * The key of a tile in the cache.
+   */
+  export function tileKey(tileRow: number, tileColumn: number): string {
+    return `${tileRow}:${tileColumn}`;
+  }
+
+  /**
+   * Call a dataset end point of the server extension.
+   */
+  export async function request<T>(
+    endPoint: string,
+    parameters: URLSearchParams
+  ): Promise<T> {
+    const response = await fetchEndPoint(endPoint, parameters);
+    return response.json();
+  }
+
+  /**
+   * Request a tile in the binary format and decode it.
+   *
+   * The numeric columns are views on the response buffer: they are not parsed.
+   * Only the scaled integers are divided, into a new array of doubles.
+   */
+  export async function requestTile(
+    parameters: URLSearchParams
+  ): Promise<Column[]> {
+    const response = await fetchEndPoint('dataset/tile', parameters, {
+      headers: { Accept: TILE_MEDIA_TYPE }
+    });
+    const buffer = await response.arrayBuffer();
+    const headerLength = new DataView(buffer).getUint32(0, true);
+    const decoder = new TextDecoder();
+    const header: ITileHeader = JSON.parse(
+      decoder.decode(new Uint8Array(buffer, 4, headerLength))
+    );
+    const start = 4 + headerLength;
+    return header.columns.map(column => {
+      if (column.type !== 'json') {
+        const type = ARRAY_TYPES[column.type];
+        const values = new type(
+          buffer,
+          start + column.offset,
+          column.length / type.BYTES_PER_ELEMENT
+        );
+        if (column.scale === undefined) {
+          return values;
+        }
+        const scaled = new Float64Array(values.length);
+        for (let index = 0; index < values.length; index++) {
+          scaled[index] = values[index] / column.scale;
+        }
+        return scaled;
+      }
+      return JSON.parse(
+        decoder.decode(
+          new Uint8Array(buffer, start + column.offset, column.length)
+        )
+      );
+    });
+  }
+
+  /**
+   * Fetch an end point of the server extension, throwing on errors.
+   */
+  async function fetchEndPoint(
+    endPoint: string,
+    parameters: URLSearchParams,
+    init: RequestInit = {}
+  ): Promise<Response> {
+    const settings = ServerConnection.makeSettings();
+    const requestUrl =
+      URLExt.join(settings.baseUrl, 'jupyterlab-examples-server', endPoint) +
+      `?${parameters.toString()}`;
+
+    let response: Response;
+    try {
+      response = await ServerConnection.makeRequest(requestUrl, init, settings);
+    } catch (error) {
+      throw new ServerConnection.NetworkError(error as any);
+    }
+
+    if (!response.ok) {
+      const data = await response.json();
+      throw new ServerConnection.ResponseError(response, data.message);
+    }
+    return response;
+  }
+}
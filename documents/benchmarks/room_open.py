@@ -0,0 +1,50 @@
+"""Compare the time to open a document room from its file or from the update store.
+
+Run it with ``python benchmarks/room_open.py``.
+"""
+import json
+import os
+import tempfile
+import timeit
+
+from jupyterlab_examples_documents.document import YExampleDoc
+from jupyterlab_examples_documents.store import YUpdateStore
+
+SIZES = [10_000, 1_000_000, 10_000_000]
+EDITS = 500
+REPEAT = 5
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = YUpdateStore(os.path.join(tmp, "updates.db"))
+        print(f"{'size':>10} {'from file (ms)':>15} {'from store (ms)':>16}")
+        for size in SIZES:
+            name = f"doc-{size}.example"
+            path = os.path.join(tmp, name)
+
+            # A document edited many times since it was first loaded
+            doc = YExampleDoc()
+            subscription = store.attach(name, doc.ydoc)
+            doc.set(json.dumps({"x": 0, "y": 0, "content": "a" * size}))
+            for i in range(EDITS):
+                doc.set(json.dumps({"x": i, "y": i, "content": "a" * size}))
+            doc.ydoc.unobserve(subscription)
+            with open(path, "w") as f:
+                f.write(doc.get())
+
+            def from_file():
+                with open(path) as f:
+                    YExampleDoc().set(f.read())
+
+            def from_store():
+                store.load(name, YExampleDoc().ydoc)
+
+            file_time = min(timeit.repeat(from_file, number=1, repeat=REPEAT))
+            store_time = min(timeit.repeat(from_store, number=1, repeat=REPEAT))
+            print(f"{size:>10} {file_time * 1000:>15.2f} {store_time * 1000:>16.2f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
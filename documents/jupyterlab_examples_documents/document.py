@@ -1,32 +1,51 @@
+import asyncio
 import json
 from functools import partial
-from typing import Any, Callable
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Optional
 
 import pycrdt
 from jupyter_ydoc.ybasedoc import YBaseDoc
 
 
 class YExampleDoc(YBaseDoc):
+    # Keys of the document state describing the file rather than its content
+    _FILE_STATE = ("dirty", "path", "hash", "document_id")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._content = self._ydoc.get("content", type=pycrdt.Map)
+        # Serialized content cache, dropped whenever the content changes
+        self._cache: "dict[bool, str]" = {}
+        self._cache_subscription = self._content.observe(self._invalidate_cache)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._batch: "Optional[_ChangeBatch]" = None
 
     @property
     def version(self) -> str:
         return "0.1.0"
 
-    def get(self) -> str:
+    def get(self, compact: bool = False) -> str:
         """
         Returns the content of the document as saved by the contents manager.
 
+        :param compact: Whether to serialize without indentation.
         :return: Document's content.
         """
+        if compact in self._cache:
+            self.cache_hits += 1
+            return self._cache[compact]
+
+        self.cache_misses += 1
         data = self._content.to_py()
         position = json.loads(data["position"])
-        return json.dumps(
+        self._cache[compact] = json.dumps(
             {"x": position["x"], "y": position["y"], "content": data["content"]},
-            indent=2,
+            indent=None if compact else 2,
+            separators=(",", ":") if compact else None,
         )
+        return self._cache[compact]
 
     def set(self, raw_value: str) -> None:
         """
@@ -35,26 +54,55 @@ class YExampleDoc(YBaseDoc):
         :param raw_value: The content of the document.
         """
         value = json.loads(raw_value)
+        position = {"x": value["x"], "y": value["y"]}
+        current = self._content.to_py()
+        old_position = current.get("position")
+        position_changed = old_position is None or json.loads(old_position) != position
+        content_changed = current.get("content") != value["content"]
+        stale = [k for k in current if k not in ("position", "content")]
+        if not (position_changed or content_changed or stale):
+            # reloading the same content must not produce any update
+            return
+
         with self._ydoc.transaction():
-            # clear document
-            for key in self._content.keys():
+            # remove stale keys only, the others are updated in place
+            for key in stale:
                 self._content.pop(key)
-            for key in [k for k in self._ystate.keys() if k not in ("dirty", "path")]:
+            # the state of the file itself (e.g. its hash) is still valid
+            for key in [k for k in self._ystate.keys() if k not in self._FILE_STATE]:
                 self._ystate.pop(key)
 
-            self._content["position"] = {"x": value["x"], "y": value["y"]}
+            # only write the fields that changed to keep the update small
+            if position_changed:
+                self._content["position"] = json.dumps(position)
 
-            self._content["content"] = value["content"]
+            if content_changed:
+                self._content["content"] = value["content"]
 
     #
 
-    def observe(self, callback: "Callable[[str, Any], None]") -> None:
+    def observe(
+        self,
+        callback: "Callable[[str, Any], None]",
+        batch_window: "Optional[float]" = None,
+    ) -> None:
         """
         Subscribes to document changes.
 
         :param callback: Callback that will be called when the document changes.
+        :param batch_window: Opt-in batching of the changes; when set, the callback
+            is called once per window with ``("batch", changes)``, ``changes``
+            mapping each changed topic to the set of changed keys. ``0`` batches
+            the changes of a transaction, a positive value is a delay in seconds.
         """
         self.unobserve()
+        if batch_window is not None:
+            self._batch = _ChangeBatch(callback, batch_window)
+            self._subscriptions[self._ydoc] = self._ydoc.observe(
+                self._batch.on_transaction
+            )
+            callback = self._batch.add
+        self._observer = callback
         self._subscriptions[self._ystate] = self._ystate.observe(
             partial(callback, "state")
         )
@@ -63,3 +111,179 @@ class YExampleDoc(YBaseDoc):
         )
 
     #
+
+    def unobserve(self) -> None:
+        """
+        Unsubscribes to document changes and drops the pending batched changes.
+        """
+        super().unobserve()
+        if self._batch is not None:
+            self._batch.cancel()
+            self._batch = None
+
+    def _invalidate_cache(self, event: Any) -> None:
+        """Drops the serialized content as soon as the shared content changes."""
+        self._cache.clear()
+
+
+class YExampleChunkedDoc(YExampleDoc):
+    """
+    Example document storing its content as a list of text chunks.
+
+    The file format is a JSON header line holding the position followed by
+    the raw content, so that large documents can be loaded and saved by
+    streaming the chunks instead of parsing a single JSON object.
+    """
+
+    # Number of characters stored in each item of the chunks array
+    chunk_size = 64 * 1024
+    # Number of chunks written in each transaction
+    chunks_per_transaction = 16
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._chunks = self._ydoc.get("chunks", type=pycrdt.Array)
+        self._chunks_subscription = self._chunks.observe(self._invalidate_cache)
+
+    def get(self, compact: bool = False) -> str:
+        """
+        Returns the content of the document as saved by the contents manager.
+
+        :param compact: Unused, the header is always written without spaces like
+            the frontend does, so that the file is the same whichever side saved it.
+        :return: Document's content.
+        """
+        if compact in self._cache:
+            self.cache_hits += 1
+            return self._cache[compact]
+
+        self.cache_misses += 1
+        self._cache[compact] = "".join([self._header(), *self._chunks])
+        return self._cache[compact]
+
+    def set(self, raw_value: str) -> None:
+        """
+        Sets the content of the document from the contents manager read content.
+
+        :param raw_value: The content of the document.
+        """
+        start = raw_value.find("\n") + 1 or len(raw_value)
+        self._write(
+            raw_value[:start],
+            (
+                raw_value[i : i + self.chunk_size]
+                for i in range(start, len(raw_value), self.chunk_size)
+            ),
+        )
+
+    def dump(self, fp: "IO[str]", compact: bool = False) -> None:
+        """
+        Writes the document to a text stream one chunk at a time.
+
+        :param fp: The stream to write to.
+        :param compact: Unused, see `get`.
+        """
+        fp.write(self._header())
+        for chunk in self._chunks:
+            fp.write(chunk)
+
+    def load(self, fp: "IO[str]") -> None:
+        """
+        Reads the document from a text stream one chunk at a time.
+
+        Only the chunks that differ from the current content are written.
+
+        :param fp: The stream to read from.
+        """
+        self._write(fp.readline(), iter(partial(fp.read, self.chunk_size), ""))
+
+    def _header(self) -> str:
+        position = json.loads(self._content.get("position", '{"x": 0, "y": 0}'))
+        # Serialized like JSON.stringify
+        return json.dumps(position, separators=(",", ":")) + "\n"
+
+    def _write(self, header: str, chunks: "Iterable[str]") -> None:
+        """Writes the header then the chunks that changed."""
+        value = json.loads(header)
+        position = {"x": value["x"], "y": value["y"]}
+        old_position = self._content.get("position")
+        with self._ydoc.transaction():
+            for key in [k for k in self._ystate.keys() if k not in self._FILE_STATE]:
+                self._ystate.pop(key)
+
+            if old_position is None or json.loads(old_position) != position:
+                self._content["position"] = json.dumps(position)
+
+        # The chunks are written by batches of ``chunks_per_transaction``, the
+        # change events received by the observers then stay bounded in size.
+        index = 0
+        chunks = iter(chunks)
+        while batch := list(islice(chunks, self.chunks_per_transaction)):
+            with self._ydoc.transaction():
+                for chunk in batch:
+                    if index >= len(self._chunks):
+                        self._chunks.append(chunk)
+                    elif self._chunks[index] != chunk:
+                        self._chunks[index] = chunk
+                    index += 1
+        if index < len(self._chunks):
+            del self._chunks[index:]
+
+    def observe(
+        self,
+        callback: "Callable[[str, Any], None]",
+        batch_window: "Optional[float]" = None,
+    ) -> None:
+        """
+        Subscribes to document changes.
+
+        :param callback: Callback that will be called when the document changes.
+        :param batch_window: Opt-in batching of the changes, see `YExampleDoc.observe`.
+        """
+        super().observe(callback, batch_window)
+        self._subscriptions[self._chunks] = self._chunks.observe(
+            partial(self._observer, "chunks")
+        )
+
+
+class _ChangeBatch:
+    """Coalesces the document change events into a single callback."""
+
+    def __init__(self, callback: "Callable[[str, Any], None]", window: float):
+        self._callback = callback
+        self._window = window
+        self._changes: "dict[str, set[str]]" = {}
+        self._handle: "Optional[asyncio.TimerHandle]" = None
+
+    def add(self, topic: str, event: Any) -> None:
+        """Records the keys changed by an event; arrays have no keys."""
+        self._changes.setdefault(topic, set()).update(getattr(event, "keys", ()))
+
+    def on_transaction(self, event: Any) -> None:
+        """Schedules the delivery of the changes at the end of a transaction."""
+        if not self._changes or self._handle is not None:
+            return
+        if self._window > 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to wait on, deliver per transaction
+                pass
+            else:
+                self._handle = loop.call_later(self._window, self.flush)
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Calls the callback with the changes accumulated so far."""
+        self._handle = None
+        changes, self._changes = self._changes, {}
+        if changes:
+            self._callback("batch", changes)
+
+    def cancel(self) -> None:
+        """Drops the pending changes."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._changes = {}
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pycrdt
+
+from .document import YExampleDoc
+from .store import YUpdateStore
+
+
+class _Room:
+    """A document kept in memory, with its update subscription and size."""
+
+    def __init__(self, doc: YExampleDoc, size: int):
+        self.doc = doc
+        self.size = size
+        self.subscription: "Optional[pycrdt.Subscription]" = None
+        self.last_access = time.monotonic()
+        # Number of times the room was acquired and not released yet
+        self.users = 0
+
+
+class YRoomManager:
+    """
+    Keeps the documents of the rooms in memory within a size budget.
+
+    The documents are persisted in a ``YUpdateStore``. A room is in use from
+    ``acquire`` until the matching ``release``, e.g. while clients are
+    connected to it. A room not in use that has not been accessed for
+    ``idle_timeout`` seconds, or the least recently used ones when the total
+    size exceeds ``max_size``, are evicted: their log is compacted into a
+    snapshot and their document and subscriptions are dropped. The next
+    ``acquire`` restores the document from that snapshot.
+
+    Rooms in use are never evicted, so the budget may be exceeded while they
+    are; an evicted document is a different object once restored, so it must
+    not be kept after its room is released.
+    """
+
+    def __init__(
+        self,
+        store: YUpdateStore,
+        max_size: int = 256 * 1024 * 1024,
+        idle_timeout: float = 600,
+        doc_type: "type[YExampleDoc]" = YExampleDoc,
+    ):
+        """
+        :param store: The store the documents are persisted in.
+        :param max_size: Approximate maximal size of the documents kept in
+            memory, in bytes.
+        :param idle_timeout: Time after which a room not accessed is evicted,
+            in seconds.
+        :param doc_type: The document class of the rooms.
+        """
+        self.store = store
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.doc_type = doc_type
+        # Approximate size of the documents in memory, in bytes
+        self.size = 0
+        # The rooms in memory, from the least to the most recently used
+        self._rooms: "OrderedDict[str, _Room]" = OrderedDict()
+
+    def __contains__(self, name: str) -> bool:
+        """Whether the document of a room is in memory."""
+        return name in self._rooms
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def acquire(
+        self, name: str, source: "Optional[Callable[[], str]]" = None
+    ) -> YExampleDoc:
+        """
+        Returns the document of a room, restoring it if it was evicted, and
+        keeps it in memory until ``release`` is called as many times.
+
+        :param name: The room name, e.g. the document path.
+        :param source: Returns the content of the document file; it is called
+            to initialize a document that is not in the store yet.
+        :return: The document.
+        """
+        room = self._rooms.get(name)
+        if room is None:
+            room = self._restore(name, source)
+            room.users += 1
+            self._rooms[name] = room
+            self.size += room.size
+            self._enforce_budget()
+        else:
+            room.users += 1
+            room.last_access = time.monotonic()
+            self._rooms.move_to_end(name)
+        return room.doc
+
+    def release(self, name: str) -> None:
+        """
+        Releases a room acquired with ``acquire``; once it is not in use
+        anymore, it may be evicted.
+
+        :param name: The room name.
+        """
+        room = self._rooms.get(name)
+        if room is None or room.users == 0:
+            raise ValueError(f"Room {name!r} is not acquired")
+        room.users -= 1
+        room.last_access = time.monotonic()
+        if room.users == 0:
+            self._enforce_budget()
+
+    def in_use(self, name: str) -> bool:
+        """Whether a room is acquired and not released yet."""
+        room = self._rooms.get(name)
+        return room is not None and room.users > 0
+
+    def evict(self, name: str) -> None:
+        """
+        Snapshots the document of a room and drops it from memory.
+
+        :param name: The room name.
+        :raises ValueError: If the room is in use.
+        """
+        room = self._rooms.get(name)
+        if room is None:
+            return
+        if room.users > 0:
+            raise ValueError(f"Room {name!r} is in use")
+        del self._rooms[name]
+        self.size -= room.size
+        room.doc.unobserve()
+        room.doc.ydoc.unobserve(room.subscription)
+        self.store.compact(name)
+
+    def evict_idle(self) -> "list[str]":
+        """
+        Evicts the rooms not in use and not accessed for more than
+        ``idle_timeout`` seconds.
+
+        :return: The names of the evicted rooms.
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        idle = [
+            name
+            for name, room in self._rooms.items()
+            if room.users == 0 and room.last_access <= deadline
+        ]
+        for name in idle:
+            self.evict(name)
+        return idle
+
+    async def run(self, interval: float = 60) -> None:
+        """
+        Evicts the idle rooms every ``interval`` seconds, until cancelled.
+
+        :param interval: Time between two checks, in seconds.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    def _restore(self, name: str, source: "Optional[Callable[[], str]]") -> _Room:
+        doc = self.doc_type()
+        found = self.store.load(name, doc.ydoc)
+        room = _Room(doc, len(doc.ydoc.get_update()) if found else 0)
+        room.subscription = doc.ydoc.observe(
+            lambda event: self._on_update(name, room, event.update)
+        )
+        if not found and source is not None:
+            # Recorded as the first update, so that the snapshot holds it
+            doc.set(source())
+        return room
+
+    def _on_update(self, name: str, room: _Room, update: bytes) -> None:
+        self.store.append(name, update)
+        # The history of a Y document grows with each update
+        room.size += len(update)
+        if self._rooms.get(name) is room:
+            self.size += len(update)
+            room.last_access = time.monotonic()
+            self._rooms.move_to_end(name)
+            self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        """Evicts the least recently used rooms not in use to fit the budget."""
+        if self.size <= self.max_size:
+            return
+        # From the least to the most recently used
+        for name in [name for name, room in self._rooms.items() if room.users == 0]:
+            if self.size <= self.max_size:
+                break
+            self.evict(name)
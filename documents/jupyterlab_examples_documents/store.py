@@ -0,0 +1,165 @@
+import asyncio
+import sqlite3
+from collections import Counter
+from typing import Any, Optional
+
+import pycrdt
+
+
+class YUpdateStore:
+    """
+    Append-only log of the Y updates of documents, stored in SQLite.
+
+    The updates of a document are appended as they happen and periodically
+    compacted into a snapshot, so that a document can be restored by applying
+    its latest snapshot and the few updates received since then instead of
+    being rebuilt from its saved file.
+
+    The updates appended while an event loop runs are buffered and written
+    in a single transaction once the current loop iteration is done.
+
+    jupyter-collaboration has its own store for the rooms it serves, the
+    ``SQLiteYStore`` of its ``ystore_class`` option. This one does not depend
+    on it: it is synchronous, so that it can be used from the observers of a
+    document and by ``YRoomManager``, and it compacts each log by number of
+    updates rather than by age.
+    """
+
+    def __init__(self, path: str = ":memory:", compact_every: int = 100):
+        """
+        :param path: Path of the SQLite database.
+        :param compact_every: Number of updates after which a document log
+            is compacted into a snapshot.
+        """
+        self.compact_every = compact_every
+        # Number of updates in the log of each document, counted once per name
+        self._counts: "dict[str, int]" = {}
+        # Updates not written yet, and the call writing them
+        self._pending: "list[tuple[str, bytes]]" = []
+        self._handle: "Optional[asyncio.Handle]" = None
+        self._db = sqlite3.connect(path)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots "
+                "(name TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS updates "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS updates_name ON updates (name, id)"
+            )
+
+    def close(self) -> None:
+        """Writes the pending updates and closes the database."""
+        self.flush()
+        self._db.close()
+
+    def append(self, name: str, update: bytes) -> None:
+        """
+        Appends an update to the log of a document.
+
+        :param name: The document name, e.g. its path or room id.
+        :param update: The Y update.
+        """
+        self._pending.append((name, update))
+        if self._handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to batch on, write right away
+            self.flush()
+        else:
+            self._handle = loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Writes the pending updates, compacting the logs that grew too long."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO updates (name, data) VALUES (?, ?)", pending
+            )
+        for name, added in Counter(name for name, _ in pending).items():
+            if name in self._counts:
+                self._counts[name] += added
+            else:
+                self._counts[name] = self._count(name)
+            if self._counts[name] >= self.compact_every:
+                self.compact(name)
+
+    def load(self, name: str, ydoc: pycrdt.Doc) -> bool:
+        """
+        Restores a document from its snapshot and the updates that follow it.
+
+        :param name: The document name.
+        :param ydoc: The document to apply the stored updates to.
+        :return: Whether anything was stored for that document.
+        """
+        self.flush()
+        found = False
+        with ydoc.transaction():
+            for data in self._read(name):
+                ydoc.apply_update(data)
+                found = True
+        return found
+
+    def compact(self, name: str) -> None:
+        """
+        Squashes the snapshot and the updates of a document into a new snapshot.
+
+        :param name: The document name.
+        """
+        self.flush()
+        self._counts[name] = 0
+        with self._db:
+            last = self._db.execute(
+                "SELECT MAX(id) FROM updates WHERE name = ?", (name,)
+            ).fetchone()[0]
+            if last is None:
+                return
+            ydoc = pycrdt.Doc()
+            with ydoc.transaction():
+                for data in self._read(name, last):
+                    ydoc.apply_update(data)
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshots (name, data) VALUES (?, ?)",
+                (name, ydoc.get_update()),
+            )
+            self._db.execute(
+                "DELETE FROM updates WHERE name = ? AND id <= ?", (name, last)
+            )
+
+    def attach(self, name: str, ydoc: pycrdt.Doc) -> pycrdt.Subscription:
+        """
+        Records all the future updates of a document.
+
+        :param name: The document name.
+        :param ydoc: The document to follow.
+        :return: The subscription, to pass to ``ydoc.unobserve`` to stop recording.
+        """
+        return ydoc.observe(lambda event: self.append(name, event.update))
+
+    def _count(self, name: str) -> int:
+        return self._db.execute(
+            "SELECT COUNT(*) FROM updates WHERE name = ?", (name,)
+        ).fetchone()[0]
+
+    def _read(self, name: str, last: Any = None) -> "list[bytes]":
+        snapshot = self._db.execute(
+            "SELECT data FROM snapshots WHERE name = ?", (name,)
+        ).fetchall()
+        query = "SELECT data FROM updates WHERE name = ?"
+        args: "tuple[Any, ...]" = (name,)
+        if last is not None:
+            query += " AND id <= ?"
+            args += (last,)
+        updates = self._db.execute(query + " ORDER BY id", args).fetchall()
+        return [row[0] for row in snapshot + updates]
@@ -0,0 +1 @@
+"""Python unit tests for jupyterlab_examples_documents."""
@@ -0,0 +1,112 @@
+"""Python unit tests for the example documents."""
+import io
+import json
+import tracemalloc
+
+from jupyterlab_examples_documents.document import (
+    YExampleChunkedDoc,
+    YExampleDoc,
+)
+
+
+def test_example_doc_roundtrip():
+    # Given
+    doc = YExampleDoc()
+    source = json.dumps({"x": 1, "y": 2, "content": "hello"})
+
+    # When
+    doc.set(source)
+
+    # Then
+    assert json.loads(doc.get()) == {"x": 1, "y": 2, "content": "hello"}
+    assert doc.get(compact=True) == '{"x":1,"y":2,"content":"hello"}'
+
+
+def test_example_doc_reload_unchanged_content():
+    # Given
+    doc = YExampleDoc()
+    source = json.dumps({"x": 1, "y": 2, "content": "hello"})
+    doc.set(source)
+    doc.hash = "abc"
+    updates = []
+    doc.ydoc.observe(lambda event: updates.append(event.update))
+
+    # When
+    doc.set(source)
+
+    # Then
+    assert updates == []
+    assert doc.hash == "abc"
+
+
+def test_chunked_doc_roundtrip():
+    # Given
+    doc = YExampleChunkedDoc()
+    doc.chunk_size = 4
+    content = "abcdefghij"
+
+    # When
+    doc.set('{"x": 1, "y": 2}\n' + content)
+
+    # Then
+    # The header is written like the frontend does
+    assert doc.get() == '{"x":1,"y":2}\n' + content
+    assert doc.get(compact=True) == doc.get()
+    assert list(doc._chunks) == ["abcd", "efgh", "ij"]
+    buffer = io.StringIO()
+    doc.dump(buffer)
+    assert buffer.getvalue() == doc.get()
+
+
+def test_chunked_doc_writes_changed_chunks_only():
+    # Given
+    doc = YExampleChunkedDoc()
+    doc.chunk_size = 4
+    doc.set('{"x": 0, "y": 0}\nabcdefghij')
+    updates = []
+    doc.ydoc.observe(lambda event: updates.append(event.update))
+
+    # When
+    doc.load(io.StringIO('{"x": 0, "y": 0}\nabcdXXgh'))
+
+    # Then
+    assert list(doc._chunks) == ["abcd", "XXgh"]
+    # The changed chunk, then the removal of the last one
+    assert len(updates) == 2
+    assert doc.get() == '{"x":0,"y":0}\nabcdXXgh'
+
+
+def test_chunked_doc_batches_chunks_per_transaction():
+    # Given
+    doc = YExampleChunkedDoc()
+    doc.chunk_size = 2
+    doc.chunks_per_transaction = 4
+    transactions = []
+    doc.ydoc.observe(lambda event: transactions.append(event))
+
+    # When
+    doc.set('{"x": 0, "y": 0}\n' + "a" * 20)
+
+    # Then
+    assert len(doc._chunks) == 10
+    # The header, then 3 batches of chunks
+    assert len(transactions) == 4
+
+
+def test_chunked_doc_set_does_not_copy_the_content():
+    # Given
+    doc = YExampleChunkedDoc()
+    content = '{"x":0,"y":0}\n' + "a" * 16 * 1024 * 1024
+
+    # When
+    tracemalloc.start()
+    try:
+        doc.set(content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Then
+    # Bounded by the size of a batch of chunks, not by the content size
+    assert peak < 4 * doc.chunk_size * doc.chunks_per_transaction
+    assert doc.get() == content
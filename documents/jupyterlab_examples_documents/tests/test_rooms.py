@@ -0,0 +1,85 @@
+"""Python unit tests for the room manager."""
+import json
+
+import pytest
+
+from jupyterlab_examples_documents.rooms import YRoomManager
+from jupyterlab_examples_documents.store import YUpdateStore
+
+
+def content(text):
+    return json.dumps({"x": 0, "y": 0, "content": text})
+
+
+def test_acquired_room_is_not_evicted():
+    # Given
+    rooms = YRoomManager(YUpdateStore(), max_size=1)
+    doc = rooms.acquire("a.example", source=lambda: content("a" * 100))
+
+    # When
+    rooms.acquire("b.example", source=lambda: content("b" * 100))
+    rooms.evict_idle()
+    doc.set(content("edited"))
+
+    # Then
+    assert "a.example" in rooms
+    assert rooms.acquire("a.example") is doc
+    assert json.loads(doc.get())["content"] == "edited"
+
+
+def test_released_room_is_evicted_and_restored():
+    # Given
+    rooms = YRoomManager(YUpdateStore(), max_size=1)
+    doc = rooms.acquire("a.example", source=lambda: content("a" * 100))
+    doc.set(content("edited"))
+
+    # When
+    rooms.release("a.example")
+
+    # Then
+    assert "a.example" not in rooms
+    assert rooms.size == 0
+    restored = rooms.acquire("a.example")
+    assert restored is not doc
+    assert json.loads(restored.get())["content"] == "edited"
+
+
+def test_budget_evicts_least_recently_used_rooms_not_in_use():
+    # Given
+    rooms = YRoomManager(YUpdateStore(), max_size=10_000)
+    for name in ("a", "b", "c"):
+        rooms.acquire(name, source=lambda: content("x" * 3_000))
+    for name in ("a", "b", "c"):
+        rooms.release(name)
+
+    # When
+    rooms.acquire("d", source=lambda: content("x" * 3_000))
+
+    # Then
+    assert "a" not in rooms
+    assert all(name in rooms for name in ("b", "c", "d"))
+    assert rooms.size <= rooms.max_size
+
+
+def test_evict_idle_skips_rooms_in_use():
+    # Given
+    rooms = YRoomManager(YUpdateStore(), idle_timeout=0)
+    rooms.acquire("a", source=lambda: content("a"))
+    rooms.acquire("b", source=lambda: content("b"))
+    rooms.release("b")
+
+    # When
+    evicted = rooms.evict_idle()
+
+    # Then
+    assert evicted == ["b"]
+    assert rooms.in_use("a")
+    with pytest.raises(ValueError):
+        rooms.evict("a")
+
+
+def test_release_not_acquired_room():
+    rooms = YRoomManager(YUpdateStore())
+
+    with pytest.raises(ValueError):
+        rooms.release("a")
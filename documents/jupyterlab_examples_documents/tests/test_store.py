@@ -0,0 +1,69 @@
+"""Python unit tests for the update store."""
+import asyncio
+
+import pycrdt
+import pytest
+
+from jupyterlab_examples_documents.store import YUpdateStore
+
+
+def count_queries(store, pattern):
+    queries = []
+    store._db.set_trace_callback(
+        lambda query: queries.append(query) if pattern in query else None
+    )
+    return queries
+
+
+def test_restore_document(tmp_path):
+    # Given
+    path = str(tmp_path / "updates.db")
+    store = YUpdateStore(path, compact_every=3)
+    ydoc = pycrdt.Doc()
+    text = ydoc.get("text", type=pycrdt.Text)
+    store.attach("a", ydoc)
+
+    # When
+    for word in ("Hello", " ", "world", "!"):
+        text += word
+    store.close()
+
+    # Then
+    restored = pycrdt.Doc()
+    assert YUpdateStore(path).load("a", restored)
+    assert str(restored.get("text", type=pycrdt.Text)) == "Hello world!"
+    assert not YUpdateStore(path).load("b", pycrdt.Doc())
+
+
+def test_compact_every():
+    # Given
+    store = YUpdateStore(compact_every=3)
+    counts = count_queries(store, "COUNT(*)")
+
+    # When
+    for _ in range(7):
+        store.append("a", pycrdt.Doc().get_update())
+
+    # Then the log is counted once, and compacted twice
+    assert len(counts) == 1
+    assert store._count("a") == 1
+
+
+@pytest.mark.asyncio
+async def test_updates_are_written_once_per_loop_iteration():
+    # Given
+    store = YUpdateStore()
+    transactions = count_queries(store, "BEGIN")
+    ydoc = pycrdt.Doc()
+    text = ydoc.get("text", type=pycrdt.Text)
+    store.attach("a", ydoc)
+
+    # When
+    for index in range(10):
+        text += str(index)
+    assert store._count("a") == 0
+    await asyncio.sleep(0)
+
+    # Then
+    assert store._count("a") == 10
+    assert len(transactions) == 1
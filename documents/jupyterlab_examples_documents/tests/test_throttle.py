@@ -0,0 +1,96 @@
+"""Python unit tests for the room broadcast throttle."""
+import asyncio
+
+import pycrdt
+import pytest
+
+from jupyterlab_examples_documents.throttle import RoomThrottle
+
+
+class Client:
+    """A client of the room, with its own document and awareness."""
+
+    def __init__(self):
+        self.awareness = pycrdt.Awareness(pycrdt.Doc())
+        self.ydoc = pycrdt.Doc()
+        self.state = self.ydoc.get("state", type=pycrdt.Map)
+        self.updates = []
+        self.ydoc.observe(lambda event: self.updates.append(event.update))
+
+    def move(self, x, y):
+        self.awareness.set_local_state_field("mouse", {"x": x, "y": y})
+        return self.awareness.encode_awareness_update([self.awareness.client_id])
+
+
+@pytest.mark.asyncio
+async def test_coalesces_changes_per_client():
+    # Given
+    room = pycrdt.Awareness(pycrdt.Doc())
+    sent = []
+    throttle = RoomThrottle(
+        room, lambda message, origin: sent.append((message, origin)), window=10
+    )
+    clients = [Client() for _ in range(3)]
+
+    # When 300 moves from 3 clients and 50 state changes from the first one
+    for step in range(100):
+        for index, client in enumerate(clients):
+            throttle.receive_awareness(client.move(step, index), origin=index)
+    for step in range(50):
+        clients[0].state["step"] = step
+        throttle.receive_update(clients[0].updates[-1], origin=0)
+    throttle.flush()
+
+    # Then each client gets one awareness message, the first one an update too
+    assert throttle.received == 350
+    assert throttle.sent == 4
+    assert sorted(origin for _, origin in sent) == [0, 0, 1, 2]
+    update = next(m for m, _ in sent if m[0] == pycrdt.YMessageType.SYNC)
+    ydoc = pycrdt.Doc()
+    ydoc.apply_update(pycrdt.read_message(update[2:]))
+    assert ydoc.get("state", type=pycrdt.Map)["step"] == 49
+    observer = pycrdt.Awareness(pycrdt.Doc())
+    for message, _ in sent:
+        if message[0] == pycrdt.YMessageType.AWARENESS:
+            observer.apply_awareness_update(pycrdt.read_message(message[1:]), None)
+    assert sorted(
+        state["mouse"]["y"]
+        for client_id, state in observer.states.items()
+        if client_id != observer.client_id
+    ) == [0, 1, 2]
+    throttle.close()
+
+
+@pytest.mark.asyncio
+async def test_windows_are_per_client():
+    # Given
+    room = pycrdt.Awareness(pycrdt.Doc())
+    sent = []
+    throttle = RoomThrottle(room, lambda message, origin: sent.append(origin), 0.1)
+    busy, other = Client(), Client()
+
+    # When
+    throttle.receive_awareness(busy.move(0, 0), origin="busy")
+    await asyncio.sleep(0.05)
+    throttle.receive_awareness(other.move(0, 0), origin="other")
+    throttle.receive_awareness(busy.move(1, 1), origin="busy")
+    await asyncio.sleep(0.07)
+
+    # Then the window of each client ends on its own
+    assert sent == ["busy"]
+    await asyncio.sleep(0.07)
+    assert sent == ["busy", "other"]
+    throttle.close()
+
+
+def test_without_event_loop_sends_right_away():
+    # Given
+    room = pycrdt.Awareness(pycrdt.Doc())
+    sent = []
+    throttle = RoomThrottle(room, lambda message, origin: sent.append(origin))
+
+    # When
+    throttle.receive_awareness(Client().move(0, 0), origin="client")
+
+    # Then
+    assert sent == ["client"]
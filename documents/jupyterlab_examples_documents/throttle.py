@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+import pycrdt
+
+
+class _Pending:
+    """The changes of a client waiting for the end of its window."""
+
+    def __init__(self):
+        self.clients: "set[int]" = set()
+        self.updates: "list[bytes]" = []
+        self.handle: "Optional[asyncio.TimerHandle]" = None
+
+
+class RoomThrottle:
+    """
+    Coalesces the broadcasts of a document room into one message per client
+    and per window.
+
+    Relaying every awareness change (e.g. each mouse move) of every client to
+    every other client makes the traffic of a room grow with the square of its
+    number of participants. Instead, each client, identified by the origin of
+    its messages, gets its own window: the changes it sends during the window
+    are broadcast together at its end.
+
+    - its awareness is sent once per window with its latest state, the
+      intermediate states are dropped;
+    - its document updates, like the changes of the shared state, are merged
+      into a single update.
+
+    A busy client therefore never delays the changes of the others. The
+    messages are built with the Yjs protocol of ``pycrdt`` and passed to
+    ``broadcast`` along with their origin, so that they are not echoed back
+    to the client they come from.
+    """
+
+    def __init__(
+        self,
+        awareness: pycrdt.Awareness,
+        broadcast: "Callable[[bytes, Any], None]",
+        window: float = 0.05,
+    ):
+        """
+        :param awareness: The awareness of the room.
+        :param broadcast: Sends a message to all the clients of the room but
+            the one of the given origin (all of them if it is ``None``).
+        :param window: Time during which the changes of a client are
+            coalesced, in seconds; ``0`` sends the changes of each message
+            right away.
+        """
+        self._awareness = awareness
+        self._broadcast = broadcast
+        self._window = window
+        self._pending: "dict[Any, _Pending]" = {}
+        self._subscription = awareness.observe(self._on_awareness)
+        # Number of messages received and sent, to monitor the coalescing
+        self.received = 0
+        self.sent = 0
+
+    def receive_awareness(self, update: bytes, origin: Any = None) -> None:
+        """
+        Applies the awareness update of a client; it is broadcast later.
+
+        :param update: The awareness update.
+        :param origin: The origin of the update, e.g. the client connection.
+        """
+        self.received += 1
+        self._awareness.apply_awareness_update(update, origin)
+
+    def receive_update(self, update: bytes, origin: Any = None) -> None:
+        """
+        Records a document update already applied to the room; it is broadcast
+        later, merged with the other updates of the same origin.
+
+        :param update: The document update.
+        :param origin: The origin of the update, e.g. the client connection.
+        """
+        self.received += 1
+        self._get_pending(origin).updates.append(update)
+        self._schedule(origin)
+
+    def flush(self) -> None:
+        """Broadcasts the changes coalesced so far, of all the clients."""
+        for origin in list(self._pending):
+            self._flush(origin)
+
+    def close(self) -> None:
+        """Broadcasts the pending changes and stops following the awareness."""
+        self.flush()
+        self._awareness.unobserve(self._subscription)
+
+    def _flush(self, origin: Any) -> None:
+        pending = self._pending.pop(origin, None)
+        if pending is None:
+            return
+        if pending.handle is not None:
+            pending.handle.cancel()
+        if pending.updates:
+            updates = pending.updates
+            update = updates[0] if len(updates) == 1 else pycrdt.merge_updates(*updates)
+            self._send(pycrdt.create_update_message(update), origin)
+        if pending.clients:
+            update = self._awareness.encode_awareness_update(sorted(pending.clients))
+            self._send(pycrdt.create_awareness_message(update), origin)
+
+    def _on_awareness(self, topic: str, changes: "tuple[dict[str, Any], Any]") -> None:
+        if topic != "update":
+            return
+        change, origin = changes
+        self._get_pending(origin).clients.update(
+            change["added"], change["updated"], change["removed"]
+        )
+        self._schedule(origin)
+
+    def _get_pending(self, origin: Any) -> _Pending:
+        pending = self._pending.get(origin)
+        if pending is None:
+            pending = self._pending[origin] = _Pending()
+        return pending
+
+    def _schedule(self, origin: Any) -> None:
+        pending = self._pending[origin]
+        if pending.handle is not None:
+            return
+        if self._window > 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to wait on, broadcast right away
+                pass
+            else:
+                pending.handle = loop.call_later(self._window, self._flush, origin)
+                return
+        self._flush(origin)
+
+    def _send(self, message: bytes, origin: Any) -> None:
+        self.sent += 1
+        self._broadcast(message, origin)
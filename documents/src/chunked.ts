@@ -0,0 +1,79 @@
+import { ICollaborativeDrive } from '@jupyter/collaborative-drive';
+
+import {
+  JupyterFrontEnd,
+  JupyterFrontEndPlugin,
+  ILayoutRestorer
+} from '@jupyterlab/application';
+
+import { WidgetTracker } from '@jupyterlab/apputils';
+
+import { ExampleChunkedDocModelFactory, ExampleWidgetFactory } from './factory';
+import { ExampleChunkedDoc } from './model';
+import { ExampleDocWidget } from './widget';
+
+/**
+ * The name of the factory that creates editor widgets for chunked documents.
+ */
+const FACTORY = 'Example chunked editor';
+
+/**
+ * Registers the chunked variant of the document, matching the
+ * `examplechunkeddoc` shared model of the server.
+ */
+export const chunkedExtension: JupyterFrontEndPlugin<void> = {
+  id: 'documents:chunked',
+  description: 'Chunked variant of the collaborative document.',
+  autoStart: true,
+  requires: [ILayoutRestorer],
+  optional: [ICollaborativeDrive],
+  activate: (
+    app: JupyterFrontEnd,
+    restorer: ILayoutRestorer,
+    drive: ICollaborativeDrive | null
+  ) => {
+    const tracker = new WidgetTracker<ExampleDocWidget>({
+      namespace: 'documents-example-chunked'
+    });
+    if (restorer) {
+      restorer.restore(tracker, {
+        command: 'docmanager:open',
+        args: widget => ({ path: widget.context.path, factory: FACTORY }),
+        name: widget => widget.context.path
+      });
+    }
+
+    app.docRegistry.addFileType({
+      name: 'examplechunked',
+      displayName: 'Example (chunked)',
+      mimeTypes: ['text/plain'],
+      extensions: ['.examplechunked'],
+      fileFormat: 'text',
+      contentType: 'examplechunkeddoc' as any
+    });
+
+    if (drive) {
+      drive.sharedModelFactory.registerDocumentFactory(
+        'examplechunkeddoc',
+        () => ExampleChunkedDoc.create()
+      );
+    }
+
+    app.docRegistry.addModelFactory(new ExampleChunkedDocModelFactory());
+
+    // The widget is the same as for the JSON variant of the document
+    const widgetFactory = new ExampleWidgetFactory({
+      name: FACTORY,
+      modelName: 'example-chunked-model',
+      fileTypes: ['examplechunked'],
+      defaultFor: ['examplechunked']
+    });
+    widgetFactory.widgetCreated.connect((sender, widget) => {
+      widget.context.pathChanged.connect(() => {
+        tracker.save(widget);
+      });
+      tracker.add(widget);
+    });
+    app.docRegistry.addWidgetFactory(widgetFactory);
+  }
+};
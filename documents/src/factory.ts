@@ -4,7 +4,7 @@ import { Contents } from '@jupyterlab/services';
 
 import { ExampleDocWidget, ExamplePanel } from './widget';
 
-import { ExampleDoc, ExampleDocModel } from './model';
+import { ExampleChunkedDoc, ExampleDoc, ExampleDocModel } from './model';
 
 /**
  * A widget factory to create new instances of ExampleDocWidget.
@@ -114,3 +114,42 @@ export class ExampleDocModelFactory implements DocumentRegistry.IModelFactory<Ex
 
   private _disposed = false;
 }
+
+/**
+ * A Model factory to create instances of ExampleDocModel backed by the
+ * chunked variant of the shared model.
+ */
+export class ExampleChunkedDocModelFactory extends ExampleDocModelFactory {
+  /**
+   * The name of the model.
+   *
+   * @returns The name
+   */
+  get name(): string {
+    return 'example-chunked-model';
+  }
+
+  /**
+   * The content type of the file.
+   *
+   * @returns The content type
+   */
+  get contentType(): Contents.ContentType {
+    return 'examplechunkeddoc' as any;
+  }
+
+  /**
+   * Create a new instance of ExampleDocModel.
+   *
+   * @param options Model options
+   * @returns The model
+   */
+  createNew(
+    options: DocumentRegistry.IModelOptions<ExampleDoc>
+  ): ExampleDocModel {
+    return new ExampleDocModel({
+      ...options,
+      sharedModel: options.sharedModel ?? ExampleChunkedDoc.create()
+    });
+  }
+}
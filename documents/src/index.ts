@@ -10,6 +10,7 @@ import { WidgetTracker, IWidgetTracker } from '@jupyterlab/apputils';
 
 import { Token } from '@lumino/coreutils';
 
+import { chunkedExtension } from './chunked';
 import { ExampleWidgetFactory, ExampleDocModelFactory } from './factory';
 import { ExampleDoc } from './model';
 import { ExampleDocWidget } from './widget';
@@ -105,4 +106,4 @@ const extension: JupyterFrontEndPlugin<void> = {
   }
 };
 
-export default extension;
+export default [extension, chunkedExtension];
@@ -450,3 +450,123 @@ export class ExampleDoc extends YDocument<ExampleDocChange> {
 
   private _content: Y.Map<any>;
 }
+
+/**
+ * SharedModel of the chunked variant of the document, matching
+ * `YExampleChunkedDoc` on the server: the content is stored as a list of
+ * text chunks and the file is a JSON header line holding the position
+ * followed by the raw content.
+ */
+export class ExampleChunkedDoc extends ExampleDoc {
+  constructor() {
+    super();
+    this._chunks = this.ydoc.getArray<string>('chunks');
+    this._chunks.observe(this._chunksObserver);
+  }
+
+  /**
+   * Get the document source
+   *
+   * @returns The source
+   */
+  getSource(): string {
+    const pos = this.get('position');
+    return JSON.stringify({ x: pos.x, y: pos.y }) + '\n' + this.get('content');
+  }
+
+  /**
+   * Set the document source
+   *
+   * @param value The source to set
+   */
+  setSource(value: string): void {
+    const start = value.indexOf('\n') + 1 || value.length;
+    const header = JSON.parse(value.slice(0, start));
+    this.transact(() => {
+      this.set('position', { x: header.x, y: header.y });
+      this.set('content', value.slice(start));
+    });
+  }
+
+  /**
+   * Dispose of the resources.
+   */
+  dispose(): void {
+    if (this.isDisposed) {
+      return;
+    }
+    this._chunks.unobserve(this._chunksObserver);
+    super.dispose();
+  }
+
+  /**
+   * Static method to create instances on the sharedModel
+   *
+   * @returns The sharedModel instance
+   */
+  static create(): ExampleChunkedDoc {
+    return new ExampleChunkedDoc();
+  }
+
+  /**
+   * Returns an the requested object.
+   *
+   * @param key The key of the object.
+   * @returns The content
+   */
+  get(key: 'content'): string;
+  get(key: 'position'): Position;
+  get(key: string): any {
+    return key === 'content'
+      ? this._chunks.toArray().join('')
+      : super.get(key as 'position');
+  }
+
+  /**
+   * Adds new data.
+   *
+   * @param key The key of the object.
+   * @param value New object.
+   */
+  set(key: 'content', value: string): void;
+  set(key: 'position', value: PartialJSONObject): void;
+  set(key: string, value: string | PartialJSONObject): void {
+    if (key !== 'content') {
+      super.set(key as 'position', value as PartialJSONObject);
+      return;
+    }
+    const content = value as string;
+    const size = ExampleChunkedDoc.CHUNK_SIZE;
+    const count = Math.ceil(content.length / size);
+    this.transact(() => {
+      // Only the chunks that changed are written
+      for (let index = 0; index < count; index++) {
+        const chunk = content.slice(index * size, (index + 1) * size);
+        if (index >= this._chunks.length) {
+          this._chunks.push([chunk]);
+        } else if (this._chunks.get(index) !== chunk) {
+          this._chunks.delete(index, 1);
+          this._chunks.insert(index, [chunk]);
+        }
+      }
+      if (count < this._chunks.length) {
+        this._chunks.delete(count, this._chunks.length - count);
+      }
+    });
+  }
+
+  /**
+   * Number of characters stored in each item of the chunks array, the same
+   * as on the server.
+   */
+  static readonly CHUNK_SIZE = 64 * 1024;
+
+  /**
+   * Handle a change of the chunks.
+   */
+  private _chunksObserver = (): void => {
+    this._changed.emit({ contentChange: this.get('content') });
+  };
+
+  private _chunks: Y.Array<string>;
+}
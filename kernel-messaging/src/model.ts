@@ -7,8 +7,10 @@ import { Kernel, KernelMessage } from '@jupyterlab/services';
 import { ISignal, Signal } from '@lumino/signaling';
 
 export class KernelModel {
-  constructor(session: ISessionContext) {
+  constructor(session: ISessionContext, options: KernelModel.IOptions = {}) {
     this._sessionContext = session;
+    this._throttle = options.throttle ?? 'frame';
+    this._maxOutputs = options.maxOutputs ?? 100;
   }
 
   get future(): Kernel.IFuture<
@@ -35,6 +37,13 @@ export class KernelModel {
     return this._output;
   }
 
+  /**
+   * The outputs of the execution, the latest version of each display.
+   */
+  get outputs(): IOutput[] {
+    return Array.from(this._outputs.values());
+  }
+
   get stateChanged(): ISignal<KernelModel, void> {
     return this._stateChanged;
   }
@@ -43,6 +52,7 @@ export class KernelModel {
     if (!this._sessionContext || !this._sessionContext.session?.kernel) {
       return;
     }
+    this._outputs.clear();
     this.future = this._sessionContext.session?.kernel?.requestExecute({
       code
     });
@@ -53,22 +63,110 @@ export class KernelModel {
     switch (msgType) {
       case 'execute_result':
       case 'display_data':
-      case 'update_display_data':
-        this._output = msg.content as IOutput;
-        console.log(this._output);
-        this._stateChanged.emit();
+      case 'update_display_data': {
+        const output = msg.content as IOutput;
+        const key = Private.displayKey(output);
+        if (
+          msgType === 'update_display_data' &&
+          (key === null || !this._outputs.has(key))
+        ) {
+          // Only a display already shown can be updated
+          break;
+        }
+        this._output = output;
+        this._addOutput(output);
+        this._scheduleUpdate();
         break;
+      }
       default:
         break;
     }
     return;
   };
 
+  /**
+   * Keep the latest version of each display, and the most recent outputs.
+   */
+  private _addOutput(output: IOutput): void {
+    // Outputs without display id can't be updated: give them a unique key
+    const key = Private.displayKey(output) ?? `output:${this._count++}`;
+    // Updating a display keeps its position
+    this._outputs.set(key, output);
+    while (this._outputs.size > this._maxOutputs) {
+      this._outputs.delete(this._outputs.keys().next().value as string);
+    }
+  }
+
+  /**
+   * Emit a single stateChanged signal for all the messages received until
+   * the next animation frame or the end of the throttling window.
+   */
+  private _scheduleUpdate(): void {
+    if (this._updatePending) {
+      return;
+    }
+    if (this._throttle === 'frame') {
+      this._updatePending = true;
+      requestAnimationFrame(this._emitUpdate);
+    } else if (this._throttle > 0) {
+      this._updatePending = true;
+      setTimeout(this._emitUpdate, this._throttle);
+    } else {
+      this._stateChanged.emit();
+    }
+  }
+
+  private _emitUpdate = (): void => {
+    this._updatePending = false;
+    this._stateChanged.emit();
+  };
+
   private _future: Kernel.IFuture<
     KernelMessage.IExecuteRequestMsg,
     KernelMessage.IExecuteReplyMsg
   > | null = null;
   private _output: IOutput | null = null;
+  private _outputs = new Map<string, IOutput>();
+  private _count = 0;
+  private _maxOutputs: number;
+  private _throttle: 'frame' | number;
+  private _updatePending = false;
   private _sessionContext: ISessionContext;
   private _stateChanged = new Signal<KernelModel, void>(this);
 }
+
+/**
+ * A namespace for KernelModel statics.
+ */
+export namespace KernelModel {
+  /**
+   * The options used to create a kernel model.
+   */
+  export interface IOptions {
+    /**
+     * How often the stateChanged signal can be emitted: at most once per
+     * animation frame (`'frame'`, the default), once per given number of
+     * milliseconds, or for every message (`0`).
+     */
+    throttle?: 'frame' | number;
+
+    /**
+     * Maximal number of outputs kept, the oldest ones are dropped first.
+     */
+    maxOutputs?: number;
+  }
+}
+
+/**
+ * A namespace for private data.
+ */
+namespace Private {
+  /**
+   * The key of an output in the outputs of the model if it has a display id,
+   * null otherwise.
+   */
+  export function displayKey(output: IOutput): string | null {
+    const displayId = (output.transient as any)?.display_id;
+    return displayId ? `display:${displayId}` : null;
+  }
+}
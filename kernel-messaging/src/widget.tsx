@@ -23,9 +23,24 @@ export class KernelView extends ReactWidget {
           Compute 3+5
         </button>
         <UseSignal signal={this._model.stateChanged}>
-          {(): JSX.Element => (
-            <span key="output field">{JSON.stringify(this._model.output)}</span>
-          )}
+          {(): JSX.Element => {
+            const outputs = this._model.outputs;
+            if (outputs.length <= 1) {
+              // A single output is shown inline, as a text field
+              return (
+                <span key="output field">
+                  {JSON.stringify(this._model.output)}
+                </span>
+              );
+            }
+            return (
+              <div key="output field">
+                {outputs.map((output, index) => (
+                  <pre key={index}>{JSON.stringify(output)}</pre>
+                ))}
+              </div>
+            );
+          }}
         </UseSignal>
       </React.Fragment>
     );
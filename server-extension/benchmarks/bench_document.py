@@ -0,0 +1,64 @@
+"""Cost of reading, writing and observing ``YExampleDoc`` at several sizes.
+
+It requires the ``jupyterlab_examples_documents`` package of the documents
+example.
+"""
+import json
+
+import pytest
+
+document = pytest.importorskip("jupyterlab_examples_documents.document")
+
+SIZES = [1_000, 100_000, 10_000_000]
+
+
+def content(size, x=0):
+    return json.dumps({"x": x, "y": 0, "content": "a" * size})
+
+
+def rounds(size):
+    return max(5, min(200, 100_000_000 // (size * 100)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get(bench, size):
+    doc = document.YExampleDoc()
+    doc.set(content(size))
+    bench(doc.get, rounds=rounds(size), size=size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_uncached(bench, size):
+    doc = document.YExampleDoc()
+    doc.set(content(size))
+    # Changing the position drops the serialized content
+    positions = iter(range(1, 1_000_000))
+    bench(
+        doc.get,
+        rounds=rounds(size),
+        setup=lambda: doc.set(content(size, next(positions))),
+        size=size,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("observer", [None, "callback", "batch"])
+def test_set(bench, size, observer):
+    doc = document.YExampleDoc()
+    doc.set(content(size))
+    events = []
+    if observer == "callback":
+        doc.observe(lambda topic, event: events.append(topic))
+    elif observer == "batch":
+        doc.observe(lambda topic, event: events.append(topic), batch_window=0)
+
+    # Alternate two contents so that each call writes the content
+    values = [content(size - 1), content(size)]
+    calls = iter(range(1_000_000))
+    bench(
+        lambda: doc.set(values[next(calls) % 2]),
+        rounds=rounds(size),
+        size=size,
+    )
+    if observer is not None:
+        assert events
@@ -0,0 +1,72 @@
+"""Throughput and latency of the server extension end points.
+
+The client runs in the same event loop as the server, so the figures include
+its overhead; compare them between runs on the same machine only.
+"""
+import itertools
+import json
+
+import pytest
+
+CONCURRENCY = [1, 10, 50]
+REQUESTS = 1000
+
+
+@pytest.fixture
+def fetch(jp_fetch, http_server_client):
+    # Let the client keep all the requests of a benchmark in flight
+    http_server_client.max_clients = max(CONCURRENCY)
+    return jp_fetch
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+async def test_get_hello(bench, fetch, concurrency):
+    await bench.run_async(
+        lambda: fetch("jupyterlab-examples-server", "hello"),
+        requests=REQUESTS,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+async def test_post_hello(bench, fetch, concurrency):
+    # A different name for each request, so that they are not coalesced
+    names = itertools.count()
+    await bench.run_async(
+        lambda: fetch(
+            "jupyterlab-examples-server",
+            "hello",
+            method="POST",
+            body=json.dumps({"name": "benchmark {}".format(next(names))}),
+        ),
+        requests=REQUESTS,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.parametrize("size", [10_000, 1_000_000, 10_000_000])
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+async def test_get_static(bench, static_dir, fetch, size, encoding):
+    (static_dir / "asset.js").write_text("a" * size)
+    # Precompressed siblings are built in the background on the first request
+    await fetch(
+        "jupyterlab-examples-server",
+        "public",
+        "asset.js",
+        headers={"Accept-Encoding": encoding},
+    )
+
+    requests = max(20, min(500, 100_000_000 // size))
+    result = await bench.run_async(
+        lambda: fetch(
+            "jupyterlab-examples-server",
+            "public",
+            "asset.js",
+            headers={"Accept-Encoding": encoding},
+            decompress_response=False,
+        ),
+        requests=requests,
+        concurrency=10,
+        size=size,
+    )
+    result["extra"]["bytes_per_second"] = size * result["ops_per_second"]
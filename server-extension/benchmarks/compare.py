@@ -0,0 +1,46 @@
+"""Compare two benchmark reports.
+
+Run it with ``python benchmarks/compare.py baseline.json results.json``; it
+prints the ratio of the median latencies and of the throughputs, and exits with
+status 1 if a median latency grew by more than the threshold (10% by default).
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return {result["name"]: result for result in json.load(f)["benchmarks"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Tolerated slowdown ratio."
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    results = load(args.results)
+    regressions = 0
+    print(f"{'name':<48} {'median':>8} {'ops/s':>8}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<48} {'new':>8}")
+            continue
+        median = result["median"] / before["median"] if before["median"] else 1.0
+        throughput = result["ops_per_second"] / before["ops_per_second"]
+        flag = ""
+        if median > 1 + args.threshold:
+            regressions += 1
+            flag = "  slower"
+        print(f"{name:<48} {median:>7.2f}x {throughput:>7.2f}x{flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Fixtures and JSON report of the benchmarks.
+
+The fixture and the option are named ``bench`` and ``--bench-json`` so that they
+don't clash with those of the pytest-benchmark plugin, if it is installed.
+The benchmarks are not collected with the tests; run them with::
+
+    python -m pytest benchmarks/bench_*.py --bench-json=results.json
+"""
+import asyncio
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+import pytest
+
+results_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-json",
+        default="benchmark.json",
+        help="File to write the benchmark results to.",
+    )
+
+
+def pytest_configure(config):
+    config.stash[results_key] = []
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(results_key, [])
+    if not results:
+        return
+    report = {
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "benchmarks": results,
+    }
+    with open(session.config.getoption("bench_json"), "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(results_key, [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<48} {'ops/s':>10} {'median (ms)':>12} {'p99 (ms)':>10}"
+    )
+    for result in results:
+        terminalreporter.write_line(
+            f"{result['name']:<48} {result['ops_per_second']:>10.1f} "
+            f"{result['median'] * 1000:>12.3f} {result['p99'] * 1000:>10.3f}"
+        )
+    terminalreporter.write_line(
+        "Written to {}".format(config.getoption("bench_json"))
+    )
+
+
+def machine_info():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+class Benchmark:
+    """Times a function and records the statistics of the timings.
+
+    Each record is a dictionary with the number of operations, the
+    concurrency, the wall time and throughput, the latency statistics in
+    seconds and the ``extra`` values given by the benchmark.
+    """
+
+    def __init__(self, name, results):
+        self.name = name
+        self._results = results
+
+    def __call__(self, func, rounds=100, setup=None, warmup=1, **extra):
+        """Times ``rounds`` calls of ``func``, each after an untimed ``setup()``."""
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            func()
+        timings = []
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return self.record(timings, sum(timings), 1, extra)
+
+    async def run_async(self, func, requests=500, concurrency=1, warmup=1, **extra):
+        """Times ``requests`` calls of the coroutine function ``func``.
+
+        ``concurrency`` calls are kept in flight; the throughput is computed
+        from the wall time of all the calls.
+        """
+        for _ in range(warmup):
+            await func()
+        timings = []
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                await func()
+                timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return self.record(timings, time.perf_counter() - start, concurrency, extra)
+
+    def record(self, timings, wall_time, concurrency, extra):
+        timings = sorted(timings)
+        result = {
+            "name": self.name,
+            "operations": len(timings),
+            "concurrency": concurrency,
+            "wall_time": wall_time,
+            "ops_per_second": len(timings) / wall_time,
+            "min": timings[0],
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "p95": percentile(timings, 0.95),
+            "p99": percentile(timings, 0.99),
+            "max": timings[-1],
+            "extra": extra,
+        }
+        self._results.append(result)
+        return result
+
+
+def percentile(timings, fraction):
+    """Returns the value of sorted timings below which the fraction of them fall."""
+    return timings[min(len(timings) - 1, int(fraction * len(timings)))]
+
+
+@pytest.fixture
+def bench(request):
+    """Records the timings of a benchmark under the test name."""
+    return Benchmark(request.node.name, request.config.stash[results_key])
@@ -6,3 +6,20 @@ pytest_plugins = ("pytest_jupyter.jupyter_server", )
 @pytest.fixture
 def jp_server_config(jp_server_config):
     return {"ServerApp": {"jpserver_extensions": {"jupyterlab_examples_server": True}}}
+
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    # Must be requested before the server fixtures to be taken into account
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    monkeypatch.setenv("JLAB_SERVER_EXAMPLE_STATIC_DIR", str(static_dir))
+    return static_dir
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    lines = ["id,name,value"] + [f'{i},"name, {i}",{i * 0.5}' for i in range(1000)]
+    path.write_text("\n".join(lines) + "\n")
+    return path
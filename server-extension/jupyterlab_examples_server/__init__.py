@@ -7,7 +7,16 @@ except ImportError:
     import warnings
     warnings.warn("Importing 'jupyterlab_examples_server' outside a proper installation.")
     __version__ = "dev"
-from .handlers import setup_handlers
+
+
+def __getattr__(name):
+    # The handlers are only imported on first access, like in
+    # _load_jupyter_server_extension, to keep importing the package cheap
+    if name == "setup_handlers":
+        from .handlers import setup_handlers
+
+        return setup_handlers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _jupyter_labextension_paths():
@@ -31,6 +40,10 @@ def _load_jupyter_server_extension(server_app):
     server_app: jupyterlab.labapp.LabApp
         JupyterLab application instance
     """
+    # Imported here so that importing the package, e.g. to list the
+    # labextension paths, does not load Jupyter Server and Tornado
+    from .handlers import setup_handlers
+
     setup_handlers(server_app.web_app)
     name = "jupyterlab_examples_server"
     server_app.log.info(f"Registered {name} server extension")
@@ -0,0 +1,104 @@
+import asyncio
+from collections import deque
+
+import tornado
+
+
+class TooManyRequests(tornado.web.HTTPError):
+    """Error of a request rejected because its route is saturated.
+
+    ``retry_after`` is the delay, in seconds, after which the client may retry.
+    """
+
+    def __init__(self, retry_after):
+        super().__init__(429, "Too many concurrent requests, retry later.")
+        self.retry_after = retry_after
+
+
+class SingleFlight:
+    """Shares the result of a computation between concurrent identical calls.
+
+    While a call for a key is running, the other calls for the same key wait
+    for its result instead of starting their own computation. The key must
+    identify everything the result depends on.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        # Number of calls served by the computation of another call
+        self.shared = 0
+
+    async def run(self, key, func):
+        """Returns the result of the coroutine function ``func()`` for a key."""
+        future = self._flights.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._flights[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.shared += 1
+        # A cancelled caller must not cancel the computation of the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._flights.get(key) is future:
+            del self._flights[key]
+
+
+class ConcurrencyLimiter:
+    """Limits the number of requests processed at the same time.
+
+    Up to ``max_concurrent`` requests are processed, up to ``max_queued`` more
+    wait for their turn in order; the others are rejected with
+    ``TooManyRequests`` so that the server sheds the load early instead of
+    slowing down every request.
+    """
+
+    def __init__(self, max_concurrent, max_queued, retry_after=1):
+        """
+        Parameters
+        ----------
+        max_concurrent: int
+            Maximal number of requests processed at the same time
+        max_queued: int
+            Maximal number of requests waiting to be processed
+        retry_after: int
+            Delay, in seconds, advised to the rejected clients before retrying
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.retry_after = retry_after
+        self.active = 0
+        self._waiters = deque()
+
+    @property
+    def queued(self):
+        return len(self._waiters)
+
+    async def acquire(self):
+        """Waits for a slot, or raises ``TooManyRequests`` if the queue is full."""
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            return
+        if len(self._waiters) >= self.max_queued:
+            raise TooManyRequests(self.retry_after)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self):
+        """Frees a slot, handing it over to the oldest waiting request if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
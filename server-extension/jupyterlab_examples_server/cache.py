@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class ResponseCache:
+    """In-memory LRU cache with a time to live and a total size budget.
+
+    Any object providing the same ``get``/``set`` methods can be used instead,
+    e.g. to share the cache between several server processes.
+    """
+
+    def __init__(self, max_size: int = 10 * 1024 * 1024, ttl: float = 60):
+        """
+        Parameters
+        ----------
+        max_size: int
+            Maximal total size of the cached values, in bytes
+        ttl: float
+            Time to live of an entry, in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self._entries: "OrderedDict[str, tuple[float, int, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, _, value = entry
+        if expires < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, size: int) -> None:
+        """Caches a value of the given size, evicting the least recently used ones."""
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_size:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, size, value)
+        self.size += size
+        while self.size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drops all the entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
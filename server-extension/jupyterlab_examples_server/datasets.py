@@ -0,0 +1,362 @@
+import array
+import bisect
+import csv
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    # The numeric columns of the tiles are narrowed without vectorization
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # Parquet files are only supported if pyarrow is installed
+    pq = None
+
+# Media type of the binary tiles, see encode_tile
+TILE_MEDIA_TYPE = "application/vnd.jupyterlab-examples.tile"
+
+
+def to_doubles(values):
+    """Converts a column of strings to an array of doubles, if they are all numbers.
+
+    Empty values become NaN; the column is returned unchanged if a value is not a
+    number.
+    """
+    try:
+        return array.array(
+            "d", (float(value) if value else math.nan for value in values)
+        )
+    except ValueError:
+        return values
+
+
+# Integer types of the tile columns, from the narrowest, with their bounds
+INT_TYPES = (("int8", "b", 2**7), ("int16", "h", 2**15), ("int32", "i", 2**31))
+
+# Powers of ten tried to store decimal numbers as scaled integers
+SCALES = (1, 10, 100, 1000, 10000)
+
+
+def narrow(values):
+    """Returns the narrowest lossless type of an array of doubles.
+
+    The values are stored as integers divided by a power of ten if they all
+    are, as the client computes the same doubles by dividing them, otherwise
+    as single precision numbers if it keeps them all, or as doubles.
+
+    Returns
+    -------
+    The name of the type, the array of the values in this type and the scale
+    to divide them by.
+    """
+    if np is not None:
+        data = np.frombuffer(values, dtype=np.float64)
+        with np.errstate(over="ignore", invalid="ignore"):
+            if len(data) and np.isfinite(data).all():
+                for scale in SCALES:
+                    ints = np.rint(data * scale)
+                    int_type = _int_type(ints.min(), ints.max())
+                    if int_type is not None and (ints / scale == data).all():
+                        kind, code = int_type
+                        ints = ints.astype(code).tobytes()
+                        return kind, array.array(code, ints), scale
+            floats = data.astype(np.float32)
+            if ((floats == data) | np.isnan(data)).all():
+                return "float32", array.array("f", floats.tobytes()), 1
+        return "float64", values, 1
+
+    if len(values) and all(math.isfinite(value) for value in values):
+        for scale in SCALES:
+            ints = [round(value * scale) for value in values]
+            int_type = _int_type(min(ints), max(ints))
+            if int_type is not None and all(
+                i / scale == value for i, value in zip(ints, values)
+            ):
+                kind, code = int_type
+                return kind, array.array(code, ints), scale
+    # Doubles out of the range of single precision become infinite
+    floats = array.array("f", values)
+    if all(f == v or math.isnan(v) for f, v in zip(floats, values)):
+        return "float32", floats, 1
+    return "float64", values, 1
+
+
+def _int_type(low, high):
+    """Returns the narrowest integer type holding the bounds, None if none does."""
+    for kind, code, bound in INT_TYPES:
+        if -bound <= low and high < bound:
+            return kind, code
+    return None
+
+
+def encode_tile(row, column, data):
+    """Encodes a tile in a binary, column-oriented format.
+
+    The tile starts with the length of a JSON header as a little-endian 32-bit
+    integer, followed by the header itself, padded to a multiple of 8 bytes.
+    The header describes each column with its ``type`` and the ``offset`` and
+    ``length`` in bytes of its values, relative to the end of the header.
+
+    Numeric columns are stored in the narrowest type keeping their values, see
+    ``narrow``: ``int8``, ``int16`` or ``int32`` with a ``scale`` to divide them
+    by, ``float32`` or ``float64``. Their values are little-endian and aligned
+    on 8 bytes, so the client reads them without parsing; other columns are
+    JSON lists.
+    """
+    columns = []
+    buffers = []
+    offset = 0
+    for values in data:
+        scale = 1
+        if isinstance(values, list):
+            kind, buffer = "json", json.dumps(values).encode()
+        else:
+            kind, values, scale = narrow(values)
+            if sys.byteorder == "big":
+                values = array.array(values.typecode, values)
+                values.byteswap()
+            # Typed arrays are written as they are in memory
+            buffer = memoryview(values).cast("B")
+        columns.append({"type": kind, "offset": offset, "length": len(buffer)})
+        if scale != 1:
+            columns[-1]["scale"] = scale
+        padding = -len(buffer) % 8
+        buffers.extend((buffer, b"\0" * padding))
+        offset += len(buffer) + padding
+
+    header = json.dumps({"row": row, "column": column, "columns": columns}).encode()
+    header += b" " * (-(4 + len(header)) % 8)
+    return b"".join([struct.pack("<I", len(header)), header, *buffers])
+
+
+class CsvReader:
+    """Column-oriented reader of a CSV file through a memory map.
+
+    Only a sparse index of the file is kept in memory: the offset of the first
+    line of every block of about ``BLOCK_SIZE`` bytes and its row number. Reading
+    a tile scans at most one block to find its first row, unless the offset of
+    every row is given in ``line_offsets`` (see ``line_starts``).
+
+    Fields containing line breaks are not supported.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    # Offset of the line of each row, to read the rows in any order
+    line_offsets = None
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._size = size
+        # An empty file cannot be memory mapped
+        self._map = b""
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = self._next_line(0)
+        self.columns = next(csv.reader([self._decode(0, header_end)]), [])
+
+        # Row number of the first line of each block and its offset
+        self._first_rows = []
+        self._offsets = []
+        rows = 0
+        position = header_end
+        while position < size:
+            end = self._next_line(min(position + self.BLOCK_SIZE, size))
+            self._first_rows.append(rows)
+            self._offsets.append(position)
+            rows += self._map[position:end].count(b"\n")
+            position = end
+        if header_end < size and self._map[size - 1:size] != b"\n":
+            # The last line has no line break
+            rows += 1
+        self.row_count = rows
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def read(self, row, row_count, column, column_count, typed=False):
+        """Returns the values of a tile, as a list of columns.
+
+        If ``typed``, the numeric columns are returned as arrays of doubles.
+        """
+        row_count = max(0, min(row_count, self.row_count - row))
+        column_count = max(0, min(column_count, len(self.columns) - column))
+        result = [[] for _ in range(column_count)]
+        if row_count == 0 or column_count == 0:
+            return result
+
+        start = self._locate(row)
+        end = start
+        for _ in range(row_count):
+            end = self._next_line(end)
+        lines = self._decode(start, end).splitlines()
+        return self._to_columns(lines, column, column_count, typed)
+
+    def read_rows(self, rows, column, column_count, typed=False):
+        """Returns the values of the given rows, as a list of columns."""
+        column_count = max(0, min(column_count, len(self.columns) - column))
+        lines = []
+        for row in rows:
+            start = self._locate(row)
+            lines.append(self._decode(start, self._next_line(start)))
+        return self._to_columns(lines, column, column_count, typed)
+
+    def line_starts(self):
+        """Returns the offset of the line of every row."""
+        offsets = array.array("q")
+        position = self._offsets[0] if self._offsets else self._size
+        while position < self._size:
+            offsets.append(position)
+            position = self._next_line(position)
+        return offsets
+
+    def _locate(self, row):
+        # Offset of the line of a row
+        if self.line_offsets is not None:
+            return self.line_offsets[row]
+        block = bisect.bisect_right(self._first_rows, row) - 1
+        start = self._offsets[block]
+        for _ in range(row - self._first_rows[block]):
+            start = self._next_line(start)
+        return start
+
+    def _to_columns(self, lines, column, column_count, typed):
+        result = [[] for _ in range(column_count)]
+        for record in csv.reader(lines):
+            for index, values in enumerate(result):
+                position = column + index
+                values.append(record[position] if position < len(record) else None)
+        if typed:
+            result = [to_doubles(values) for values in result]
+        return result
+
+    def _next_line(self, position):
+        # Offset of the line following the one containing position
+        end = self._map.find(b"\n", position)
+        return self._size if end == -1 else end + 1
+
+    def _decode(self, start, end):
+        return self._map[start:end].decode("utf-8")
+
+
+class ParquetReader:
+    """Column-oriented reader of a Parquet file through a memory map.
+
+    Only the row groups and the columns overlapping a tile are read.
+    """
+
+    def __init__(self, path):
+        if pq is None:
+            raise ValueError("Reading Parquet files requires pyarrow.")
+        self._file = pq.ParquetFile(path, memory_map=True)
+        metadata = self._file.metadata
+        self.columns = self._file.schema_arrow.names
+        self.row_count = metadata.num_rows
+        # Row number of the first row of each row group
+        self._first_rows = []
+        rows = 0
+        for index in range(metadata.num_row_groups):
+            self._first_rows.append(rows)
+            rows += metadata.row_group(index).num_rows
+
+    def close(self):
+        self._file.close()
+
+    def read(self, row, row_count, column, column_count, typed=False):
+        """Returns the values of a tile, as a list of columns.
+
+        If ``typed``, the numeric columns are returned as arrays of doubles.
+        """
+        row_count = max(0, min(row_count, self.row_count - row))
+        names = self.columns[column:column + column_count]
+        if row_count == 0 or not names:
+            return [[] for _ in names]
+
+        first = bisect.bisect_right(self._first_rows, row) - 1
+        last = bisect.bisect_right(self._first_rows, row + row_count - 1) - 1
+        table = self._file.read_row_groups(range(first, last + 1), columns=names)
+        table = table.slice(row - self._first_rows[first], row_count)
+        return self._to_columns(table, names, typed)
+
+    def read_rows(self, rows, column, column_count, typed=False):
+        """Returns the values of the given rows, as a list of columns."""
+        names = self.columns[column:column + column_count]
+        if not rows or not names:
+            return [[] for _ in names]
+
+        groups = [bisect.bisect_right(self._first_rows, row) - 1 for row in rows]
+        # Position in the table of the first row of each group read
+        starts = {}
+        position = 0
+        for group in sorted(set(groups)):
+            starts[group] = position
+            position += self._file.metadata.row_group(group).num_rows
+        table = self._file.read_row_groups(sorted(starts), columns=names)
+        indices = [
+            starts[group] + row - self._first_rows[group]
+            for row, group in zip(rows, groups)
+        ]
+        return self._to_columns(table.take(indices), names, typed)
+
+    def _to_columns(self, table, names, typed):
+        result = []
+        for name in names:
+            values = table.column(name)
+            if typed and (
+                pa.types.is_floating(values.type) or pa.types.is_integer(values.type)
+            ):
+                # Nulls become NaN; doubles are not copied
+                result.append(values.to_numpy().astype("<f8", copy=False))
+            else:
+                result.append(values.to_pylist())
+        return result
+
+
+READERS = {".csv": CsvReader, ".parquet": ParquetReader}
+
+
+class DatasetCache:
+    """Keeps the most recently used dataset readers open."""
+
+    def __init__(self, max_count=16):
+        self.max_count = max_count
+        self._readers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, path):
+        """Returns the reader of a dataset, opening it if needed."""
+        with self._lock:
+            mtime = os.path.getmtime(path)
+            entry = self._readers.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._readers.move_to_end(path)
+                return entry[1]
+
+        reader_class = READERS.get(os.path.splitext(path)[1].lower())
+        if reader_class is None:
+            raise ValueError("Unsupported dataset format: {}".format(path))
+        reader = reader_class(path)
+
+        with self._lock:
+            self._readers[path] = (mtime, reader)
+            self._readers.move_to_end(path)
+            # Evicted readers are closed when garbage collected, as they may
+            # still be used by a request running in another thread
+            while len(self._readers) > self.max_count:
+                self._readers.popitem(last=False)
+        return reader
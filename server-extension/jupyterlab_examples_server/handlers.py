@@ -1,44 +1,658 @@
+import asyncio
+import hashlib
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from jupyter_core.paths import jupyter_data_dir
+from jupyter_server.auth.decorator import authorized
 from jupyter_server.base.handlers import APIHandler
 from jupyter_server.utils import url_path_join
 import tornado
-from tornado.web import StaticFileHandler
+from tornado.ioloop import IOLoop
+from tornado.iostream import StreamClosedError
 
+from .admission import ConcurrencyLimiter, SingleFlight, TooManyRequests
+from .cache import ResponseCache
+from .datasets import TILE_MEDIA_TYPE, DatasetCache, encode_tile
+from .indexes import OPERATORS, IndexStore
+from .logs import LEVELS, LogService
+from .metrics import Metrics, MetricsMixin
+from .profiler import Profiler, SlowRequests
+from .state import StateStore
+from .push import PushHandler, PushHub
+from .symbols import SymbolIndex
+from .static import StaticAssetHandler, precompress
 
-class RouteHandler(APIHandler):
+
+def hello():
+    return {"data": "This is /jupyterlab-examples-server/hello endpoint!"}
+
+
+def greetings(name):
+    # Stand-in for some real work, executed out of the IOLoop
+    return {"greetings": "Hello {}, enjoy JupyterLab!".format(name)}
+
+
+async def greetings_stream(count):
+    # Stand-in for a large result set produced piece by piece
+    for index in range(count):
+        yield {"index": index, **greetings("visitor {}".format(index))}
+        if index % 1000 == 999:
+            # Let the IOLoop handle other requests
+            await asyncio.sleep(0)
+
+
+class BaseHandler(MetricsMixin, APIHandler):
+    """Base handler offloading blocking work out of the Tornado IOLoop.
+
+    The latency, size and status of its requests are recorded, see ``metrics``.
+    Given a ``limiter`` option, the number of its requests processed at the
+    same time is limited, see ``ConcurrencyLimiter``.
+    """
+
+    def initialize(self, limiter=None):
+        self.limiter = limiter
+        self._admitted = False
+
+    async def prepare(self):
+        await super().prepare()
+        # Requests that will be rejected as unauthenticated don't take a slot
+        if self.limiter is not None and self.current_user:
+            await self.limiter.acquire()
+            self._admitted = True
+
+    def on_finish(self):
+        super().on_finish()
+        if self._admitted:
+            self._admitted = False
+            self.limiter.release()
+
+    def write_error(self, status_code, **kwargs):
+        exc_info = kwargs.get("exc_info")
+        if exc_info and isinstance(exc_info[1], TooManyRequests):
+            self.set_header("Retry-After", str(exc_info[1].retry_after))
+        super().write_error(status_code, **kwargs)
+
+    async def run_in_thread(self, func, *args):
+        """Runs blocking I/O (or GIL-releasing) ``func(*args)`` in the thread pool."""
+        executor = self.settings["jupyterlab_examples_server"]["thread_pool"]
+        return await IOLoop.current().run_in_executor(executor, func, *args)
+
+    async def run_in_process(self, func, *args):
+        """Runs CPU-bound ``func(*args)`` in the process pool.
+
+        ``func`` and its arguments must be picklable, e.g. a module-level function.
+        """
+        executor = self.settings["jupyterlab_examples_server"]["process_pool"]
+        return await IOLoop.current().run_in_executor(executor, func, *args)
+
+    def get_int_argument(self, name, default, maximum=None):
+        """Returns a non-negative integer argument, or a 400 error if invalid."""
+        value = self.get_argument(name, None)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise tornado.web.HTTPError(400, "{} must be an integer.".format(name))
+        if value < 0 or (maximum is not None and value > maximum):
+            raise tornado.web.HTTPError(400, "{} is out of range.".format(name))
+        return value
+
+    def finish_cached(self, compute):
+        """Finishes a GET request with a cached body and its strong ETag.
+
+        ``compute()`` builds the body on a cache miss; a request whose
+        ``If-None-Match`` header matches the ETag gets a 304 without body.
+        """
+        cache = self.settings["jupyterlab_examples_server"]["response_cache"]
+        entry = cache.get(self.request.uri)
+        if entry is None:
+            body = compute().encode()
+            entry = (body, '"{}"'.format(hashlib.sha1(body).hexdigest()))
+            cache.set(self.request.uri, entry, len(body))
+        body, etag = entry
+        self.set_header("Etag", etag)
+        if self.check_etag_header():
+            self.set_status(304)
+            return self.finish()
+        return self.finish(body)
+
+
+class RouteHandler(BaseHandler):
     # The following decorator should be present on all verb methods (head, get, post,
     # patch, put, delete, options) to ensure only authorized user can request the
     # Jupyter server
     @tornado.web.authenticated
-    def get(self):
-        self.finish(json.dumps({
-            "data": "This is /jupyterlab-examples-server/hello endpoint!"
-        }))
+    async def get(self):
+        self.finish_cached(lambda: json.dumps(hello()))
 
     @tornado.web.authenticated
-    def post(self):
+    async def post(self):
         # input_data is a dictionary with a key "name"
         input_data = self.get_json_body()
-        data = {"greetings": "Hello {}, enjoy JupyterLab!".format(input_data["name"])}
+        data = await _greet(self, input_data["name"])
         self.finish(json.dumps(data))
 
 
+class BatchHandler(BaseHandler):
+    """Runs a list of sub-requests in a single HTTP round trip.
+
+    Given a ``limiters`` option mapping a path to a ``ConcurrencyLimiter``, the
+    sub-requests of that path share the limiter of its route; those rejected
+    get a 429 result.
+    """
+
+    # Maximal number of sub-requests in a batch
+    MAX_REQUESTS = 100
+
+    def initialize(self, limiters=None):
+        super().initialize()
+        self.limiters = limiters or {}
+
+    @tornado.web.authenticated
+    async def post(self):
+        # The body is a list of {"method": ..., "path": ..., "body": ...} sub-requests
+        requests = self.get_json_body()
+        if not isinstance(requests, list):
+            raise tornado.web.HTTPError(400, "The body must be a list of requests.")
+        if len(requests) > self.MAX_REQUESTS:
+            raise tornado.web.HTTPError(
+                400, "A batch has at most {} requests.".format(self.MAX_REQUESTS)
+            )
+        results = await asyncio.gather(*(self._run(request) for request in requests))
+        self.finish(json.dumps(results))
+
+    async def _run(self, request):
+        if not isinstance(request, dict):
+            return {"status": 400, "body": {"message": "A request must be an object."}}
+        method = request.get("method", "GET")
+        path = request.get("path", "")
+        if not isinstance(method, str) or not isinstance(path, str):
+            message = "The method and the path of a request must be strings."
+            return {"status": 400, "body": {"message": message}}
+        method = method.upper()
+        operation = BATCH_OPERATIONS.get((method, path))
+        if operation is None:
+            message = f"Unknown request {method} {path}"
+            return {"status": 404, "body": {"message": message}}
+        limiter = self.limiters.get(path)
+        if limiter is not None:
+            try:
+                await limiter.acquire()
+            except TooManyRequests as e:
+                body = {"message": e.log_message, "retry_after": e.retry_after}
+                return {"status": 429, "body": body}
+        try:
+            return {"status": 200, "body": await operation(self, request.get("body"))}
+        except tornado.web.HTTPError as e:
+            # e.g. an invalid body
+            return {"status": e.status_code, "body": {"message": e.log_message}}
+        except Exception as e:
+            self.log.error("Batched request %s %s failed", method, path, exc_info=e)
+            return {"status": 500, "body": {"message": str(e)}}
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+
+class StreamHandler(BaseHandler):
+    """Streams a large result as newline-delimited JSON (NDJSON)."""
+
+    # Size of the buffered response above which it is sent to the client
+    FLUSH_SIZE = 64 * 1024
+
+    # Maximal number of records of a stream
+    MAX_COUNT = 1_000_000
+
+    @tornado.web.authenticated
+    async def get(self):
+        count = self.get_int_argument("count", 1000, self.MAX_COUNT)
+        self.set_header("Content-Type", "application/x-ndjson")
+        buffered = 0
+        try:
+            async for record in greetings_stream(count):
+                line = json.dumps(record) + "\n"
+                self.write(line)
+                buffered += len(line)
+                if buffered >= self.FLUSH_SIZE:
+                    # Waiting for the data to be sent pauses the production
+                    # when the client reads slower than the server writes
+                    await self.flush()
+                    buffered = 0
+        except StreamClosedError:
+            # The client went away
+            return
+        self.finish(set_content_type="application/x-ndjson")
+
+
+class DatasetHandler(BaseHandler):
+    """Describes a CSV or Parquet dataset: its columns and its number of rows.
+
+    The ``sort``, ``order`` and ``filter`` arguments select a view of the
+    dataset, see ``open_view``.
+    """
+
+    def get_dataset_path(self):
+        # The path is relative to the server root directory
+        root = os.path.realpath(self.settings["server_root_dir"])
+        path = os.path.realpath(os.path.join(root, self.get_argument("path")))
+        if os.path.commonpath([root, path]) != root:
+            raise tornado.web.HTTPError(403, "The dataset must be in the server root.")
+        if not os.path.isfile(path):
+            raise tornado.web.HTTPError(404, "Dataset not found.")
+        return path
+
+    async def open_dataset(self, path):
+        datasets = self.settings["jupyterlab_examples_server"]["datasets"]
+        try:
+            return await self.run_in_thread(datasets.open, path)
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+
+    async def open_view(self):
+        """Returns the reader of the dataset and the row numbers of the view.
+
+        The view is sorted on the ``sort`` column, in descending order if
+        ``order=desc``, and contains the rows matching all the ``filter``
+        arguments, formatted as ``column:operator:value``. The row numbers
+        are None if no view is requested.
+        """
+        path = self.get_dataset_path()
+        reader = await self.open_dataset(path)
+        columns = len(reader.columns)
+        sort = self.get_int_argument("sort", None, columns - 1)
+        descending = self.get_argument("order", "asc") == "desc"
+        filters = []
+        for argument in self.get_arguments("filter"):
+            try:
+                column, operator_name, value = argument.split(":", 2)
+                column = int(column)
+            except ValueError:
+                raise tornado.web.HTTPError(
+                    400, "filter must be formatted as column:operator:value."
+                )
+            if not 0 <= column < columns or operator_name not in OPERATORS:
+                raise tornado.web.HTTPError(400, "Invalid filter {}.".format(argument))
+            filters.append((column, operator_name, value))
+
+        indexes = self.settings["jupyterlab_examples_server"]["indexes"]
+        try:
+            rows = await self.run_in_thread(
+                indexes.view, reader, path, sort, descending, filters
+            )
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+        return reader, rows
+
+    @tornado.web.authenticated
+    async def get(self):
+        reader, rows = await self.open_view()
+        row_count = reader.row_count if rows is None else len(rows)
+        self.finish(json.dumps({"columns": reader.columns, "rows": row_count}))
+
+
+class TileHandler(DatasetHandler):
+    """Returns a rectangular tile of a dataset, as a list of columns.
+
+    Clients accepting ``TILE_MEDIA_TYPE`` get the binary encoding of the tile,
+    with the numeric columns as arrays of doubles, instead of JSON.
+    """
+
+    # Bounds of a tile, to keep the memory used by a request small
+    MAX_ROWS = 1000
+    MAX_COLUMNS = 100
+
+    @tornado.web.authenticated
+    async def get(self):
+        reader, view = await self.open_view()
+        row = self.get_int_argument("row", 0)
+        rows = self.get_int_argument("rows", 100, self.MAX_ROWS)
+        column = self.get_int_argument("column", 0)
+        columns = self.get_int_argument("columns", 20, self.MAX_COLUMNS)
+        binary = TILE_MEDIA_TYPE in self.request.headers.get("Accept", "")
+        self.set_header("Vary", "Accept")
+        if view is None:
+            data = await self.run_in_thread(
+                reader.read, row, rows, column, columns, binary
+            )
+        else:
+            # Only the rows of the tile are read, in the order of the view
+            data = await self.run_in_thread(
+                reader.read_rows, view[row:row + rows].tolist(), column, columns, binary
+            )
+        if binary:
+            self.finish(
+                encode_tile(row, column, data), set_content_type=TILE_MEDIA_TYPE
+            )
+        else:
+            self.finish(json.dumps({"row": row, "column": column, "data": data}))
+
+
+class CompletionHandler(BaseHandler):
+    """Completes a prefix with the most frequent symbols of the workspace files."""
+
+    # Maximal number of matches returned
+    MAX_LIMIT = 50
+
+    @tornado.web.authenticated
+    async def get(self):
+        prefix = self.get_argument("prefix")
+        limit = self.get_int_argument("limit", 10, self.MAX_LIMIT)
+        symbols = self.settings["jupyterlab_examples_server"]["symbols"]
+        # Take the files modified since the last refresh into account
+        refresh = symbols.schedule_refresh(
+            self.settings["jupyterlab_examples_server"]["thread_pool"],
+            self.settings["jupyterlab_examples_server"]["symbols_max_age"],
+        )
+        if refresh is not None and not symbols.built:
+            # The index is only built once completions are requested
+            await asyncio.wrap_future(refresh)
+        matches = [
+            {"label": label, "count": count}
+            for label, count in symbols.complete(prefix, limit)
+        ]
+        self.finish(json.dumps({"matches": matches}))
+
+
+class LogHandler(BaseHandler):
+    """Adds and reads the entries of a log namespace, kept in a ring buffer."""
+
+    # Maximal number of entries returned at once
+    MAX_LIMIT = 1000
+
+    # Maximal time a request waits for new entries, in seconds
+    MAX_TIMEOUT = 60
+
+    @tornado.web.authenticated
+    async def get(self, namespace):
+        """Returns the entries of at least ``level``.
+
+        Without ``after`` cursor, the latest entries are returned; otherwise the
+        entries following it, waiting up to ``timeout`` seconds for one.
+        """
+        logs = self.settings["jupyterlab_examples_server"]["logs"]
+        level = self.get_argument("level", "debug")
+        if level not in LEVELS:
+            raise tornado.web.HTTPError(400, "Unknown log level: {}".format(level))
+        after = self.get_int_argument("after", None)
+        limit = self.get_int_argument("limit", 100, self.MAX_LIMIT)
+        timeout = self.get_int_argument("timeout", 0, self.MAX_TIMEOUT)
+        try:
+            if after is not None and timeout:
+                await logs.wait(namespace, after, timeout)
+            entries, cursor = logs.read(namespace, after, level, limit)
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, str(e))
+        self.finish(
+            json.dumps(
+                {
+                    "entries": [{"cursor": c, **entry} for c, entry in entries],
+                    "cursor": cursor,
+                }
+            )
+        )
+
+    @tornado.web.authenticated
+    async def post(self, namespace):
+        # The body is an entry {"level", "type", "data"} or a list of entries
+        body = self.get_json_body()
+        logs = self.settings["jupyterlab_examples_server"]["logs"]
+        cursor = None
+        try:
+            for entry in body if isinstance(body, list) else [body]:
+                cursor = logs.log(
+                    namespace, entry["level"], entry["data"], entry.get("type", "text")
+                )
+        except (KeyError, TypeError, ValueError) as e:
+            raise tornado.web.HTTPError(400, "Invalid log entry: {}".format(e))
+        self.finish(json.dumps({"cursor": cursor}))
+
+
+class MetricsHandler(BaseHandler):
+    """Exposes the request metrics in the Prometheus text format."""
+
+    @tornado.web.authenticated
+    async def get(self):
+        metrics = self.settings["jupyterlab_examples_server"]["metrics"]
+        content_type = "text/plain; version=0.0.4; charset=utf-8"
+        self.finish(metrics.render(), set_content_type=content_type)
+
+
+class StateHandler(BaseHandler):
+    """Stores the JupyterLab state database of the frontend.
+
+    A ``GET`` returns all the values at once, optionally only those whose id
+    starts with the ``namespace`` argument, so that the frontend loads them
+    in a single request. A ``POST`` applies a batch of changes,
+    ``{"save": {id: value}, "remove": [id]}``.
+    """
+
+    @tornado.web.authenticated
+    async def get(self):
+        store = self.settings["jupyterlab_examples_server"]["state"]
+        namespace = self.get_argument("namespace", "")
+        values = await self.run_in_thread(store.read, namespace)
+        self.finish(json.dumps({"values": values}))
+
+    @tornado.web.authenticated
+    async def post(self):
+        body = self.get_json_body() or {}
+        save = body.get("save", {})
+        remove = body.get("remove", [])
+        if not (
+            isinstance(save, dict)
+            and all(isinstance(value, str) for value in save.values())
+            and isinstance(remove, list)
+            and all(isinstance(id, str) for id in remove)
+        ):
+            raise tornado.web.HTTPError(
+                400, "The body must be {save: {id: string}, remove: [id]}."
+            )
+        store = self.settings["jupyterlab_examples_server"]["state"]
+        await self.run_in_thread(store.write, save, remove)
+        self.finish(json.dumps({"saved": len(save), "removed": len(remove)}))
+
+
+class ProfileHandler(BaseHandler):
+    """Profiles the server process and returns its stacks in the collapsed format.
+
+    Each line is a ``thread;file:function;...`` stack followed by its number
+    of samples, the input of flame graph tools like ``flamegraph.pl`` or
+    speedscope. The ``duration`` argument is in seconds (at most 60) and the
+    ``interval`` between two samples in milliseconds.
+    """
+
+    # Profiling exposes the code running for all the users: it requires the
+    # same permission as executing code
+    auth_resource = "jupyterlab_examples_server"
+
+    @tornado.web.authenticated
+    @authorized(action="execute")
+    async def get(self):
+        duration = self.get_int_argument("duration", 10, maximum=60)
+        interval = self.get_int_argument("interval", 5, maximum=1000)
+        if interval == 0:
+            raise tornado.web.HTTPError(400, "interval is out of range.")
+        profiler = self.settings["jupyterlab_examples_server"]["profiler"]
+        if profiler.running:
+            raise tornado.web.HTTPError(409, "A profile is already running.")
+        stacks = await profiler.profile(duration, interval / 1000)
+        body = "".join(
+            "{} {}\n".format(stack, count) for stack, count in stacks.most_common()
+        )
+        self.finish(body, set_content_type="text/plain; charset=utf-8")
+
+
+class SlowRequestsHandler(BaseHandler):
+    """Lists the latest slow requests with the stacks captured while they ran."""
+
+    auth_resource = "jupyterlab_examples_server"
+
+    @tornado.web.authenticated
+    @authorized(action="execute")
+    async def get(self):
+        slow_requests = self.settings["jupyterlab_examples_server"]["slow_requests"]
+        self.finish(
+            json.dumps(
+                {
+                    "threshold": slow_requests.threshold,
+                    "requests": slow_requests.records(),
+                }
+            )
+        )
+
+
+async def _get_hello(handler, body):
+    return hello()
+
+
+async def _post_hello(handler, body):
+    if not isinstance(body, dict) or not isinstance(body.get("name"), str):
+        raise tornado.web.HTTPError(400, "The body must be {name: string}.")
+    return await _greet(handler, body["name"])
+
+
+async def _greet(handler, name):
+    # Concurrent requests for the same name share a single computation
+    flights = handler.settings["jupyterlab_examples_server"]["single_flight"]
+    data = await flights.run(
+        ("greetings", name), lambda: handler.run_in_thread(greetings, name)
+    )
+    # Notify the clients listening to the greetings
+    handler.settings["jupyterlab_examples_server"]["push_hub"].publish(
+        "greetings", data
+    )
+    return data
+
+
+# Operations that can be run through the batch endpoint
+BATCH_OPERATIONS = {
+    ("GET", "hello"): _get_hello,
+    ("POST", "hello"): _post_hello,
+}
+
+
 def setup_handlers(web_app):
+    # Sort and filter indexes of the datasets are kept across restarts
+    index_dir = os.getenv(
+        "JLAB_SERVER_EXAMPLE_INDEX_DIR",
+        os.path.join(jupyter_data_dir(), "jupyterlab_examples_server", "indexes"),
+    )
+
+    # State database of the frontend
+    state_path = os.getenv(
+        "JLAB_SERVER_EXAMPLE_STATE_DB",
+        os.path.join(jupyter_data_dir(), "jupyterlab_examples_server", "state.db"),
+    )
+
+    # Bounded pools to run the blocking work of the handlers
+    web_app.settings["jupyterlab_examples_server"] = {
+        "thread_pool": ThreadPoolExecutor(
+            max_workers=int(os.getenv("JLAB_SERVER_EXAMPLE_THREADS", "4")),
+            thread_name_prefix="jupyterlab-examples-server",
+        ),
+        "process_pool": ProcessPoolExecutor(
+            max_workers=int(os.getenv("JLAB_SERVER_EXAMPLE_PROCESSES", "2"))
+        ),
+        "response_cache": ResponseCache(
+            max_size=int(os.getenv("JLAB_SERVER_EXAMPLE_CACHE_SIZE", "10485760")),
+            ttl=float(os.getenv("JLAB_SERVER_EXAMPLE_CACHE_TTL", "60")),
+        ),
+        "datasets": DatasetCache(),
+        "indexes": IndexStore(index_dir),
+        "push_hub": PushHub(),
+        "state": StateStore(state_path),
+        "single_flight": SingleFlight(),
+        "metrics": Metrics(),
+        "profiler": Profiler(),
+        "slow_requests": SlowRequests(
+            threshold=float(os.getenv("JLAB_SERVER_EXAMPLE_SLOW_REQUEST", "1"))
+        ),
+        "logs": LogService(int(os.getenv("JLAB_SERVER_EXAMPLE_LOG_SIZE", "10000"))),
+        "symbols": SymbolIndex(web_app.settings["server_root_dir"]),
+        # Maximal age of the symbol index before it is refreshed, in seconds
+        "symbols_max_age": float(
+            os.getenv("JLAB_SERVER_EXAMPLE_SYMBOLS_MAX_AGE", "10")
+        ),
+    }
+
     host_pattern = ".*$"
 
     base_url = web_app.settings["base_url"]
     # Prepend the base_url so that it works in a JupyterHub setting
     route_pattern = url_path_join(base_url, "jupyterlab-examples-server", "hello")
-    handlers = [(route_pattern, RouteHandler)]
+    hello_limiter = ConcurrencyLimiter(
+        max_concurrent=int(os.getenv("JLAB_SERVER_EXAMPLE_HELLO_CONCURRENCY", "8")),
+        max_queued=int(os.getenv("JLAB_SERVER_EXAMPLE_HELLO_QUEUE", "64")),
+    )
+    handlers = [(route_pattern, RouteHandler, {"limiter": hello_limiter})]
     web_app.add_handlers(host_pattern, handlers)
 
+    batch_pattern = url_path_join(base_url, "jupyterlab-examples-server", "batch")
+    # The batched hello requests take their slots from the hello route
+    batch_options = {"limiters": {"hello": hello_limiter}}
+    web_app.add_handlers(host_pattern, [(batch_pattern, BatchHandler, batch_options)])
+
+    stream_pattern = url_path_join(base_url, "jupyterlab-examples-server", "stream")
+    web_app.add_handlers(host_pattern, [(stream_pattern, StreamHandler)])
+
+    dataset_pattern = url_path_join(base_url, "jupyterlab-examples-server", "dataset")
+    web_app.add_handlers(
+        host_pattern,
+        [
+            (dataset_pattern, DatasetHandler),
+            (url_path_join(dataset_pattern, "tile"), TileHandler),
+        ],
+    )
+
+    metrics_pattern = url_path_join(base_url, "jupyterlab-examples-server", "metrics")
+    web_app.add_handlers(host_pattern, [(metrics_pattern, MetricsHandler)])
+
+    admin_url = url_path_join(base_url, "jupyterlab-examples-server")
+    web_app.add_handlers(
+        host_pattern,
+        [
+            (url_path_join(admin_url, "profile"), ProfileHandler),
+            (url_path_join(admin_url, "slow-requests"), SlowRequestsHandler),
+        ],
+    )
+
+    state_pattern = url_path_join(base_url, "jupyterlab-examples-server", "state")
+    web_app.add_handlers(host_pattern, [(state_pattern, StateHandler)])
+
+    logs_pattern = url_path_join(base_url, "jupyterlab-examples-server", "logs")
+    web_app.add_handlers(host_pattern, [(logs_pattern + "/([^/]+)", LogHandler)])
+
+    complete_pattern = url_path_join(base_url, "jupyterlab-examples-server", "complete")
+    web_app.add_handlers(host_pattern, [(complete_pattern, CompletionHandler)])
+
+    ws_pattern = url_path_join(base_url, "jupyterlab-examples-server", "ws")
+    push_options = {
+        "hub": web_app.settings["jupyterlab_examples_server"]["push_hub"],
+        # Maximal number of messages waiting to be sent to a client
+        "max_queued": int(os.getenv("JLAB_SERVER_EXAMPLE_PUSH_QUEUE", "256")),
+    }
+    web_app.add_handlers(host_pattern, [(ws_pattern, PushHandler, push_options)])
+
     # Prepend the base_url so that it works in a JupyterHub setting
     doc_url = url_path_join(base_url, "jupyterlab-examples-server", "public")
     doc_dir = os.getenv(
         "JLAB_SERVER_EXAMPLE_STATIC_DIR",
         os.path.join(os.path.dirname(__file__), "public"),
     )
-    handlers = [("{}/(.*)".format(doc_url), StaticFileHandler, {"path": doc_dir})]
+    # Cache lifetime of the hashed assets, in seconds
+    max_age = int(os.getenv("JLAB_SERVER_EXAMPLE_STATIC_MAX_AGE", "31536000"))
+    handlers = [
+        (
+            "{}/(.*)".format(doc_url),
+            StaticAssetHandler,
+            {"path": doc_dir, "max_age": max_age},
+        )
+    ]
     web_app.add_handlers(host_pattern, handlers)
+    # Build the compressed versions of the static files in the background
+    web_app.settings["jupyterlab_examples_server"]["thread_pool"].submit(
+        precompress, doc_dir
+    )
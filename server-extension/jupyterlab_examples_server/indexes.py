@@ -0,0 +1,240 @@
+import array
+import hashlib
+import json
+import mmap
+import operator
+import os
+import threading
+from collections import OrderedDict
+
+from .datasets import CsvReader
+
+try:
+    import numpy as np
+except ImportError:
+    # The indexes of numeric columns are built without vectorization
+    np = None
+
+# Operators of the filters, called with the value of a cell and the filter value
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "contains": lambda value, text: text in str(value),
+}
+
+# Number of rows read at once to build an index
+CHUNK_ROWS = 100000
+
+
+def is_missing(value):
+    # Missing numbers are NaN
+    return value is None or value != value
+
+
+def read_column(reader, column):
+    """Reads a whole column, as an array of doubles if all its values are numbers."""
+    chunks = []
+    for row in range(0, reader.row_count, CHUNK_ROWS):
+        chunk = reader.read(row, CHUNK_ROWS, column, 1, typed=True)[0]
+        if isinstance(chunk, list):
+            # Not a numeric column, read it as text
+            return [
+                value
+                for row in range(0, reader.row_count, CHUNK_ROWS)
+                for value in reader.read(row, CHUNK_ROWS, column, 1)[0]
+            ]
+        chunks.append(chunk)
+    values = array.array("d")
+    for chunk in chunks:
+        values.frombytes(memoryview(chunk).cast("B"))
+    return values
+
+
+def sort_rows(reader, column, descending=False):
+    """Returns the row numbers sorted by the values of a column, missing ones last."""
+    values = read_column(reader, column)
+    if np is not None and isinstance(values, array.array):
+        data = np.frombuffer(values, dtype=np.float64)
+        missing = np.isnan(data)
+        present = np.flatnonzero(~missing)
+        # Stable, like list.sort, also in descending order
+        keys = -data[present] if descending else data[present]
+        order = present[np.argsort(keys, kind="stable")]
+        rows = np.concatenate([order, np.flatnonzero(missing)])
+        return array.array("q", rows.astype(np.int64).tobytes())
+    rows = [row for row in range(len(values)) if not is_missing(values[row])]
+    rows.sort(key=values.__getitem__, reverse=descending)
+    rows.extend(row for row in range(len(values)) if is_missing(values[row]))
+    return array.array("q", rows)
+
+
+def filter_rows(reader, column, operator_name, value):
+    """Returns a bitmap of the rows whose value in a column matches a filter."""
+    compare = OPERATORS.get(operator_name)
+    if compare is None:
+        raise ValueError("Unknown filter operator: {}".format(operator_name))
+    values = read_column(reader, column)
+    if isinstance(values, array.array) and operator_name != "contains":
+        value = float(value)
+        if np is not None:
+            data = np.frombuffer(values, dtype=np.float64)
+            matches = compare(data, value) & ~np.isnan(data)
+            bits = np.packbits(matches, bitorder="little")
+            return array.array("B", bits.tobytes())
+    bitmap = array.array("B", bytes((len(values) + 7) // 8))
+    for row, cell in enumerate(values):
+        if not is_missing(cell) and compare(cell, value):
+            bitmap[row >> 3] |= 1 << (row & 7)
+    return bitmap
+
+
+class IndexStore:
+    """Sort and filter indexes of datasets, persisted in a directory.
+
+    An index is an array of row numbers, or a bitmap of rows, written to a file
+    named after the path, modification time and size of the dataset and the
+    parameters of the index: it is reused across server restarts and never
+    stale. Writing an index for a new version of a dataset deletes the indexes
+    of its previous versions. Index files are memory mapped, so looking up the
+    rows of a tile only loads the pages containing them.
+    """
+
+    def __init__(self, directory, max_open=32):
+        """
+        Parameters
+        ----------
+        directory: str
+            Directory of the index files, created if needed
+        max_open: int
+            Maximal number of index files kept open
+        """
+        self.directory = directory
+        self.max_open = max_open
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def view(self, reader, path, sort=None, descending=False, filters=()):
+        """Returns the row numbers of a sorted and filtered view of a dataset.
+
+        Parameters
+        ----------
+        reader:
+            Reader of the dataset, see ``datasets.READERS``
+        path: str
+            Path of the dataset
+        sort: int or None
+            Index of the column to sort the rows on
+        descending: bool
+            Whether to sort the rows in descending order
+        filters: list of (int, str, str)
+            Index of a column, operator (a key of ``OPERATORS``) and value
+            that the rows must match
+
+        Returns
+        -------
+        The row numbers of the view, or None if it is the dataset itself.
+        """
+        if sort is None and not filters:
+            return None
+        if isinstance(reader, CsvReader) and reader.line_offsets is None:
+            # The rows of a view are read in any order
+            reader.line_offsets = self._get(path, ["lines"], reader.line_starts)
+        filters = sorted(filters)
+
+        def build():
+            rows = range(reader.row_count)
+            if sort is not None:
+                rows = self._get(
+                    path,
+                    ["sort", sort, descending],
+                    lambda: sort_rows(reader, sort, descending),
+                )
+            bitmaps = [
+                self._get(
+                    path, ["filter", *f], lambda f=f: filter_rows(reader, *f), "B"
+                )
+                for f in filters
+            ]
+            if np is not None and reader.row_count:
+                if sort is None:
+                    rows = np.arange(reader.row_count, dtype=np.int64)
+                else:
+                    rows = np.frombuffer(rows, dtype=np.int64)
+                for bitmap in bitmaps:
+                    matches = np.unpackbits(
+                        np.frombuffer(bitmap, dtype=np.uint8),
+                        count=reader.row_count,
+                        bitorder="little",
+                    )
+                    rows = rows[matches[rows].astype(bool)]
+                return array.array("q", rows.tobytes())
+            return array.array(
+                "q",
+                (
+                    row
+                    for row in rows
+                    if all(bitmap[row >> 3] >> (row & 7) & 1 for bitmap in bitmaps)
+                ),
+            )
+
+        return self._get(path, ["view", sort, descending, filters], build)
+
+    def _get(self, path, key, build, typecode="q"):
+        # Returns the index identified by key, building and saving it if needed
+        stat = os.stat(path)
+        # <path>-<version of the dataset>-<parameters of the index>.idx
+        name = "-".join(
+            hashlib.sha1(json.dumps(part).encode()).hexdigest()[:16]
+            for part in [os.path.realpath(path), [stat.st_mtime_ns, stat.st_size], key]
+        )
+        index_path = os.path.join(self.directory, name + ".idx")
+        with self._lock:
+            index = self._indexes.get(index_path)
+            if index is not None:
+                self._indexes.move_to_end(index_path)
+                return index
+
+        if not os.path.exists(index_path):
+            values = build()
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first, so a concurrent request never
+            # reads a partially written index
+            tmp_path = "{}.tmp{}".format(index_path, threading.get_ident())
+            with open(tmp_path, "wb") as f:
+                values.tofile(f)
+            os.replace(tmp_path, index_path)
+            self._remove_previous_versions(name)
+
+        with open(index_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # An empty file cannot be memory mapped
+                index = memoryview(array.array(typecode))
+            else:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                index = memoryview(content).cast(typecode)
+        with self._lock:
+            self._indexes[index_path] = index
+            while len(self._indexes) > self.max_open:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _remove_previous_versions(self, name):
+        # Deletes the indexes of the other versions of the dataset of an index
+        path_hash, version_hash, _ = name.split("-")
+        prefix = path_hash + "-"
+        for entry in os.listdir(self.directory):
+            if not entry.startswith(prefix) or not entry.endswith(".idx"):
+                continue
+            if entry.split("-")[1] == version_hash:
+                continue
+            with self._lock:
+                self._indexes.pop(os.path.join(self.directory, entry), None)
+            try:
+                os.remove(os.path.join(self.directory, entry))
+            except OSError:
+                # Already removed by another request, or still mapped on Windows
+                pass
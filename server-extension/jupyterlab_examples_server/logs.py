@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+# Log levels of the JupyterLab log console, from the least to the most severe
+LEVELS = ("debug", "info", "warning", "error", "critical")
+
+
+class LogRing:
+    """Fixed-size ring buffer of log entries.
+
+    Each entry is numbered by a cursor increasing from 1; once the buffer is
+    full, a new entry replaces the oldest one. The levels are kept in a
+    separate byte array to filter the entries without reading them.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        # Cursor of the latest entry, 0 if there is none
+        self.cursor = 0
+        self._entries = [None] * capacity
+        self._levels = bytearray(capacity)
+
+    def append(self, level, entry):
+        """Adds an entry of the given level and returns its cursor."""
+        self.cursor += 1
+        index = self.cursor % self.capacity
+        self._entries[index] = entry
+        self._levels[index] = LEVELS.index(level)
+        return self.cursor
+
+    def read(self, after=None, level="debug", limit=1000):
+        """Returns the entries of at least the given level.
+
+        Parameters
+        ----------
+        after: int or None
+            Cursor after which the entries are returned, in order; if None, the
+            last ``limit`` entries are returned. A cursor ahead of the latest
+            entry, e.g. kept by a client across a server restart, reads from
+            the oldest entry
+        level: str
+            Minimal level of the entries
+        limit: int
+            Maximal number of entries
+
+        Returns
+        -------
+        The list of ``(cursor, entry)`` pairs and the cursor to read the next
+        entries from.
+        """
+        rank = LEVELS.index(level)
+        oldest = max(1, self.cursor - self.capacity + 1)
+        if after is not None and after > self.cursor:
+            after = 0
+        if after is None:
+            # Scan backward from the latest entry
+            cursors = range(self.cursor, oldest - 1, -1)
+        else:
+            cursors = range(max(after + 1, oldest), self.cursor + 1)
+
+        entries = []
+        next_cursor = self.cursor if after is None else after
+        for cursor in cursors:
+            if len(entries) == limit:
+                break
+            index = cursor % self.capacity
+            if self._levels[index] >= rank:
+                entries.append((cursor, self._entries[index]))
+            if after is not None:
+                next_cursor = cursor
+        if after is None:
+            entries.reverse()
+        return entries, next_cursor
+
+
+class LogService:
+    """Log entries of several namespaces, each kept in a bounded ring buffer.
+
+    Its methods must be called from the IOLoop thread.
+    """
+
+    def __init__(self, capacity=10000, max_namespaces=100):
+        """
+        Parameters
+        ----------
+        capacity: int
+            Number of entries kept per namespace
+        max_namespaces: int
+            Maximal number of namespaces
+        """
+        self.capacity = capacity
+        self.max_namespaces = max_namespaces
+        self._rings = {}
+        # Set when an entry is added to the namespace
+        self._events = {}
+        # Number of requests waiting on the event of the namespace
+        self._waiters = {}
+
+    def read(self, namespace, after=None, level="debug", limit=1000):
+        """Returns the entries of a namespace, see ``LogRing.read``.
+
+        A namespace without entries reads as an empty ring; reading does not
+        create it, so that only ``log`` counts towards ``max_namespaces``.
+        """
+        ring = self._rings.get(namespace)
+        if ring is None:
+            return [], 0
+        return ring.read(after, level, limit)
+
+    def log(self, namespace, level, data, type="text"):
+        """Adds an entry to a namespace and returns its cursor.
+
+        ``type`` and ``data`` follow the log messages of the JupyterLab log
+        console: ``text`` or ``html`` with a string, or ``output`` with a
+        notebook output.
+        """
+        if level not in LEVELS:
+            raise ValueError("Unknown log level: {}".format(level))
+        entry = {"time": time.time(), "level": level, "type": type, "data": data}
+        ring = self._rings.get(namespace)
+        if ring is None:
+            if len(self._rings) >= self.max_namespaces:
+                raise ValueError("Too many log namespaces.")
+            ring = self._rings[namespace] = LogRing(self.capacity)
+        cursor = ring.append(level, entry)
+        event = self._events.pop(namespace, None)
+        if event is not None:
+            event.set()
+        return cursor
+
+    async def wait(self, namespace, after, timeout):
+        """Waits until an entry is added after the cursor, at most timeout seconds."""
+        # A cursor ahead of the ring, see ``LogRing.read``, is answered right away
+        ring = self._rings.get(namespace)
+        if (ring.cursor if ring is not None else 0) != after:
+            return
+        event = self._events.setdefault(namespace, asyncio.Event())
+        self._waiters[namespace] = self._waiters.get(namespace, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters[namespace] -= 1
+            if not self._waiters[namespace]:
+                # Don't keep an event per namespace polled in vain
+                del self._waiters[namespace]
+                self._events.pop(namespace, None)
@@ -0,0 +1,135 @@
+import bisect
+import time
+from collections import defaultdict
+
+from tornado.escape import utf8
+
+# Prefix of the metric names
+PREFIX = "jupyterlab_examples_server"
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+
+class Histogram:
+    """Counts of observed values per bucket, with their sum."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # The last count is for the values above the largest bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Metrics:
+    """Request metrics of the handlers, rendered in the Prometheus text format.
+
+    Recording a request only updates a few counters, so it can stay enabled
+    in production.
+    """
+
+    def __init__(self):
+        self.latency = defaultdict(Histogram)
+        self.requests = defaultdict(int)
+        self.in_flight = defaultdict(int)
+        self.bytes_in = defaultdict(int)
+        self.bytes_out = defaultdict(int)
+
+    def render(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def header(name, kind, description):
+            lines.append("# HELP {}_{} {}".format(PREFIX, name, description))
+            lines.append("# TYPE {}_{} {}".format(PREFIX, name, kind))
+
+        def sample(name, labels, value):
+            formatted = ",".join('{}="{}"'.format(k, v) for k, v in labels)
+            lines.append("{}_{}{{{}}} {}".format(PREFIX, name, formatted, value))
+
+        header("request_duration_seconds", "histogram", "Request latency.")
+        for (handler, method), histogram in sorted(self.latency.items()):
+            labels = [("handler", handler), ("method", method)]
+            cumulated = 0
+            bounds = histogram.buckets + ("+Inf",)
+            for bound, count in zip(bounds, histogram.counts):
+                cumulated += count
+                bucket_labels = labels + [("le", bound)]
+                sample("request_duration_seconds_bucket", bucket_labels, cumulated)
+            sample("request_duration_seconds_sum", labels, histogram.sum)
+            sample("request_duration_seconds_count", labels, cumulated)
+
+        header("requests_total", "counter", "Finished requests.")
+        for (handler, method, code), count in sorted(self.requests.items()):
+            labels = [("handler", handler), ("method", method), ("code", code)]
+            sample("requests_total", labels, count)
+
+        header("requests_in_flight", "gauge", "Requests being processed.")
+        for handler, count in sorted(self.in_flight.items()):
+            sample("requests_in_flight", [("handler", handler)], count)
+
+        header("request_bytes_total", "counter", "Size of the request bodies.")
+        for handler, size in sorted(self.bytes_in.items()):
+            sample("request_bytes_total", [("handler", handler)], size)
+
+        header("response_bytes_total", "counter", "Size of the response bodies.")
+        for handler, size in sorted(self.bytes_out.items()):
+            sample("response_bytes_total", [("handler", handler)], size)
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMixin:
+    """Records the latency, size and status of the requests of a handler.
+
+    The slow requests are also recorded, see ``profiler.SlowRequests``.
+
+    Mix it in before the Tornado handler class; the metrics are labelled with
+    ``metrics_name``, the handler class name by default.
+    """
+
+    metrics_name = None
+
+    _metrics_start = None
+    _metrics_bytes_out = 0
+
+    def prepare(self):
+        settings = self.settings["jupyterlab_examples_server"]
+        self._metrics_start = time.perf_counter()
+        settings["metrics"].in_flight[self._metrics_label()] += 1
+        settings["slow_requests"].start(
+            id(self), "{} {}".format(self.request.method, self.request.uri)
+        )
+        return super().prepare()
+
+    def write(self, chunk):
+        if isinstance(chunk, (bytes, str)):
+            chunk = utf8(chunk)
+            self._metrics_bytes_out += len(chunk)
+        return super().write(chunk)
+
+    def on_finish(self):
+        super().on_finish()
+        start = self._metrics_start
+        if start is None:
+            # The request failed before being prepared
+            return
+        settings = self.settings["jupyterlab_examples_server"]
+        settings["slow_requests"].finish(id(self))
+        metrics = settings["metrics"]
+        label = self._metrics_label()
+        method = self.request.method
+        metrics.in_flight[label] -= 1
+        metrics.latency[(label, method)].observe(time.perf_counter() - start)
+        metrics.requests[(label, method, str(self.get_status()))] += 1
+        metrics.bytes_in[label] += len(self.request.body or b"")
+        metrics.bytes_out[label] += self._metrics_bytes_out
+
+    def _metrics_label(self):
+        return self.metrics_name or type(self).__name__
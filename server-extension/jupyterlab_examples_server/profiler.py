@@ -0,0 +1,165 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+
+def collapse(frame):
+    """Returns a stack as ``file:function`` frames from the root, joined by ``;``."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            "{}:{}".format(os.path.basename(code.co_filename), code.co_name)
+        )
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+def thread_stacks(exclude=()):
+    """Returns the collapsed stack of each thread, prefixed by the thread name."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    return {
+        ident: "{};{}".format(names.get(ident, ident), collapse(frame))
+        for ident, frame in sys._current_frames().items()
+        if ident not in exclude
+    }
+
+
+class Profiler:
+    """Statistical profiler of all the threads of the server process.
+
+    A thread samples the stacks of the other threads at a fixed interval;
+    the result counts the samples of each stack, in the collapsed format of
+    the flame graph tools. The profiled code is not instrumented, so it runs
+    at full speed; the cost is the sampling thread holding the GIL for a few
+    microseconds per thread and sample.
+    """
+
+    def __init__(self):
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    async def profile(self, duration, interval):
+        """Samples the stacks for ``duration`` seconds, every ``interval`` seconds.
+
+        Only one profile can run at a time.
+
+        Returns
+        -------
+        A ``Counter`` of the collapsed stacks.
+        """
+        if self._running:
+            raise RuntimeError("A profile is already running.")
+        self._running = True
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def run():
+            try:
+                result = self._sample(duration, interval)
+            except Exception as e:
+                loop.call_soon_threadsafe(future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(future.set_result, result)
+
+        thread = threading.Thread(
+            target=run, name="jupyterlab-examples-server-profiler", daemon=True
+        )
+        thread.start()
+        try:
+            return await future
+        finally:
+            self._running = False
+
+    def _sample(self, duration, interval):
+        stacks = Counter()
+        own = {threading.get_ident()}
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            stacks.update(thread_stacks(exclude=own).values())
+            time.sleep(interval)
+        return stacks
+
+
+class SlowRequests:
+    """Rolling record of the latest requests slower than a threshold.
+
+    A watchdog thread captures the stacks of all the threads once for each
+    request running longer than the threshold: they show what blocked the
+    IOLoop or the executors while the request was waiting.
+    """
+
+    # Minimal time between two checks of the watchdog, in seconds, so that a
+    # threshold of 0 (recording every request) does not make it spin
+    MIN_POLL_INTERVAL = 0.01
+
+    def __init__(self, threshold=1.0, capacity=20):
+        """
+        Parameters
+        ----------
+        threshold: float
+            Duration above which a request is recorded, in seconds
+        capacity: int
+            Number of slow requests kept
+        """
+        self.threshold = threshold
+        self._records = deque(maxlen=capacity)
+        # Requests in progress, by key: [description, start, stacks]
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="jupyterlab-examples-server-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def start(self, key, description):
+        with self._lock:
+            self._in_flight[key] = [description, time.perf_counter(), None]
+
+    def finish(self, key):
+        with self._lock:
+            request = self._in_flight.pop(key, None)
+        if request is None:
+            return
+        description, start, stacks = request
+        duration = time.perf_counter() - start
+        if duration >= self.threshold:
+            self._records.append(
+                {
+                    "request": description,
+                    "time": time.time(),
+                    "duration": duration,
+                    "stacks": stacks or [],
+                }
+            )
+
+    def records(self):
+        """Returns the recorded requests, the slowest first."""
+        return sorted(self._records, key=lambda r: r["duration"], reverse=True)
+
+    def stop(self):
+        self._stopped.set()
+
+    def _watch(self):
+        own = {threading.get_ident()}
+        interval = max(self.threshold / 4, self.MIN_POLL_INTERVAL)
+        while not self._stopped.wait(interval):
+            now = time.perf_counter()
+            with self._lock:
+                late = [
+                    request
+                    for request in self._in_flight.values()
+                    if request[2] is None and now - request[1] >= self.threshold
+                ]
+            if late:
+                stacks = sorted(thread_stacks(exclude=own).values())
+                for request in late:
+                    request[2] = stacks
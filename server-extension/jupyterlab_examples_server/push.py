@@ -0,0 +1,149 @@
+import asyncio
+import json
+import struct
+from collections import OrderedDict, defaultdict
+
+from jupyter_core.utils import ensure_async
+from jupyter_server.auth.decorator import ws_authenticated
+from jupyter_server.base.handlers import JupyterHandler
+from tornado import web, websocket
+
+
+def encode_binary(topic, payload):
+    """Frames a binary message: the topic length (16-bit little-endian), the
+    UTF-8 topic, then the payload."""
+    encoded = topic.encode()
+    return struct.pack("<H", len(encoded)) + encoded + bytes(payload)
+
+
+class PushHub:
+    """Fans out the messages published on a topic to the subscribed clients."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, topic, client):
+        self._subscribers[topic].add(client)
+
+    def unsubscribe(self, topic, client):
+        subscribers = self._subscribers.get(topic)
+        if subscribers is not None:
+            subscribers.discard(client)
+            if not subscribers:
+                del self._subscribers[topic]
+
+    def subscriber_count(self, topic):
+        return len(self._subscribers.get(topic, ()))
+
+    def publish(self, topic, data, key=None):
+        """Sends a message to the subscribers of a topic.
+
+        Parameters
+        ----------
+        topic: str
+            Topic of the message
+        data:
+            JSON-serializable message, or bytes sent as a binary frame
+        key: str or None
+            Coalescing key: a message still queued for a slow client is
+            replaced by a newer message of the same topic and key
+        """
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+        # Serialize once for all the subscribers
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            message, binary = encode_binary(topic, data), True
+        else:
+            message, binary = json.dumps({"topic": topic, "data": data}), False
+        for client in list(subscribers):
+            client.enqueue((topic, key), message, binary)
+
+
+class PushHandler(JupyterHandler, websocket.WebSocketHandler):
+    """WebSocket channel pushing the messages of the subscribed topics.
+
+    Clients send ``{"action": "subscribe" | "unsubscribe", "topic": ...}``.
+    Each client has a send queue of at most ``max_queued`` messages: when it
+    reads slower than messages are published, messages with a coalescing key
+    replace the queued ones and the oldest messages are dropped, so a slow
+    client never makes the server buffer without bound.
+    """
+
+    auth_resource = "jupyterlab_examples_server"
+
+    def initialize(self, hub, max_queued=256):
+        self.hub = hub
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._topics = set()
+        self._queue = OrderedDict()
+        self._counter = 0
+        self._wake = asyncio.Event()
+        self._writer = None
+
+    @ws_authenticated
+    async def get(self, *args, **kwargs):
+        user = self.current_user
+        authorized = await ensure_async(
+            self.authorizer.is_authorized(self, user, "read", self.auth_resource)
+        )
+        if not authorized:
+            raise web.HTTPError(403)
+        result = super().get(*args, **kwargs)
+        if result is not None:
+            await result
+
+    def open(self):
+        self._writer = asyncio.ensure_future(self._write_queued())
+
+    def on_message(self, message):
+        try:
+            request = json.loads(message)
+            action, topic = request["action"], str(request["topic"])
+        except (ValueError, KeyError, TypeError):
+            self.log.warning("Invalid push channel message: %s", message)
+            return
+        if action == "subscribe":
+            self._topics.add(topic)
+            self.hub.subscribe(topic, self)
+        elif action == "unsubscribe":
+            self._topics.discard(topic)
+            self.hub.unsubscribe(topic, self)
+
+    def on_close(self):
+        for topic in self._topics:
+            self.hub.unsubscribe(topic, self)
+        self._topics.clear()
+        self._queue.clear()
+        if self._writer is not None:
+            self._writer.cancel()
+
+    def enqueue(self, key, message, binary=False):
+        """Queues a message, coalescing or dropping messages if the queue is full."""
+        if key[1] is None:
+            # Messages without coalescing key are never replaced
+            self._counter += 1
+            key = (key[0], self._counter)
+        if key in self._queue:
+            # Keep the position of the replaced message to not starve it
+            self._queue[key] = (message, binary)
+        else:
+            if len(self._queue) >= self.max_queued:
+                self._queue.popitem(last=False)
+                self.dropped += 1
+            self._queue[key] = (message, binary)
+        self._wake.set()
+
+    async def _write_queued(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self._queue:
+                _, (message, binary) = self._queue.popitem(last=False)
+                try:
+                    # Wait for the message to be sent, so that the next ones
+                    # stay in the bounded queue rather than in the socket buffer
+                    await self.write_message(message, binary=binary)
+                except websocket.WebSocketClosedError:
+                    return
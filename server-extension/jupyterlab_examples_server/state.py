@@ -0,0 +1,62 @@
+import os
+import sqlite3
+import threading
+
+
+class StateStore:
+    """Key-value store of the JupyterLab state database, kept in SQLite.
+
+    The values are the strings serialized by the frontend ``StateDB``; they
+    are stored as is. A batch of changes is written in a single transaction,
+    and the database runs in WAL mode so that a write only appends to its
+    log. The methods can be called from several threads.
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the SQLite database, created if it does not exist
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS state "
+                "(id TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def close(self):
+        self._db.close()
+
+    def read(self, namespace=""):
+        """Returns the values of the ids starting with ``namespace``, by id."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, value FROM state WHERE substr(id, 1, ?) = ? ORDER BY id",
+                (len(namespace), namespace),
+            ).fetchall()
+        return dict(rows)
+
+    def write(self, save=None, remove=()):
+        """Saves and removes values in a single transaction.
+
+        Parameters
+        ----------
+        save: dict or None
+            Values to save, by id
+        remove: list
+            Ids of the values to remove
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM state WHERE id = ?", [(id,) for id in remove]
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO state (id, value) VALUES (?, ?)",
+                list((save or {}).items()),
+            )
@@ -0,0 +1,172 @@
+import gzip
+import mimetypes
+import mmap
+import os
+import re
+
+from tornado.web import StaticFileHandler
+
+from .metrics import MetricsMixin
+
+try:
+    import brotli
+except ImportError:
+    # Brotli is optional, only gzip siblings are built without it
+    brotli = None
+
+
+# Files larger than this are read through a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Files smaller than this are not worth compressing
+MIN_COMPRESSED_SIZE = 1024
+
+COMPRESSIBLE_TYPES = re.compile(
+    r"^(text/.*|application/(javascript|json|wasm|xml)|image/svg\+xml)$"
+)
+
+
+def get_encodings():
+    """Returns the (Content-Encoding, suffix) pairs available, preferred first."""
+    encodings = [("gzip", ".gz")]
+    if brotli is not None:
+        encodings.insert(0, ("br", ".br"))
+    return encodings
+
+
+def is_compressible(path):
+    """Whether serving a compressed version of the file is worth it."""
+    mime_type, encoding = mimetypes.guess_type(path)
+    return (
+        encoding is None
+        and mime_type is not None
+        and COMPRESSIBLE_TYPES.match(mime_type) is not None
+        and os.path.getsize(path) >= MIN_COMPRESSED_SIZE
+    )
+
+
+def is_fresh(compressed, path):
+    """Whether the compressed sibling exists and is newer than the file."""
+    try:
+        return os.path.getmtime(compressed) >= os.path.getmtime(path)
+    except OSError:
+        return False
+
+
+def compress(path, encoding):
+    """Writes the compressed sibling of a file, e.g. ``main.js.gz``."""
+    suffix = dict(get_encodings())[encoding]
+    with open(path, "rb") as f:
+        data = f.read()
+    if encoding == "br":
+        data = brotli.compress(data)
+    else:
+        data = gzip.compress(data, mtime=0)
+    # Write to a temporary file first, so a concurrent request never
+    # serves a partially written sibling
+    tmp_path = "{}{}.tmp{}".format(path, suffix, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path + suffix)
+
+
+def precompress(root):
+    """Builds the missing or outdated compressed siblings of the files in root."""
+    suffixes = tuple(suffix for _, suffix in get_encodings())
+    for directory, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(directory, name)
+            if name.endswith(suffixes) or not is_compressible(path):
+                continue
+            for encoding, suffix in get_encodings():
+                if not is_fresh(path + suffix, path):
+                    try:
+                        compress(path, encoding)
+                    except OSError:
+                        # e.g. the directory is read-only
+                        return
+
+
+class StaticAssetHandler(MetricsMixin, StaticFileHandler):
+    """Static file handler tuned for large, rarely changing assets.
+
+    - Files whose name contains a content hash are cached by browsers for ``max_age``.
+    - A precompressed ``.br``/``.gz`` sibling is served when the client accepts
+      it; missing siblings are built in the background on first hit.
+    - Large files are read through a memory map.
+    - Its requests are recorded in the metrics, see ``MetricsMixin``.
+    """
+
+    # File names containing a content hash, e.g. main.3f2a9c1b.js
+    HASHED_NAME = re.compile(r"[.-][0-9a-f]{8,}\.\w+$")
+
+    # Compressions scheduled but not finished yet
+    _pending = set()
+
+    def initialize(self, path, default_filename=None, max_age=0):
+        super().initialize(path, default_filename)
+        self.max_age = max_age
+        self.original_path = None
+
+    def get_cache_time(self, path, modified, mime_type):
+        if self.HASHED_NAME.search(path):
+            return self.max_age
+        return super().get_cache_time(path, modified, mime_type)
+
+    def validate_absolute_path(self, root, absolute_path):
+        absolute_path = super().validate_absolute_path(root, absolute_path)
+        self.original_path = absolute_path
+        if absolute_path is None or not is_compressible(absolute_path):
+            return absolute_path
+
+        self.set_header("Vary", "Accept-Encoding")
+        accepted = {
+            token.split(";")[0].strip()
+            for token in self.request.headers.get("Accept-Encoding", "").split(",")
+        }
+        for encoding, suffix in get_encodings():
+            if encoding not in accepted:
+                continue
+            if is_fresh(absolute_path + suffix, absolute_path):
+                self.set_header("Content-Encoding", encoding)
+                # Tornado caches the stat result of the validated path
+                self._stat_result = os.stat(absolute_path + suffix)
+                return absolute_path + suffix
+            self._schedule_compression(absolute_path, encoding)
+        return absolute_path
+
+    def get_content_type(self):
+        mime_type, encoding = mimetypes.guess_type(self.original_path)
+        if encoding is not None:
+            # A compressed file requested as such, e.g. main.js.gz, is served as is
+            return super().get_content_type()
+        # The type of the original file, not of its compressed sibling
+        return mime_type or "application/octet-stream"
+
+    @classmethod
+    def get_content(cls, abspath, start=None, end=None):
+        size = os.path.getsize(abspath)
+        if size < MMAP_THRESHOLD:
+            yield from super().get_content(abspath, start, end)
+            return
+
+        start = start or 0
+        end = size if end is None else end
+        with open(abspath, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for position in range(start, end, MMAP_THRESHOLD):
+                    yield content[position:min(position + MMAP_THRESHOLD, end)]
+
+    def _schedule_compression(self, path, encoding):
+        if (path, encoding) in self._pending:
+            return
+        self._pending.add((path, encoding))
+        executor = self.settings["jupyterlab_examples_server"]["thread_pool"]
+        future = executor.submit(compress, path, encoding)
+
+        def done(future):
+            # Keep failed compressions as pending to not retry them on every hit
+            if future.exception() is None:
+                self._pending.discard((path, encoding))
+
+        future.add_done_callback(done)
@@ -0,0 +1,207 @@
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+# Identifiers of most programming languages
+SYMBOL = re.compile(r"[A-Za-z_][A-Za-z0-9_]{2,}")
+
+# Extensions of the files whose symbols are indexed
+SOURCE_EXTENSIONS = {
+    ".c", ".cpp", ".go", ".h", ".java", ".js", ".jsx", ".md", ".py", ".r",
+    ".rs", ".scala", ".sql", ".ts", ".tsx",
+}
+
+# Directories that are never indexed
+IGNORED_DIRECTORIES = {"node_modules", "__pycache__", "site-packages"}
+
+# Files larger than this are not indexed
+MAX_FILE_SIZE = 1024 * 1024
+
+
+def read_symbols(path):
+    """Counts the occurrences of each symbol of a file."""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        return Counter(SYMBOL.findall(f.read()))
+
+
+class _Node:
+    __slots__ = ("children", "count", "symbol", "top")
+
+    def __init__(self):
+        self.children = {}
+        # Number of occurrences of the symbol ending at this node
+        self.count = 0
+        self.symbol = None
+        # Best (count, symbol) pairs of the subtree, None when outdated
+        self.top = None
+
+
+class SymbolTrie:
+    """Prefix tree of symbols ranked by their number of occurrences.
+
+    Each node caches the ``max_results`` most frequent symbols of its subtree.
+    Updating a symbol only invalidates the caches of the nodes on its path,
+    which are computed again from the caches of their children on the next
+    query, so queries take a time proportional to the prefix length once the
+    caches are warm.
+    """
+
+    def __init__(self, max_results=50):
+        self.max_results = max_results
+        self._root = _Node()
+
+    def add(self, symbol, count):
+        """Adds (or removes, if count is negative) occurrences of a symbol.
+
+        The nodes left without any symbol in their subtree are removed, with
+        their caches, so that the trie only holds the current symbols.
+        """
+        path = [self._root]
+        for character in symbol:
+            child = path[-1].children.get(character)
+            if child is None:
+                if count <= 0:
+                    # The symbol has no occurrences to remove
+                    return
+                child = path[-1].children[character] = _Node()
+            path.append(child)
+        node = path[-1]
+        node.count = max(0, node.count + count)
+        node.symbol = symbol if node.count else None
+        for current in path:
+            current.top = None
+        # Remove the empty nodes from the leaf up
+        for depth in range(len(symbol), 0, -1):
+            if path[depth].count or path[depth].children:
+                break
+            del path[depth - 1].children[symbol[depth - 1]]
+
+    def complete(self, prefix, limit=10):
+        """Returns the most frequent symbols starting with prefix, as
+        ``(symbol, count)`` pairs."""
+        node = self._root
+        for character in prefix:
+            node = node.children.get(character)
+            if node is None:
+                return []
+        return [(symbol, -count) for count, symbol in self._top(node)[:limit]]
+
+    def _top(self, node):
+        # The outdated caches are computed children first, without recursion
+        # since a symbol may be longer than the recursion limit
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current.top is not None:
+                continue
+            if not expanded:
+                stack.append((current, True))
+                stack.extend((child, False) for child in current.children.values())
+                continue
+            # Pairs of negated count and symbol, to sort by decreasing count
+            candidates = [(-current.count, current.symbol)] if current.count else []
+            for child in current.children.values():
+                candidates.extend(child.top)
+            current.top = heapq.nsmallest(self.max_results, candidates)
+        return node.top
+
+
+class SymbolIndex:
+    """Index of the symbols of the source files of a directory.
+
+    ``refresh`` only reads the files modified since the previous refresh and
+    updates the trie with the difference of their symbol counts.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.trie = SymbolTrie()
+        # Modification time and symbol counts of each indexed file
+        self._files = {}
+        self._lock = threading.Lock()
+        # The running refresh, if any
+        self._refreshing = None
+        self._refreshed = -math.inf
+
+    @property
+    def built(self):
+        """Whether the index was refreshed at least once."""
+        return self._refreshed != -math.inf
+
+    def complete(self, prefix, limit=10):
+        with self._lock:
+            return self.trie.complete(prefix, limit)
+
+    def schedule_refresh(self, executor, max_age=10):
+        """Refreshes the index in the background if it is older than max_age seconds.
+
+        The index keeps answering queries, with the previous symbols, meanwhile.
+        Returns the future of the running refresh, or None if the index is
+        recent enough.
+        """
+        with self._lock:
+            if self._refreshing is not None:
+                return self._refreshing
+            if time.monotonic() - self._refreshed < max_age:
+                return None
+
+            def run():
+                try:
+                    self.refresh()
+                finally:
+                    self._refreshed = time.monotonic()
+                    self._refreshing = None
+
+            self._refreshing = executor.submit(run)
+            return self._refreshing
+
+    def refresh(self):
+        """Updates the index with the files added, modified or deleted."""
+        seen = set()
+        for path, mtime in self._walk():
+            seen.add(path)
+            entry = self._files.get(path)
+            if entry is not None and entry[0] == mtime:
+                continue
+            try:
+                symbols = read_symbols(path)
+            except OSError:
+                continue
+            self._update(path, mtime, symbols)
+        for path in set(self._files) - seen:
+            self._update(path, None, Counter())
+
+    def _update(self, path, mtime, symbols):
+        old_symbols = self._files[path][1] if path in self._files else Counter()
+        with self._lock:
+            for symbol in old_symbols.keys() | symbols.keys():
+                delta = symbols[symbol] - old_symbols[symbol]
+                if delta:
+                    self.trie.add(symbol, delta)
+        if mtime is None:
+            del self._files[path]
+        else:
+            self._files[path] = (mtime, symbols)
+
+    def _walk(self):
+        for directory, directories, files in os.walk(self.root):
+            # Skip hidden and generated directories
+            directories[:] = [
+                name
+                for name in directories
+                if not name.startswith(".") and name not in IGNORED_DIRECTORIES
+            ]
+            for name in files:
+                if os.path.splitext(name)[1].lower() not in SOURCE_EXTENSIONS:
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if stat.st_size <= MAX_FILE_SIZE:
+                    yield path, stat.st_mtime_ns
@@ -0,0 +1,170 @@
+"""Python unit tests for the request coalescing and admission control."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from jupyterlab_examples_server import handlers
+from jupyterlab_examples_server.admission import (
+    ConcurrencyLimiter,
+    SingleFlight,
+    TooManyRequests,
+)
+
+
+async def test_single_flight_shares_result():
+    # Given
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    # When
+    results = await asyncio.gather(*(flights.run("key", compute) for _ in range(5)))
+
+    # Then
+    assert results == [1] * 5
+    assert flights.shared == 4
+    # A later call starts a new computation
+    assert await flights.run("key", compute) == 2
+
+
+async def test_single_flight_shares_error():
+    # Given
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    # When
+    results = await asyncio.gather(
+        flights.run("key", fail), flights.run("key", fail), return_exceptions=True
+    )
+
+    # Then
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_limiter_queues_then_rejects():
+    # Given
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=1, retry_after=3)
+    await limiter.acquire()
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # When
+    with pytest.raises(TooManyRequests) as error:
+        await limiter.acquire()
+
+    # Then
+    assert error.value.status_code == 429
+    assert error.value.retry_after == 3
+    assert not waiting.done()
+    limiter.release()
+    await waiting
+    assert limiter.active == 1 and limiter.queued == 0
+    limiter.release()
+    assert limiter.active == 0
+
+
+async def test_limiter_forgets_cancelled_waiter():
+    # Given
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=1)
+    await limiter.acquire()
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # When
+    waiting.cancel()
+    await asyncio.sleep(0)
+
+    # Then
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.active == 0
+
+
+@pytest.fixture
+def hello_limit(monkeypatch):
+    # Must be requested before the server fixtures to be taken into account
+    monkeypatch.setenv("JLAB_SERVER_EXAMPLE_HELLO_CONCURRENCY", "1")
+    monkeypatch.setenv("JLAB_SERVER_EXAMPLE_HELLO_QUEUE", "1")
+
+
+@pytest.fixture
+def slow_greetings(monkeypatch):
+    calls = []
+
+    def greetings(name):
+        calls.append(name)
+        time.sleep(0.2)
+        return {"greetings": name}
+
+    monkeypatch.setattr(handlers, "greetings", greetings)
+    return calls
+
+
+async def test_post_hello_single_flight(slow_greetings, jp_fetch):
+    # When
+    responses = await asyncio.gather(
+        *(
+            jp_fetch(
+                "jupyterlab-examples-server",
+                "hello",
+                method="POST",
+                body=json.dumps({"name": "storm"}),
+            )
+            for _ in range(5)
+        )
+    )
+
+    # Then
+    assert [json.loads(r.body) for r in responses] == [{"greetings": "storm"}] * 5
+    assert slow_greetings == ["storm"]
+
+
+async def test_post_hello_too_many_requests(hello_limit, slow_greetings, jp_fetch):
+    # When
+    responses = await asyncio.gather(
+        *(
+            jp_fetch(
+                "jupyterlab-examples-server",
+                "hello",
+                method="POST",
+                body=json.dumps({"name": name}),
+                raise_error=False,
+            )
+            for name in ("a", "b", "c")
+        )
+    )
+
+    # Then
+    codes = sorted(response.code for response in responses)
+    assert codes == [200, 200, 429]
+    rejected = next(response for response in responses if response.code == 429)
+    assert rejected.headers["Retry-After"] == "1"
+
+
+async def test_batch_hello_shares_limiter(hello_limit, slow_greetings, jp_fetch):
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "batch",
+        method="POST",
+        body=json.dumps(
+            [
+                {"method": "POST", "path": "hello", "body": {"name": name}}
+                for name in ("a", "b", "c")
+            ]
+        ),
+    )
+
+    # Then
+    results = json.loads(response.body)
+    assert [result["status"] for result in results] == [200, 200, 429]
+    assert results[2]["body"]["retry_after"] == 1
@@ -0,0 +1,48 @@
+"""Python unit tests for the response cache."""
+import time
+
+from jupyterlab_examples_server.cache import ResponseCache
+
+
+def test_get_set():
+    cache = ResponseCache()
+
+    cache.set("a", b"value", 5)
+
+    assert cache.get("a") == b"value"
+    assert cache.get("b") is None
+    assert cache.size == 5
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_size=10)
+    cache.set("a", b"aaaa", 4)
+    cache.set("b", b"bbbb", 4)
+    # Use "a" so that "b" is the least recently used entry
+    cache.get("a")
+
+    cache.set("c", b"cccc", 4)
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+    assert cache.size == 8
+
+
+def test_skips_values_larger_than_the_cache():
+    cache = ResponseCache(max_size=4)
+
+    cache.set("a", b"aaaaa", 5)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_expires_entries():
+    cache = ResponseCache(ttl=0.01)
+    cache.set("a", b"aaaa", 4)
+
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.size == 0
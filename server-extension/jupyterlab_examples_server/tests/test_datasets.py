@@ -0,0 +1,179 @@
+"""Python unit tests for the dataset readers and endpoints."""
+import array
+import json
+import math
+import struct
+
+import pytest
+
+from jupyterlab_examples_server import datasets
+from jupyterlab_examples_server.datasets import TILE_MEDIA_TYPE, CsvReader, encode_tile
+
+# Struct format of the numeric types of the tiles
+FORMATS = {"int8": "b", "int16": "h", "int32": "i", "float32": "f", "float64": "d"}
+
+
+def test_csv_reader(csv_path, monkeypatch):
+    # Given small blocks to exercise the sparse index
+    monkeypatch.setattr(CsvReader, "BLOCK_SIZE", 100)
+
+    # When
+    reader = CsvReader(csv_path)
+
+    # Then
+    assert reader.columns == ["id", "name", "value"]
+    assert reader.row_count == 1000
+    assert reader.read(0, 2, 0, 3) == [["0", "1"], ["name, 0", "name, 1"], ["0.0", "0.5"]]
+    assert reader.read(500, 2, 1, 1) == [["name, 500", "name, 501"]]
+    assert reader.read(998, 10, 2, 10) == [["499.0", "499.5"]]
+    assert reader.read(1000, 10, 0, 3) == [[], [], []]
+
+
+def test_csv_reader_without_last_line_break(tmp_path):
+    # Given
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n3,4")
+
+    # When
+    reader = CsvReader(path)
+
+    # Then
+    assert reader.row_count == 2
+    assert reader.read(1, 1, 0, 2) == [["3"], ["4"]]
+
+
+async def test_get_dataset(csv_path, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "data.csv").write_bytes(csv_path.read_bytes())
+
+    # When
+    response = await jp_fetch("jupyterlab-examples-server", "dataset", params={"path": "data.csv"})
+
+    # Then
+    assert json.loads(response.body) == {"columns": ["id", "name", "value"], "rows": 1000}
+
+
+async def test_get_tile(csv_path, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "data.csv").write_bytes(csv_path.read_bytes())
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "dataset",
+        "tile",
+        params={"path": "data.csv", "row": 10, "rows": 2, "column": 1, "columns": 5},
+    )
+
+    # Then
+    assert json.loads(response.body) == {
+        "row": 10,
+        "column": 1,
+        "data": [["name, 10", "name, 11"], ["5.0", "5.5"]],
+    }
+
+
+@pytest.mark.parametrize(
+    "params, code",
+    [
+        ({"path": "../data.csv"}, 403),
+        ({"path": "missing.csv"}, 404),
+        ({"path": "data.txt"}, 400),
+        ({"path": "data.csv", "rows": 100000}, 400),
+    ],
+)
+async def test_get_invalid_tile(params, code, csv_path, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "data.csv").write_bytes(csv_path.read_bytes())
+    (jp_root_dir / "data.txt").write_text("Hello")
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "dataset", "tile", params=params, raise_error=False
+    )
+
+    # Then
+    assert response.code == code
+
+
+def decode_tile(body):
+    # Reference decoder of the binary tiles
+    (header_length,) = struct.unpack_from("<I", body)
+    header = json.loads(body[4:4 + header_length])
+    start = 4 + header_length
+    data = []
+    for column in header["columns"]:
+        buffer = body[start + column["offset"]:start + column["offset"] + column["length"]]
+        if column["type"] in FORMATS:
+            assert (start + column["offset"]) % 8 == 0
+            code = FORMATS[column["type"]]
+            values = struct.unpack(f"<{len(buffer) // struct.calcsize(code)}{code}", buffer)
+            scale = column.get("scale", 1)
+            data.append([value / scale for value in values])
+        else:
+            data.append(json.loads(buffer))
+    return header, data
+
+
+def test_encode_tile():
+    # Given
+    data = [array.array("d", [1.5, 2]), ["a", "bc"], array.array("d", [math.nan, 3])]
+
+    # When
+    header, decoded = decode_tile(encode_tile(10, 2, data))
+
+    # Then
+    assert (header["row"], header["column"]) == (10, 2)
+    assert [column["type"] for column in header["columns"]] == ["int8", "json", "float32"]
+    assert decoded[:2] == [[1.5, 2.0], ["a", "bc"]]
+    assert math.isnan(decoded[2][0]) and decoded[2][1] == 3.0
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_encode_tile_narrows_columns(vectorized, monkeypatch):
+    # Given
+    if not vectorized:
+        monkeypatch.setattr(datasets, "np", None)
+    data = [
+        array.array("d", range(1000)),
+        array.array("d", [-1.5, 2.25, 127]),
+        array.array("d", [12.34, -0.01, 99999.99]),
+        array.array("d", [0.1, math.nan]),
+        array.array("d", [1e300, 2**-60]),
+        array.array("d", [math.inf, 0.5]),
+    ]
+
+    # When
+    header, decoded = decode_tile(encode_tile(0, 0, data))
+
+    # Then
+    assert [(c["type"], c.get("scale", 1)) for c in header["columns"]] == [
+        ("int16", 1),
+        ("int16", 100),
+        ("int32", 100),
+        ("float64", 1),
+        ("float64", 1),
+        ("float32", 1),
+    ]
+    for values, result in zip(data, decoded):
+        assert [str(value) for value in result] == [str(value) for value in values]
+
+
+async def test_get_binary_tile(csv_path, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "data.csv").write_bytes(csv_path.read_bytes())
+    params = {"path": "data.csv", "row": 10, "rows": 2, "column": 0, "columns": 3}
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "dataset",
+        "tile",
+        params=params,
+        headers={"Accept": TILE_MEDIA_TYPE},
+    )
+
+    # Then
+    assert response.headers["Content-Type"] == TILE_MEDIA_TYPE
+    _, data = decode_tile(response.body)
+    assert data == [[10.0, 11.0], ["name, 10", "name, 11"], [5.0, 5.5]]
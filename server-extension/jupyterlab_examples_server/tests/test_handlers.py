@@ -1,4 +1,11 @@
+import asyncio
 import json
+import time
+
+import pytest
+from tornado.httpclient import HTTPClientError
+
+from jupyterlab_examples_server import handlers
 
 
 async def test_get_hello(jp_fetch):
@@ -10,4 +17,159 @@ async def test_get_hello(jp_fetch):
     payload = json.loads(response.body)
     assert payload == {
         "data": "This is /jupyterlab-examples-server/hello endpoint!"
-    }
\ No newline at end of file
+    }
+
+
+async def test_get_hello_not_modified(jp_fetch):
+    # Given
+    response = await jp_fetch("jupyterlab-examples-server", "hello")
+    etag = response.headers["Etag"]
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "hello", headers={"If-None-Match": etag}, raise_error=False
+    )
+
+    # Then
+    assert response.code == 304
+    assert response.body == b""
+
+
+async def test_get_hashed_static_asset(static_dir, jp_fetch):
+    # Given
+    (static_dir / "main.3f2a9c1b.js").write_text("console.log('hashed');")
+    (static_dir / "main.js").write_text("console.log('plain');")
+
+    # When
+    hashed = await jp_fetch("jupyterlab-examples-server", "public", "main.3f2a9c1b.js")
+    plain = await jp_fetch("jupyterlab-examples-server", "public", "main.js")
+
+    # Then
+    assert hashed.headers["Cache-Control"] == "max-age=31536000"
+    assert "Cache-Control" not in plain.headers
+
+
+async def test_post_hello(jp_fetch):
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "hello", method="POST", body=json.dumps({"name": "George"})
+    )
+
+    # Then
+    assert response.code == 200
+    payload = json.loads(response.body)
+    assert payload == {"greetings": "Hello George, enjoy JupyterLab!"}
+
+
+async def test_concurrent_hello_do_not_block(jp_fetch, monkeypatch):
+    # Given a slow computation behind the endpoint
+    def slow_greetings(name):
+        time.sleep(0.2)
+        return {"greetings": name}
+
+    monkeypatch.setattr(handlers, "greetings", slow_greetings)
+
+    # When
+    start = time.monotonic()
+    responses = await asyncio.gather(*(
+        jp_fetch("jupyterlab-examples-server", "hello", method="POST", body=json.dumps({"name": str(i)}))
+        for i in range(4)
+    ))
+    elapsed = time.monotonic() - start
+
+    # Then the requests ran in parallel in the thread pool
+    assert [json.loads(r.body)["greetings"] for r in responses] == ["0", "1", "2", "3"]
+    assert elapsed < 4 * 0.2
+
+
+async def test_batch(jp_fetch):
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "batch",
+        method="POST",
+        body=json.dumps([
+            {"method": "GET", "path": "hello"},
+            {"method": "POST", "path": "hello", "body": {"name": "George"}},
+            {"method": "POST", "path": "hello", "body": {}},
+            {"method": "POST", "path": "hello", "body": None},
+            [1],
+            {"method": 1, "path": "hello"},
+            {"method": "DELETE", "path": "hello"},
+        ]),
+    )
+
+    # Then
+    assert response.code == 200
+    payload = json.loads(response.body)
+    assert payload[:2] == [
+        {"status": 200, "body": {"data": "This is /jupyterlab-examples-server/hello endpoint!"}},
+        {"status": 200, "body": {"greetings": "Hello George, enjoy JupyterLab!"}},
+    ]
+    assert [result["status"] for result in payload[2:]] == [400, 400, 400, 400, 404]
+    assert payload[2]["body"] == {"message": "The body must be {name: string}."}
+
+
+async def test_batch_server_error(jp_fetch, monkeypatch):
+    # Given
+    def failing_greetings(name):
+        raise RuntimeError("Broken")
+
+    monkeypatch.setattr(handlers, "greetings", failing_greetings)
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "batch",
+        method="POST",
+        body=json.dumps([{"method": "POST", "path": "hello", "body": {"name": "Ada"}}]),
+    )
+
+    # Then
+    assert json.loads(response.body) == [{"status": 500, "body": {"message": "Broken"}}]
+
+
+async def test_batch_too_long(jp_fetch):
+    # When
+    with pytest.raises(HTTPClientError) as e:
+        await jp_fetch(
+            "jupyterlab-examples-server",
+            "batch",
+            method="POST",
+            body=json.dumps([{"method": "GET", "path": "hello"}] * 101),
+        )
+
+    # Then
+    assert e.value.code == 400
+
+
+async def test_stream(jp_fetch):
+    # Given
+    chunks = []
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "stream",
+        params={"count": 5000},
+        streaming_callback=chunks.append,
+    )
+
+    # Then
+    assert response.code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert len(chunks) > 1
+    records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert len(records) == 5000
+    assert records[-1] == {"index": 4999, "greetings": "Hello visitor 4999, enjoy JupyterLab!"}
+
+
+@pytest.mark.parametrize("count", ["many", "-1", "1000001"])
+async def test_stream_invalid_count(jp_fetch, count):
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "stream", params={"count": count}, raise_error=False
+    )
+
+    # Then
+    assert response.code == 400
@@ -0,0 +1,56 @@
+"""Python unit tests for the import cost of the package."""
+import os
+import subprocess
+import sys
+
+import jupyterlab_examples_server
+
+# Modules only needed once the server extension is loaded
+HEAVY_MODULES = ("tornado", "jupyter_server", "jupyterlab_examples_server.handlers")
+
+# Cumulative import time budget of the package, in microseconds
+IMPORT_BUDGET = 100_000
+
+
+def import_times(module):
+    """Returns the cumulative import time of each module imported by a module."""
+    package_dir = os.path.dirname(os.path.dirname(jupyterlab_examples_server.__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [package_dir] + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_is_cheap():
+    # When
+    times = import_times("jupyterlab_examples_server")
+
+    # Then
+    imported = [
+        name
+        for name in times
+        if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)
+    ]
+    assert imported == []
+    assert times["jupyterlab_examples_server"] < IMPORT_BUDGET
+
+
+def test_setup_handlers_is_importable():
+    from jupyterlab_examples_server import setup_handlers
+    from jupyterlab_examples_server.handlers import setup_handlers as expected
+
+    assert setup_handlers is expected
@@ -0,0 +1,120 @@
+"""Python unit tests for the sort and filter indexes."""
+import json
+
+import pytest
+
+from jupyterlab_examples_server import indexes
+from jupyterlab_examples_server.datasets import CsvReader
+from jupyterlab_examples_server.indexes import IndexStore, filter_rows, sort_rows
+
+
+def test_sorted_view(csv_path, tmp_path):
+    # Given
+    store = IndexStore(str(tmp_path / "indexes"))
+    reader = CsvReader(csv_path)
+
+    # When
+    rows = store.view(reader, str(csv_path), sort=2, descending=True)
+
+    # Then
+    assert rows.tolist()[:3] == [999, 998, 997]
+    assert reader.read_rows(rows[:2].tolist(), 1, 1) == [["name, 999", "name, 998"]]
+
+
+def test_filtered_view(csv_path, tmp_path):
+    # Given
+    store = IndexStore(str(tmp_path / "indexes"))
+    reader = CsvReader(csv_path)
+
+    # When
+    rows = store.view(
+        reader, str(csv_path), sort=1, filters=[(2, ">=", "450"), (1, "contains", "5")]
+    )
+
+    # Then
+    expected = [905, 915, 925, 935, 945, *range(950, 960), 965, 975, 985, 995]
+    assert rows.tolist() == expected
+
+
+def test_vectorized_indexes_match_fallback(tmp_path, monkeypatch):
+    # Given a numeric column with ties and missing values
+    pytest.importorskip("numpy")
+    path = tmp_path / "values.csv"
+    values = ["3", "", "1", "3", "nan", "2", "1", "", "5"]
+    path.write_text("value\n" + "\n".join(values) + "\n")
+    reader = CsvReader(path)
+
+    def build():
+        return (
+            [sort_rows(reader, 0, descending).tolist() for descending in (False, True)],
+            [filter_rows(reader, 0, op, "2").tolist() for op in indexes.OPERATORS],
+        )
+
+    # When
+    vectorized = build()
+    monkeypatch.setattr(indexes, "np", None)
+    fallback = build()
+
+    # Then
+    assert vectorized == fallback
+    assert vectorized[0][0][:5] == [2, 6, 5, 0, 3]
+
+
+def test_view_is_reused_across_restarts(csv_path, tmp_path, monkeypatch):
+    # Given
+    directory = str(tmp_path / "indexes")
+    rows = IndexStore(directory).view(CsvReader(csv_path), str(csv_path), sort=0)
+
+    def fail(*args):
+        raise AssertionError("The index is built again.")
+
+    monkeypatch.setattr("jupyterlab_examples_server.indexes.sort_rows", fail)
+
+    # When
+    restored = IndexStore(directory).view(CsvReader(csv_path), str(csv_path), sort=0)
+
+    # Then
+    assert restored.tolist() == rows.tolist()
+
+
+def test_indexes_of_previous_versions_are_removed(csv_path, tmp_path):
+    # Given
+    directory = tmp_path / "indexes"
+    other_path = tmp_path / "other.csv"
+    other_path.write_bytes(csv_path.read_bytes())
+    store = IndexStore(str(directory))
+    store.view(CsvReader(other_path), str(other_path), sort=0)
+    others = set(directory.iterdir())
+    store.view(CsvReader(csv_path), str(csv_path), sort=0)
+    store.view(CsvReader(csv_path), str(csv_path), sort=1)
+    before = set(directory.iterdir())
+
+    # When the dataset changes
+    with open(csv_path, "a") as f:
+        f.write('1000,"name, 1000",500\n')
+    rows = store.view(CsvReader(csv_path), str(csv_path), sort=0)
+
+    # Then only the indexes of the other dataset are kept
+    assert len(rows) == 1001
+    after = set(directory.iterdir())
+    assert after & before == others
+    assert len(after - before) == len(others)
+
+
+async def test_get_sorted_tile(csv_path, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "data.csv").write_bytes(csv_path.read_bytes())
+    params = {"path": "data.csv", "sort": 0, "order": "desc", "filter": "2:<:10"}
+
+    # When
+    info = await jp_fetch("jupyterlab-examples-server", "dataset", params=params)
+    tile = await jp_fetch(
+        "jupyterlab-examples-server",
+        "dataset",
+        "tile",
+        params={**params, "row": 1, "rows": 3, "columns": 1},
+    )
+
+    # Then
+    assert json.loads(info.body)["rows"] == 20
+    assert json.loads(tile.body)["data"] == [["18", "17", "16"]]
@@ -0,0 +1,132 @@
+"""Python unit tests for the log service."""
+import asyncio
+import json
+
+import pytest
+
+from jupyterlab_examples_server.logs import LogRing, LogService
+
+
+def test_ring_keeps_the_latest_entries():
+    # Given
+    ring = LogRing(3)
+
+    # When
+    for index in range(5):
+        ring.append("info", index)
+
+    # Then
+    assert ring.read() == ([(3, 2), (4, 3), (5, 4)], 5)
+    assert ring.read(after=0) == ([(3, 2), (4, 3), (5, 4)], 5)
+    assert ring.read(after=4) == ([(5, 4)], 5)
+    assert ring.read(after=5) == ([], 5)
+
+
+def test_ring_restarts_from_cursor_ahead():
+    # Given a cursor kept by a client before the server restarted
+    ring = LogRing(10)
+    ring.append("info", "a")
+    ring.append("info", "b")
+
+    # When
+    page = ring.read(after=500)
+
+    # Then
+    assert page == ([(1, "a"), (2, "b")], 2)
+    assert LogRing(10).read(after=500) == ([], 0)
+
+
+def test_ring_filters_levels():
+    # Given
+    ring = LogRing(10)
+    for index, level in enumerate(["debug", "error", "info", "critical", "debug"]):
+        ring.append(level, index)
+
+    # When
+    latest = ring.read(level="error", limit=1)
+    page = ring.read(after=0, level="info", limit=2)
+
+    # Then
+    assert latest == ([(4, 3)], 5)
+    assert page == ([(2, 1), (3, 2)], 3)
+
+
+async def test_post_and_get_logs(jp_fetch):
+    # Given
+    entries = [
+        {"level": "debug", "data": "Starting"},
+        {"level": "warning", "type": "html", "data": "<b>Slow</b>"},
+    ]
+
+    # When
+    await jp_fetch(
+        "jupyterlab-examples-server", "logs", "app", body=json.dumps(entries), method="POST"
+    )
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "logs", "app", params={"level": "info"}
+    )
+
+    # Then
+    body = json.loads(response.body)
+    assert body["cursor"] == 2
+    assert [(e["cursor"], e["type"], e["data"]) for e in body["entries"]] == [
+        (2, "html", "<b>Slow</b>")
+    ]
+
+
+async def test_get_logs_waits_for_entries(jp_serverapp, jp_fetch):
+    # Given
+    logs = jp_serverapp.web_app.settings["jupyterlab_examples_server"]["logs"]
+    request = asyncio.ensure_future(
+        jp_fetch(
+            "jupyterlab-examples-server",
+            "logs",
+            "app",
+            params={"after": 0, "timeout": 10},
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert not request.done()
+
+    # When
+    logs.log("app", "info", "Hello")
+
+    # Then
+    body = json.loads((await request).body)
+    assert [entry["data"] for entry in body["entries"]] == ["Hello"]
+
+
+async def test_get_logs_after_restart(jp_serverapp, jp_fetch):
+    # Given
+    logs = jp_serverapp.web_app.settings["jupyterlab_examples_server"]["logs"]
+    logs.log("app", "info", "Hello")
+
+    # When a client polls with the cursor of a previous server
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "logs",
+        "app",
+        params={"after": 500, "timeout": 10},
+        request_timeout=5,
+    )
+
+    # Then it is answered right away from the oldest entry
+    body = json.loads(response.body)
+    assert body["cursor"] == 1
+    assert [entry["data"] for entry in body["entries"]] == ["Hello"]
+
+
+async def test_reads_do_not_create_namespaces():
+    # Given
+    logs = LogService(max_namespaces=1)
+
+    # When
+    for index in range(3):
+        await logs.wait("unknown-{}".format(index), 0, 0.01)
+        assert logs.read("unknown-{}".format(index)) == ([], 0)
+
+    # Then
+    assert logs.log("app", "info", "Hello") == 1
+    assert not logs._events and not logs._waiters
+    with pytest.raises(ValueError):
+        logs.log("other", "info", "Hello")
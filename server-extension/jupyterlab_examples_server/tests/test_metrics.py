@@ -0,0 +1,47 @@
+"""Python unit tests for the request metrics."""
+from jupyterlab_examples_server.metrics import Histogram, Metrics
+
+
+def test_render_histogram():
+    # Given
+    metrics = Metrics()
+    metrics.latency[("RouteHandler", "GET")] = Histogram(buckets=(0.1, 1))
+
+    # When
+    for value in (0.05, 0.5, 0.7, 3):
+        metrics.latency[("RouteHandler", "GET")].observe(value)
+    text = metrics.render()
+
+    # Then
+    prefix = "jupyterlab_examples_server_request_duration_seconds"
+    labels = 'handler="RouteHandler",method="GET"'
+    assert f'{prefix}_bucket{{{labels},le="0.1"}} 1\n' in text
+    assert f'{prefix}_bucket{{{labels},le="1"}} 3\n' in text
+    assert f'{prefix}_bucket{{{labels},le="+Inf"}} 4\n' in text
+    assert f"{prefix}_sum{{{labels}}} 4.25\n" in text
+    assert f"{prefix}_count{{{labels}}} 4\n" in text
+
+
+async def test_get_metrics(jp_fetch):
+    # Given
+    hello = await jp_fetch("jupyterlab-examples-server", "hello")
+
+    # When
+    response = await jp_fetch("jupyterlab-examples-server", "metrics")
+
+    # Then
+    text = response.body.decode()
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'jupyterlab_examples_server_requests_total{handler="RouteHandler",'
+        'method="GET",code="200"} 1\n'
+    ) in text
+    # The metrics request itself is still in flight
+    assert (
+        'jupyterlab_examples_server_requests_in_flight{handler="MetricsHandler"} '
+        "1\n"
+    ) in text
+    assert (
+        'jupyterlab_examples_server_response_bytes_total{handler="RouteHandler"} '
+        f"{len(hello.body)}\n"
+    ) in text
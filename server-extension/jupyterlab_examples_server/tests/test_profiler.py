@@ -0,0 +1,110 @@
+"""Python unit tests for the profiler and the slow requests record."""
+import json
+import threading
+import time
+
+from jupyterlab_examples_server import handlers
+from jupyterlab_examples_server.profiler import Profiler, SlowRequests
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+async def test_profile_samples_other_threads():
+    # Given
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+    thread.start()
+
+    # When
+    try:
+        stacks = await Profiler().profile(0.2, 0.005)
+    finally:
+        stop.set()
+        thread.join()
+
+    # Then
+    busy = [stack for stack in stacks if stack.startswith("busy;")]
+    assert busy
+    assert all("test_profiler.py:busy_loop" in stack for stack in busy)
+    assert not any("profiler" in stack.split(";")[0] for stack in stacks)
+
+
+def test_slow_requests_capture_stacks():
+    # Given
+    slow_requests = SlowRequests(threshold=0.05, capacity=2)
+
+    # When
+    slow_requests.start(1, "GET /fast")
+    slow_requests.finish(1)
+    slow_requests.start(2, "GET /slow")
+    time.sleep(0.2)
+    slow_requests.finish(2)
+    slow_requests.stop()
+
+    # Then
+    records = slow_requests.records()
+    assert [record["request"] for record in records] == ["GET /slow"]
+    assert records[0]["duration"] >= 0.2
+    assert any("test_slow_requests_capture_stacks" in s for s in records[0]["stacks"])
+
+
+def test_slow_requests_without_threshold_does_not_spin():
+    # Given
+    slow_requests = SlowRequests(threshold=0)
+    start = time.process_time()
+
+    # When
+    time.sleep(0.3)
+    slow_requests.start(1, "GET /fast")
+    slow_requests.finish(1)
+    slow_requests.stop()
+
+    # Then every request is recorded, without the watchdog using a full CPU
+    assert time.process_time() - start < 0.1
+    assert [record["request"] for record in slow_requests.records()] == ["GET /fast"]
+
+
+async def test_get_profile(jp_fetch):
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "profile",
+        params={"duration": "1", "interval": "10"},
+    )
+
+    # Then
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-8"
+    lines = response.body.decode().splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("MainThread;") for line in lines)
+
+
+async def test_get_slow_requests(monkeypatch, jp_fetch):
+    # Given
+    def greetings(name):
+        time.sleep(1.5)
+        return {"greetings": name}
+
+    monkeypatch.setattr(handlers, "greetings", greetings)
+    await jp_fetch(
+        "jupyterlab-examples-server",
+        "hello",
+        method="POST",
+        body=json.dumps({"name": "slow"}),
+    )
+
+    # When
+    response = await jp_fetch("jupyterlab-examples-server", "slow-requests")
+
+    # Then
+    payload = json.loads(response.body)
+    assert payload["threshold"] == 1
+    [record] = payload["requests"]
+    assert record["request"].startswith("POST /")
+    assert record["request"].endswith("/jupyterlab-examples-server/hello")
+    # The greetings were computed in an executor thread when it was captured
+    assert any("test_profiler.py:greetings" in stack for stack in record["stacks"])
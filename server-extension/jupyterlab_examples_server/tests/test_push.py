@@ -0,0 +1,83 @@
+"""Python unit tests for the push channel."""
+import asyncio
+import json
+import struct
+
+from jupyterlab_examples_server.push import PushHandler, PushHub
+
+
+async def subscribe(jp_serverapp, jp_ws_fetch, topic):
+    hub = jp_serverapp.web_app.settings["jupyterlab_examples_server"]["push_hub"]
+    ws = await jp_ws_fetch("jupyterlab-examples-server", "ws")
+    ws.write_message(json.dumps({"action": "subscribe", "topic": topic}))
+    while hub.subscriber_count(topic) == 0:
+        await asyncio.sleep(0.01)
+    return hub, ws
+
+
+async def test_push_json(jp_serverapp, jp_ws_fetch, jp_fetch):
+    # Given
+    _, ws = await subscribe(jp_serverapp, jp_ws_fetch, "greetings")
+
+    # When
+    await jp_fetch(
+        "jupyterlab-examples-server", "hello", body=json.dumps({"name": "Ada"}), method="POST"
+    )
+
+    # Then
+    message = json.loads(await ws.read_message())
+    assert message == {
+        "topic": "greetings",
+        "data": {"greetings": "Hello Ada, enjoy JupyterLab!"},
+    }
+    ws.close()
+
+
+async def test_push_batched_greetings(jp_serverapp, jp_ws_fetch, jp_fetch):
+    # Given
+    _, ws = await subscribe(jp_serverapp, jp_ws_fetch, "greetings")
+
+    # When
+    await jp_fetch(
+        "jupyterlab-examples-server",
+        "batch",
+        body=json.dumps([{"method": "POST", "path": "hello", "body": {"name": "Ada"}}]),
+        method="POST",
+    )
+
+    # Then
+    message = json.loads(await ws.read_message())
+    assert message["data"] == {"greetings": "Hello Ada, enjoy JupyterLab!"}
+    ws.close()
+
+
+async def test_push_binary(jp_serverapp, jp_ws_fetch):
+    # Given
+    hub, ws = await subscribe(jp_serverapp, jp_ws_fetch, "ticks")
+
+    # When
+    hub.publish("ticks", b"\x01\x02")
+
+    # Then
+    message = await ws.read_message()
+    (length,) = struct.unpack_from("<H", message)
+    assert message[2:2 + length] == b"ticks"
+    assert message[2 + length:] == b"\x01\x02"
+    ws.close()
+
+
+def test_slow_client_queue_is_bounded():
+    # Given a client whose messages are not sent yet
+    client = PushHandler.__new__(PushHandler)
+    client.initialize(PushHub(), max_queued=3)
+
+    # When
+    client.enqueue(("prices", "a"), "a1")
+    for index in range(3):
+        client.enqueue(("log", None), f"log {index}")
+    client.enqueue(("prices", "b"), "b1")
+    client.enqueue(("prices", "b"), "b2")
+
+    # Then
+    assert [message for message, _ in client._queue.values()] == ["log 1", "log 2", "b2"]
+    assert client.dropped == 2
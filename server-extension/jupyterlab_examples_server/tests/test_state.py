@@ -0,0 +1,64 @@
+"""Python unit tests for the state database store."""
+import json
+
+import pytest
+from tornado.httpclient import HTTPClientError
+
+from jupyterlab_examples_server.state import StateStore
+
+
+def test_write_batch(tmp_path):
+    # Given
+    store = StateStore(str(tmp_path / "state" / "state.db"))
+    store.write(save={"a:1": '{"v":1}', "a:2": '{"v":2}', "b:1": '{"v":3}'})
+
+    # When
+    store.write(save={"a:2": '{"v":4}'}, remove=["a:1", "missing"])
+
+    # Then
+    assert store.read() == {"a:2": '{"v":4}', "b:1": '{"v":3}'}
+    assert store.read("b") == {"b:1": '{"v":3}'}
+    store.close()
+    # The values are persisted
+    assert StateStore(str(tmp_path / "state" / "state.db")).read() == {
+        "a:2": '{"v":4}',
+        "b:1": '{"v":3}',
+    }
+
+
+async def test_post_then_get_state(jp_fetch):
+    # Given
+    await jp_fetch(
+        "jupyterlab-examples-server",
+        "state",
+        method="POST",
+        body=json.dumps(
+            {"save": {"plugin:a": '{"v":{"option":"two"}}', "plugin:b": '{"v":1}'}}
+        ),
+    )
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "state",
+        method="POST",
+        body=json.dumps({"remove": ["plugin:b"]}),
+    )
+    assert json.loads(response.body) == {"saved": 0, "removed": 1}
+
+    # When
+    response = await jp_fetch("jupyterlab-examples-server", "state")
+
+    # Then
+    assert json.loads(response.body) == {
+        "values": {"plugin:a": '{"v":{"option":"two"}}'}
+    }
+
+
+async def test_post_state_invalid(jp_fetch):
+    with pytest.raises(HTTPClientError) as error:
+        await jp_fetch(
+            "jupyterlab-examples-server",
+            "state",
+            method="POST",
+            body=json.dumps({"save": {"plugin:a": {"option": "two"}}}),
+        )
+    assert error.value.code == 400
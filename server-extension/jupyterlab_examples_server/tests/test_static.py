@@ -0,0 +1,106 @@
+"""Python unit tests for the static files handler."""
+import asyncio
+import gzip
+import os
+
+from jupyterlab_examples_server import static
+
+
+async def wait_for(path):
+    for _ in range(50):
+        if os.path.exists(path):
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError(path)
+
+
+async def test_serve_gzip_sibling(static_dir, jp_fetch):
+    # Given
+    (static_dir / "doc.html").write_text("<p>Hello</p>" * 1000)
+    static.precompress(static_dir)
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "public",
+        "doc.html",
+        headers={"Accept-Encoding": "gzip"},
+        decompress_response=False,
+    )
+
+    # Then
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Content-Type"] == "text/html"
+    assert gzip.decompress(response.body) == b"<p>Hello</p>" * 1000
+
+
+async def test_build_gzip_sibling_on_first_hit(static_dir, jp_fetch):
+    # Given
+    (static_dir / "late.html").write_text("<p>Hello</p>" * 1000)
+
+    # When
+    first = await jp_fetch(
+        "jupyterlab-examples-server",
+        "public",
+        "late.html",
+        headers={"Accept-Encoding": "gzip"},
+        decompress_response=False,
+    )
+
+    # Then
+    assert "Content-Encoding" not in first.headers
+    await wait_for(static_dir / "late.html.gz")
+
+
+async def test_serve_uncompressed(static_dir, jp_fetch):
+    # Given
+    (static_dir / "doc.html").write_text("<p>Hello</p>" * 1000)
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "public", "doc.html", decompress_response=False
+    )
+
+    # Then
+    assert "Content-Encoding" not in response.headers
+    assert response.body == b"<p>Hello</p>" * 1000
+
+
+async def test_serve_compressed_file_as_is(static_dir, jp_fetch):
+    # Given
+    (static_dir / "main.js").write_text("console.log('Hello');" * 1000)
+    static.precompress(static_dir)
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server",
+        "public",
+        "main.js.gz",
+        headers={"Accept-Encoding": "gzip"},
+        decompress_response=False,
+    )
+
+    # Then
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Type"] == "application/gzip"
+    assert response.body == (static_dir / "main.js.gz").read_bytes()
+
+
+async def test_serve_large_file(static_dir, jp_fetch):
+    # Given
+    content = os.urandom(static.MMAP_THRESHOLD * 2 + 10)
+    (static_dir / "data.bin").write_bytes(content)
+
+    # When
+    response = await jp_fetch("jupyterlab-examples-server", "public", "data.bin")
+    partial = await jp_fetch(
+        "jupyterlab-examples-server",
+        "public",
+        "data.bin",
+        headers={"Range": "bytes=100-1999999"},
+    )
+
+    # Then
+    assert response.body == content
+    assert partial.code == 206
+    assert partial.body == content[100:2000000]
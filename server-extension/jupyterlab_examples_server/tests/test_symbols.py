@@ -0,0 +1,135 @@
+"""Python unit tests for the symbol index."""
+import json
+import os
+import time
+
+from jupyterlab_examples_server import symbols
+from jupyterlab_examples_server.symbols import SymbolIndex, SymbolTrie
+
+
+def test_trie_ranks_by_count():
+    # Given
+    trie = SymbolTrie()
+    trie.add("read_csv", 3)
+    trie.add("read_json", 5)
+    trie.add("readme", 1)
+    trie.add("write_csv", 10)
+
+    # When
+    matches = trie.complete("read", limit=2)
+
+    # Then
+    assert matches == [("read_json", 5), ("read_csv", 3)]
+
+
+def test_trie_updates_cached_results():
+    # Given
+    trie = SymbolTrie()
+    trie.add("read_csv", 3)
+    trie.add("read_json", 5)
+    assert trie.complete("re")[0] == ("read_json", 5)
+
+    # When
+    trie.add("read_json", -5)
+    trie.add("read_csv", 1)
+
+    # Then
+    assert trie.complete("re") == [("read_csv", 4)]
+
+
+def test_trie_removes_empty_nodes():
+    # Given
+    trie = SymbolTrie()
+    trie.add("read_csv", 3)
+    trie.add("read_json", 5)
+    trie.complete("r")
+
+    # When
+    trie.add("read_json", -5)
+    trie.add("unknown", -1)
+
+    # Then only the nodes of read_csv are left
+    node = trie._root
+    for character in "read_":
+        assert list(node.children) == [character]
+        node = node.children[character]
+    assert list(node.children) == ["c"]
+    trie.add("read_csv", -3)
+    assert trie._root.children == {}
+    assert trie.complete("") == []
+
+
+def test_trie_long_symbol():
+    # Given
+    trie = SymbolTrie()
+    trie.add("a" * 10_000, 1)
+    trie.add("ab", 2)
+
+    # When
+    matches = trie.complete("a")
+
+    # Then
+    assert matches == [("ab", 2), ("a" * 10_000, 1)]
+
+
+def test_index_refresh_is_incremental(tmp_path, monkeypatch):
+    # Given
+    (tmp_path / "a.py").write_text("import pandas\npandas.read_csv(path)\n")
+    (tmp_path / "b.py").write_text("def read_table(path): pass\n")
+    (tmp_path / "data.bin").write_text("read_binary")
+    index = SymbolIndex(str(tmp_path))
+    index.refresh()
+    assert index.complete("read") == [("read_csv", 1), ("read_table", 1)]
+
+    # When a file is modified and another deleted
+    read = []
+    original = symbols.read_symbols
+
+    def read_symbols(path):
+        read.append(path)
+        return original(path)
+
+    monkeypatch.setattr(symbols, "read_symbols", read_symbols)
+    (tmp_path / "a.py").write_text("read_csv(read_csv(path))\n")
+    mtime = time.time() + 10
+    os.utime(tmp_path / "a.py", (mtime, mtime))
+    (tmp_path / "b.py").unlink()
+    index.refresh()
+
+    # Then only the modified file is read again
+    assert read == [str(tmp_path / "a.py")]
+    assert index.complete("read") == [("read_csv", 2)]
+    assert index.complete("pan") == []
+
+
+async def test_complete(jp_serverapp, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "script.py").write_text("values = compute(value)\nvalues.sort()\n")
+    settings = jp_serverapp.web_app.settings["jupyterlab_examples_server"]
+    settings["symbols"].refresh()
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "complete", params={"prefix": "val"}
+    )
+
+    # Then
+    assert json.loads(response.body) == {
+        "matches": [{"label": "values", "count": 2}, {"label": "value", "count": 1}]
+    }
+
+
+async def test_complete_builds_index_on_first_request(jp_serverapp, jp_root_dir, jp_fetch):
+    # Given
+    (jp_root_dir / "script.py").write_text("values = compute(value)\n")
+    settings = jp_serverapp.web_app.settings["jupyterlab_examples_server"]
+    assert not settings["symbols"].built
+
+    # When
+    response = await jp_fetch(
+        "jupyterlab-examples-server", "complete", params={"prefix": "comp"}
+    )
+
+    # Then
+    assert settings["symbols"].built
+    assert json.loads(response.body) == {"matches": [{"label": "compute", "count": 1}]}
@@ -44,3 +44,287 @@ export async function requestAPI<T>(
 
   return data;
 }
+
+/**
+ * Call a streaming API end point of the extension
+ *
+ * The response body is read as newline-delimited JSON and each record
+ * is yielded as soon as its line is received.
+ *
+ * @param endPoint API REST end point for the extension
+ * @param init Initial values for the request
+ * @returns An async iterator over the records
+ */
+export async function* requestStreamAPI<T>(
+  endPoint = '',
+  init: RequestInit = {}
+): AsyncGenerator<T> {
+  // Make request to Jupyter API
+  const settings = ServerConnection.makeSettings();
+  const requestUrl = URLExt.join(
+    settings.baseUrl,
+    'jupyterlab-examples-server', // API Namespace
+    endPoint
+  );
+
+  let response: Response;
+  try {
+    response = await ServerConnection.makeRequest(requestUrl, init, settings);
+  } catch (error) {
+    throw new ServerConnection.NetworkError(error as any);
+  }
+
+  if (!response.ok || !response.body) {
+    let data: any = await response.text();
+    try {
+      data = JSON.parse(data);
+    } catch (error) {
+      console.log('Not a JSON response body.', response);
+    }
+    throw new ServerConnection.ResponseError(response, data.message || data);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  try {
+    let chunk = await reader.read();
+    while (!chunk.done) {
+      buffer += decoder.decode(chunk.value, { stream: true });
+      const lines = buffer.split('\n');
+      // The last line may be incomplete
+      buffer = lines.pop() ?? '';
+      for (const line of lines) {
+        if (line) {
+          yield JSON.parse(line);
+        }
+      }
+      chunk = await reader.read();
+    }
+    buffer += decoder.decode();
+    if (buffer) {
+      yield JSON.parse(buffer);
+    }
+  } finally {
+    // Stop the download if the consumer stops iterating early
+    await reader.cancel();
+  }
+}
+
+/**
+ * Call the API extension, grouping the calls made in the same tick
+ * into a single request to the batch end point.
+ *
+ * @param endPoint API REST end point for the extension
+ * @param init Initial values for the request
+ * @returns The response body interpreted as JSON
+ */
+export function requestBatchedAPI<T>(
+  endPoint = '',
+  init: RequestInit = {}
+): Promise<T> {
+  return new Promise<T>((resolve, reject) => {
+    Private.queue.push({
+      request: {
+        method: init.method ?? 'GET',
+        path: endPoint,
+        body: init.body ? JSON.parse(init.body as string) : undefined
+      },
+      resolve,
+      reject
+    });
+    if (Private.queue.length === 1) {
+      setTimeout(Private.flush, 0);
+    }
+  });
+}
+
+/**
+ * A sub-request of the batch end point
+ */
+export interface IBatchRequest {
+  method: string;
+  path: string;
+  body?: any;
+}
+
+/**
+ * The result of a sub-request of the batch end point
+ */
+export interface IBatchResult {
+  status: number;
+  body: any;
+}
+
+/**
+ * A listener of the messages pushed on a topic
+ *
+ * JSON messages are received as their data, binary ones as an ArrayBuffer.
+ */
+export type PushListener = (data: any) => void;
+
+/**
+ * A WebSocket connection to the push channel of the extension
+ *
+ * A single connection is shared by all the subscriptions; it is reopened,
+ * with the topics subscribed again, if it closes unexpectedly.
+ */
+export class PushChannel {
+  /**
+   * Subscribe to a topic.
+   *
+   * @param topic Topic of the messages
+   * @param listener Called with each message published on the topic
+   * @returns A function to unsubscribe
+   */
+  subscribe(topic: string, listener: PushListener): () => void {
+    if (!this._listeners.has(topic)) {
+      this._listeners.set(topic, new Set<PushListener>());
+      this._send({ action: 'subscribe', topic });
+    }
+    const listeners = this._listeners.get(topic) as Set<PushListener>;
+    listeners.add(listener);
+    this._connect();
+
+    return () => {
+      listeners.delete(listener);
+      if (listeners.size === 0 && this._listeners.get(topic) === listeners) {
+        this._listeners.delete(topic);
+        this._send({ action: 'unsubscribe', topic });
+      }
+    };
+  }
+
+  /**
+   * Close the connection and drop all the subscriptions.
+   */
+  dispose(): void {
+    this._listeners.clear();
+    window.clearTimeout(this._reconnectTimer);
+    const socket = this._socket;
+    this._socket = null;
+    socket?.close();
+  }
+
+  private _connect(): void {
+    if (this._socket) {
+      return;
+    }
+    const settings = ServerConnection.makeSettings();
+    const url = URLExt.join(settings.wsUrl, 'jupyterlab-examples-server', 'ws');
+    const socket = new settings.WebSocket(url);
+    socket.binaryType = 'arraybuffer';
+    this._socket = socket;
+
+    socket.onopen = () => {
+      this._attempts = 0;
+      for (const topic of this._listeners.keys()) {
+        this._send({ action: 'subscribe', topic });
+      }
+    };
+    socket.onmessage = event => {
+      if (typeof event.data === 'string') {
+        const { topic, data } = JSON.parse(event.data);
+        this._dispatch(topic, data);
+      } else {
+        // Topic length, topic, then payload
+        const buffer = event.data as ArrayBuffer;
+        const length = new DataView(buffer).getUint16(0, true);
+        const topic = new TextDecoder().decode(
+          new Uint8Array(buffer, 2, length)
+        );
+        this._dispatch(topic, buffer.slice(2 + length));
+      }
+    };
+    socket.onclose = () => {
+      if (this._socket !== socket) {
+        // Closed by dispose
+        return;
+      }
+      this._socket = null;
+      if (this._listeners.size > 0) {
+        // Reconnect with an exponential backoff, up to 30 seconds
+        const delay = Math.min(30000, 1000 * 2 ** this._attempts++);
+        this._reconnectTimer = window.setTimeout(() => this._connect(), delay);
+      }
+    };
+  }
+
+  private _dispatch(topic: string, data: any): void {
+    this._listeners.get(topic)?.forEach(listener => {
+      try {
+        listener(data);
+      } catch (error) {
+        console.error(`Error in a listener of the topic ${topic}`, error);
+      }
+    });
+  }
+
+  private _send(message: { action: string; topic: string }): void {
+    // Messages sent before the connection opens are replaced by onopen
+    if (this._socket?.readyState === WebSocket.OPEN) {
+      this._socket.send(JSON.stringify(message));
+    }
+  }
+
+  private _listeners = new Map<string, Set<PushListener>>();
+  private _socket: WebSocket | null = null;
+  private _attempts = 0;
+  private _reconnectTimer = 0;
+}
+
+namespace Private {
+  /**
+   * A pending batched call
+   */
+  export interface IPendingCall {
+    request: IBatchRequest;
+    resolve: (value: any) => void;
+    reject: (reason: any) => void;
+  }
+
+  /**
+   * Calls waiting for the next batch request
+   */
+  export let queue: IPendingCall[] = [];
+
+  /**
+   * Maximal number of sub-requests accepted by the batch end point
+   */
+  export const MAX_BATCH_SIZE = 100;
+
+  /**
+   * Send the pending calls in a single request to the batch end point.
+   */
+  export async function flush(): Promise<void> {
+    const calls = queue.slice(0, MAX_BATCH_SIZE);
+    queue = queue.slice(MAX_BATCH_SIZE);
+    if (queue.length > 0) {
+      // The remaining calls go in the next batches
+      setTimeout(flush, 0);
+    }
+
+    let results: IBatchResult[];
+    try {
+      results = await requestAPI<IBatchResult[]>('batch', {
+        body: JSON.stringify(calls.map(call => call.request)),
+        method: 'POST'
+      });
+    } catch (error) {
+      calls.forEach(call => call.reject(error));
+      return;
+    }
+
+    calls.forEach((call, index) => {
+      const { status, body } = results[index];
+      if (status < 400) {
+        call.resolve(body);
+      } else {
+        const response = new Response(JSON.stringify(body), { status });
+        call.reject(
+          new ServerConnection.ResponseError(response, body.message || body)
+        );
+      }
+    });
+  }
+}
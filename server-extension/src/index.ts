@@ -9,7 +9,7 @@ import { PageConfig } from '@jupyterlab/coreutils';
 
 import { ILauncher } from '@jupyterlab/launcher';
 
-import { requestAPI } from './handler';
+import { PushChannel, requestAPI } from './handler';
 
 /**
  * The command IDs used by the server extension plugin.
@@ -64,6 +64,12 @@ const plugin: JupyterFrontEndPlugin<void> = {
         );
       });
 
+    // Receive the greetings sent to the server by any client
+    const channel = new PushChannel();
+    channel.subscribe('greetings', data => {
+      console.log('Greetings pushed by the server', data);
+    });
+
     const { commands, shell } = app;
     const command = CommandIDs.get;
     const category = 'Extension Examples';
@@ -2,12 +2,15 @@ import {
   JupyterFrontEnd,
   JupyterFrontEndPlugin
 } from '@jupyterlab/application';
-import { InputDialog } from '@jupyterlab/apputils';
-import { IStateDB } from '@jupyterlab/statedb';
+import { ICommandPalette, InputDialog } from '@jupyterlab/apputils';
+import { IStateDB, StateDB } from '@jupyterlab/statedb';
 import { ReadonlyJSONObject } from '@lumino/coreutils';
+import { ServerStateConnector } from './serverstate';
 
 const PLUGIN_ID = '@jupyterlab-examples/state:state-example';
 
+const SERVER_PLUGIN_ID = '@jupyterlab-examples/state:server-state';
+
 /**
  * Initialization data for the state extension.
  */
@@ -55,4 +58,45 @@ const extension: JupyterFrontEndPlugin<void> = {
   }
 };
 
-export default extension;
+/**
+ * Persist an option in a state database stored by the server extension.
+ *
+ * It requires the `server-extension` example to be installed.
+ */
+const serverStateExtension: JupyterFrontEndPlugin<void> = {
+  id: SERVER_PLUGIN_ID,
+  description:
+    'Persist an option in a state database stored by the server extension.',
+  autoStart: true,
+  optional: [ICommandPalette],
+  activate: (app: JupyterFrontEnd, palette: ICommandPalette | null) => {
+    const options = ['one', 'two', 'three'];
+    // The values are loaded in a single request and the changes are sent in
+    // batches
+    const state: IStateDB = new StateDB({
+      connector: new ServerStateConnector()
+    });
+
+    const command = 'jlab-examples/state:pick-server-option';
+    app.commands.addCommand(command, {
+      label: 'Pick an Option Stored on the Server',
+      execute: async () => {
+        const value = await state.fetch(SERVER_PLUGIN_ID);
+        const option = value
+          ? ((value as ReadonlyJSONObject)['option'] as string)
+          : options[0];
+        const result = await InputDialog.getItem({
+          title: 'Pick an option to persist on the server',
+          items: options,
+          current: Math.max(0, options.indexOf(option))
+        });
+        if (result.button.accept) {
+          await state.save(SERVER_PLUGIN_ID, { option: result.value || '' });
+        }
+      }
+    });
+    palette?.addItem({ command, category: 'Extension Examples' });
+  }
+};
+
+export default [extension, serverStateExtension];
@@ -0,0 +1,198 @@
+import { URLExt } from '@jupyterlab/coreutils';
+import { ServerConnection } from '@jupyterlab/services';
+import { DataConnector } from '@jupyterlab/statedb';
+
+/**
+ * A state database connector storing the values in the server extension.
+ *
+ * All the values are loaded with a single request on the first read, then
+ * read from memory. Changes are applied in memory right away and sent to the
+ * server in batches: a write-behind buffer keeps the latest value of each id
+ * until it is flushed, `flushDelay` milliseconds after the first change.
+ *
+ * Pass it to a `StateDB` to get an `IStateDB`:
+ *
+ * ```ts
+ * const state = new StateDB({ connector: new ServerStateConnector() });
+ * ```
+ */
+export class ServerStateConnector extends DataConnector<string> {
+  /**
+   * Construct a new server state connector.
+   *
+   * @param options The connector options.
+   */
+  constructor(options: ServerStateConnector.IOptions = {}) {
+    super();
+    this._flushDelay = options.flushDelay ?? 1000;
+    // Send the pending changes before the page is closed
+    window.addEventListener('pagehide', this._onPageHide);
+  }
+
+  /**
+   * Retrieve a saved value.
+   */
+  async fetch(id: string): Promise<string | undefined> {
+    const values = await this._preload();
+    return values.get(id);
+  }
+
+  /**
+   * Retrieve the values of a namespace.
+   */
+  async list(namespace = ''): Promise<{ ids: string[]; values: string[] }> {
+    const values = await this._preload();
+    const ids: string[] = [];
+    const result: string[] = [];
+    values.forEach((value, id) => {
+      if (namespace === '' || id.split(':')[0] === namespace) {
+        ids.push(id);
+        result.push(value);
+      }
+    });
+    return { ids, values: result };
+  }
+
+  /**
+   * Remove a value.
+   */
+  async remove(id: string): Promise<void> {
+    const values = await this._preload();
+    values.delete(id);
+    this._pending.set(id, null);
+    this._scheduleFlush();
+  }
+
+  /**
+   * Save a value.
+   */
+  async save(id: string, value: string): Promise<void> {
+    const values = await this._preload();
+    values.set(id, value);
+    this._pending.set(id, value);
+    this._scheduleFlush();
+  }
+
+  /**
+   * Send the pending changes to the server in a single request.
+   */
+  async flush(keepalive = false): Promise<void> {
+    if (this._timer !== null) {
+      clearTimeout(this._timer);
+      this._timer = null;
+    }
+    if (this._pending.size === 0) {
+      return;
+    }
+    const sent = this._pending;
+    this._pending = new Map();
+    const save: Record<string, string> = {};
+    const remove: string[] = [];
+    sent.forEach((value, id) => {
+      if (value === null) {
+        remove.push(id);
+      } else {
+        save[id] = value;
+      }
+    });
+    try {
+      await Private.request({
+        method: 'POST',
+        body: JSON.stringify({ save, remove }),
+        // Let the request complete after the page is closed
+        keepalive
+      });
+    } catch (reason) {
+      console.error('Failed to save the state on the server.', reason);
+      // Send the changes again later, unless they were changed meanwhile
+      sent.forEach((value, id) => {
+        if (!this._pending.has(id)) {
+          this._pending.set(id, value);
+        }
+      });
+      this._scheduleFlush();
+    }
+  }
+
+  private _preload(): Promise<Map<string, string>> {
+    if (!this._values) {
+      this._values = Private.request({ method: 'GET' })
+        .then((data: Private.IValues) => new Map(Object.entries(data.values)))
+        .catch(reason => {
+          console.error('Failed to load the state from the server.', reason);
+          return new Map<string, string>();
+        });
+    }
+    return this._values;
+  }
+
+  private _scheduleFlush(): void {
+    if (this._timer === null) {
+      this._timer = setTimeout(() => {
+        void this.flush();
+      }, this._flushDelay);
+    }
+  }
+
+  private _onPageHide = (): void => {
+    void this.flush(true);
+  };
+
+  private _flushDelay: number;
+  private _pending = new Map<string, string | null>();
+  private _timer: ReturnType<typeof setTimeout> | null = null;
+  private _values: Promise<Map<string, string>> | null = null;
+}
+
+/**
+ * A namespace for ServerStateConnector statics.
+ */
+export namespace ServerStateConnector {
+  /**
+   * The options used to create a server state connector.
+   */
+  export interface IOptions {
+    /**
+     * Delay between the first change and the request sending the changes,
+     * in milliseconds.
+     */
+    flushDelay?: number;
+  }
+}
+
+/**
+ * A namespace for private data.
+ */
+namespace Private {
+  /**
+   * The values returned by the state end point.
+   */
+  export interface IValues {
+    values: Record<string, string>;
+  }
+
+  /**
+   * Call the state end point of the server extension.
+   */
+  export async function request(init: RequestInit): Promise<any> {
+    const settings = ServerConnection.makeSettings();
+    const requestUrl = URLExt.join(
+      settings.baseUrl,
+      'jupyterlab-examples-server',
+      'state'
+    );
+
+    let response: Response;
+    try {
+      response = await ServerConnection.makeRequest(requestUrl, init, settings);
+    } catch (error) {
+      throw new ServerConnection.NetworkError(error as any);
+    }
+
+    const data = await response.json();
+    if (!response.ok) {
+      throw new ServerConnection.ResponseError(response, data.message);
+    }
+    return data;
+  }
+}